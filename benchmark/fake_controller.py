@@ -0,0 +1,208 @@
+import asyncio
+import random
+import xml.etree.ElementTree as ElemTree
+from typing import Final
+from urllib.parse import urlsplit, parse_qs
+
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
+
+# a local stand-in for the aiohttp.ClientSession, that emulates the http interface of a waterkotte
+# controller (Ecotouch: /cgi/login, /cgi/logout, /cgi/readTags & /cgi/writeTags - Easycon: /config/xml.cgi
+# & /config/query.cgi) - so the read/write code of the pywaterkotte_ha can be measured without a heatpump
+
+OPT_CODE: Final = "192"
+
+
+class FakeStreamReader:
+    """the (minimal) aiohttp.StreamReader interface"""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    async def iter_chunked(self, n: int):
+        for idx in range(0, len(self._data), n):
+            yield self._data[idx:idx + n]
+
+    async def read(self) -> bytes:
+        return self._data
+
+
+class FakeResponse:
+    def __init__(self, url: str, content: str, status: int = 200, cookies=None):
+        self.url = url
+        self.status = status
+        self.cookies = cookies
+        self.content = FakeStreamReader(content.encode("utf-8"))
+        self._content = content
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise Exception(f"HTTP {self.status} {self.url}")
+
+    async def text(self) -> str:
+        return self._content
+
+    async def read(self) -> bytes:
+        return self._content.encode("utf-8")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeWaterkotteSession:
+    """emulates the web_session that will be passed to the WaterkotteClient"""
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, too_many_users_rate: float = 0.0,
+                 max_sessions: int = None, change_rate: float = 0.05, seed: int = 4711):
+        # latency & jitter in seconds
+        self.latency = latency
+        self.jitter = jitter
+        # probability that a request will be answered with '#E_TOO_MANY_USERS'
+        self.too_many_users_rate = too_many_users_rate
+        # number of requests the controller can handle at the same time (all others will get E_TOO_MANY_USERS)
+        self.max_sessions = max_sessions
+        # fraction of the values that will be changed between two readTags requests of the same tag
+        self.change_rate = change_rate
+        self._random = random.Random(seed)
+
+        # the registers of all WKHPTags (iterating the WKHPTag includes the lazy created schedule tags)
+        self.values = {}
+        for a_wkhp_tag in WKHPTag:
+            for a_raw_tag in a_wkhp_tag.tags:
+                if a_raw_tag not in self.values:
+                    self.values[a_raw_tag] = self._random_value(a_raw_tag)
+
+        self.closed = False
+        self.in_flight = 0
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.requests = 0
+        self.requests_per_path = {}
+        self.too_many_users_responses = 0
+        self.max_in_flight = 0
+
+    def _random_value(self, raw_tag: str) -> str:
+        if raw_tag[0] == "D":
+            return str(self._random.randint(0, 1))
+        elif raw_tag[0] == "A":
+            return str(self._random.randint(-200, 900))
+        else:
+            # also valid for the hh:mm & date fields
+            return str(self._random.randint(1, 12))
+
+    def _get_value(self, raw_tag: str) -> str:
+        if self.change_rate > 0 and self._random.random() < self.change_rate:
+            self.values[raw_tag] = self._random_value(raw_tag)
+        return self.values[raw_tag]
+
+    def get(self, url: str, params=None, **kwargs):
+        return _FakeRequestContext(self, url, params)
+
+    async def close(self):
+        self.closed = True
+
+    async def handle(self, url: str, params) -> FakeResponse:
+        split_url = urlsplit(url)
+        path = split_url.path
+        self.requests += 1
+        self.requests_per_path[path] = self.requests_per_path.get(path, 0) + 1
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.latency
+            if self.jitter > 0:
+                delay = delay + self._random.uniform(0, self.jitter)
+            await asyncio.sleep(delay)
+
+            if path.startswith("/cgi/") and path != "/cgi/logout":
+                overloaded = self.max_sessions is not None and self.in_flight > self.max_sessions
+                if overloaded or (self.too_many_users_rate > 0 and self._random.random() < self.too_many_users_rate):
+                    self.too_many_users_responses += 1
+                    return FakeResponse(url, "#E_TOO_MANY_USERS\n")
+
+            if path == "/cgi/login":
+                return FakeResponse(url, "#S_OK\nIDALToken=fake\n", cookies={"IDALToken": "fake"})
+            elif path == "/cgi/logout":
+                return FakeResponse(url, "#S_OK\n")
+            elif path == "/cgi/readTags":
+                return FakeResponse(url, self._read_tags(self._args(split_url, params)))
+            elif path == "/cgi/writeTags":
+                return FakeResponse(url, self._write_tags(self._args(split_url, params)))
+            elif path == "/config/xml.cgi":
+                return FakeResponse(url, self._easycon_xml(split_url.query))
+            elif path == "/config/query.cgi":
+                return FakeResponse(url, self._easycon_query(split_url.query))
+            return FakeResponse(url, "", status=404)
+        finally:
+            self.in_flight -= 1
+
+    @staticmethod
+    def _args(split_url, params) -> dict:
+        args = {key: value[0] for key, value in parse_qs(split_url.query).items()}
+        if isinstance(params, dict):
+            args.update({key: str(value) for key, value in params.items()})
+        return args
+
+    def _read_tags(self, args: dict) -> str:
+        lines = []
+        for idx in range(int(args["n"])):
+            a_raw_tag = args[f"t{(idx + 1)}"]
+            if a_raw_tag in self.values:
+                lines.append(f"#{a_raw_tag}\tS_OK\n{OPT_CODE}\t{self._get_value(a_raw_tag)}\n")
+            else:
+                lines.append(f"#{a_raw_tag}\tE_INACTIVETAG\n")
+        return "".join(lines)
+
+    def _write_tags(self, args: dict) -> str:
+        lines = []
+        for idx in range(int(args["n"])):
+            a_raw_tag = args[f"t{(idx + 1)}"]
+            self.values[a_raw_tag] = args[f"v{(idx + 1)}"]
+            lines.append(f"#{a_raw_tag}\tS_OK\n{OPT_CODE}\t{self.values[a_raw_tag]}\n")
+        return "".join(lines)
+
+    def _easycon_xml(self, query: str) -> str:
+        # 'D|1|5|A|1|100|I|2|300'
+        parts = query.split("|")
+        root = ElemTree.Element("PCOWEB")
+        pco = ElemTree.SubElement(root, "PCO")
+        type_names = {"D": "DIGITAL", "A": "ANALOG", "I": "INTEGER"}
+        for idx in range(0, len(parts) - 2, 3):
+            tag_type = parts[idx]
+            type_node = ElemTree.SubElement(pco, type_names[tag_type])
+            for index in range(int(parts[idx + 1]), int(parts[idx + 2]) + 1):
+                a_raw_tag = f"{tag_type}{index}"
+                if a_raw_tag in self.values:
+                    value = self._get_value(a_raw_tag)
+                    if tag_type == "A":
+                        # easycon delivers the analog values already divided by 10
+                        value = str(float(value) / 10.0)
+                    variable = ElemTree.SubElement(type_node, "VARIABLE")
+                    ElemTree.SubElement(variable, "INDEX").text = str(index)
+                    ElemTree.SubElement(variable, "VALUE").text = value
+        return ElemTree.tostring(root, encoding="unicode")
+
+    def _easycon_query(self, query: str) -> str:
+        # 'var|I|1255|20|var|I|1256|01|'
+        parts = query.split("|")
+        for idx in range(0, len(parts) - 3, 4):
+            self.values[f"{parts[idx + 1]}{parts[idx + 2]}"] = parts[idx + 3]
+        return "<html>Operation completed successfully</html>"
+
+
+class _FakeRequestContext:
+    def __init__(self, session: FakeWaterkotteSession, url: str, params):
+        self._session = session
+        self._url = url
+        self._params = params
+
+    async def __aenter__(self) -> FakeResponse:
+        return await self._session.handle(self._url, self._params)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
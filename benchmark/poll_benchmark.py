@@ -0,0 +1,124 @@
+"""Offline poll benchmark for the pywaterkotte_ha client
+
+Drives WaterkotteClient.async_get_data() for the full WKHPTag set against the FakeWaterkotteSession and
+reports the requests per poll, the wall time and the CPU time that is spent for parsing & decoding the
+responses - for different 'tags_per_request' values.
+
+Must be executed from the root of the repository (with the requirements_dev.txt installed):
+
+    python -m benchmark.poll_benchmark --polls 10 --latency 0.05 --tags-per-request 10 25 50 75
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from custom_components.waterkotte_heatpump.pywaterkotte_ha import WaterkotteClient
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.const import ECOTOUCH, EASYCON
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
+
+from benchmark.fake_controller import FakeWaterkotteSession
+
+
+class _CpuTimer:
+    """wraps a method of the bridge and sums up the (thread) CPU time that is spent inside"""
+
+    def __init__(self, obj, method_name: str):
+        self.total = 0.0
+        original = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            start = time.thread_time()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.total += time.thread_time() - start
+
+        setattr(obj, method_name, timed)
+
+
+async def run_benchmark(system_type: str, tags_per_request: int, parallel: int, polls: int, latency: float,
+                        jitter: float, too_many_users_rate: float, max_sessions: int, change_rate: float) -> dict:
+    session = FakeWaterkotteSession(latency=latency, jitter=jitter, too_many_users_rate=too_many_users_rate,
+                                    max_sessions=max_sessions, change_rate=change_rate)
+    tags = list(WKHPTag)
+    client = WaterkotteClient(host="127.0.0.1", username="waterkotte", pwd="waterkotte", system_type=system_type,
+                              web_session=session, tags=tags, tags_per_request=tags_per_request,
+                              max_parallel_requests=parallel)
+    bridge = client._internal_client
+    parse_timer = _CpuTimer(bridge, "_parse_tags_response")
+    decode_timer = _CpuTimer(bridge, "_decode_values")
+    float_pair_timer = _CpuTimer(bridge, "_decode_float_pair_values")
+
+    await client.login()
+    # the first poll will build the read plan & decode all values
+    await client.async_get_data()
+
+    session.reset_counters()
+    parse_timer.total = decode_timer.total = float_pair_timer.total = 0.0
+    wall_times = []
+    cpu_start = time.process_time()
+    for _ in range(polls):
+        start = time.perf_counter()
+        await client.async_get_data()
+        wall_times.append(time.perf_counter() - start)
+    cpu_total = time.process_time() - cpu_start
+
+    return {
+        "system": system_type,
+        "tags_per_request": tags_per_request,
+        "parallel": parallel,
+        "requests_per_poll": session.requests / polls,
+        "wall_ms": statistics.mean(wall_times) * 1000,
+        "wall_max_ms": max(wall_times) * 1000,
+        "cpu_ms": cpu_total / polls * 1000,
+        "parse_us_per_tag": parse_timer.total / polls / len(tags) * 1_000_000,
+        "decode_us_per_tag": (decode_timer.total + float_pair_timer.total) / polls / len(tags) * 1_000_000,
+        "too_many_users": session.too_many_users_responses,
+    }
+
+
+def print_results(results: list):
+    print(f"{'system':<9} {'tags/req':>8} {'par':>4} {'req/poll':>9} {'wall ms':>9} {'max ms':>9} "
+          f"{'cpu ms':>8} {'parse us/tag':>13} {'decode us/tag':>14} {'TMU':>5}")
+    for res in results:
+        print(f"{res['system']:<9} {res['tags_per_request']:>8} {res['parallel']:>4} {res['requests_per_poll']:>9.1f} "
+              f"{res['wall_ms']:>9.1f} {res['wall_max_ms']:>9.1f} {res['cpu_ms']:>8.2f} "
+              f"{res['parse_us_per_tag']:>13.2f} {res['decode_us_per_tag']:>14.2f} {res['too_many_users']:>5}")
+
+
+async def main(args):
+    results = []
+    for a_system_type in args.system:
+        for a_tags_per_request in args.tags_per_request:
+            for a_parallel in args.parallel:
+                results.append(await run_benchmark(
+                    system_type=a_system_type, tags_per_request=a_tags_per_request, parallel=a_parallel,
+                    polls=args.polls, latency=args.latency, jitter=args.jitter,
+                    too_many_users_rate=args.too_many_users_rate, max_sessions=args.max_sessions,
+                    change_rate=args.change_rate
+                ))
+    print(f"{len(list(WKHPTag))} WKHPTags, {args.polls} polls per run, latency: {args.latency}s (+{args.jitter}s jitter)")
+    print_results(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="offline poll benchmark for the waterkotte client")
+    parser.add_argument("--system", nargs="+", default=[ECOTOUCH], choices=[ECOTOUCH, EASYCON])
+    parser.add_argument("--tags-per-request", nargs="+", type=int, default=[10, 25, 50, 75])
+    parser.add_argument("--parallel", nargs="+", type=int, default=[1])
+    parser.add_argument("--polls", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="response time of the controller (in sec)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="max random addon to the latency (in sec)")
+    parser.add_argument("--too-many-users-rate", type=float, default=0.0,
+                        help="probability of an '#E_TOO_MANY_USERS' response")
+    parser.add_argument("--max-sessions", type=int, default=None,
+                        help="number of parallel requests the controller accepts")
+    parser.add_argument("--change-rate", type=float, default=0.05,
+                        help="fraction of values that change between two polls")
+    parser.add_argument("--log-level", default="WARNING")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=arguments.log_level)
+    asyncio.run(main(arguments))
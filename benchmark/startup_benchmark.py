@@ -0,0 +1,83 @@
+"""Startup benchmark for the WKHPTag registry
+
+Imports the tag registry (and the entity descriptions of the integration) in fresh interpreters and reports
+the import time of each module (the 'self' time reported by 'python -X importtime', so the time that is spent
+for the parent packages is not included) - together with the time of the most common WKHPTag lookups.
+
+Must be executed from the root of the repository (with the requirements_dev.txt installed). To see the gain
+of a change, run it on both revisions:
+
+    python -m benchmark.startup_benchmark --runs 10
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag, RAW_TAG_INDEX
+
+DEFAULT_MODULES = [
+    "custom_components.waterkotte_heatpump.pywaterkotte_ha.tags",
+    "custom_components.waterkotte_heatpump.const",
+]
+
+_IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|\s*(?P<module>\S+)\s*$")
+
+
+def measure_import(module: str) -> tuple:
+    """the (self, cumulative) import time of the module in a fresh interpreter (in milliseconds)"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, cwd=os.getcwd(), check=True)
+    for a_line in proc.stderr.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(a_line)
+        if match is not None and match.group("module") == module:
+            return int(match.group("self")) / 1000, int(match.group("cumulative")) / 1000
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def measure_lookups(number: int) -> dict:
+    """the time of the WKHPTag lookups (in nanoseconds per lookup)"""
+    names = [a_tag.name for a_tag in WKHPTag]
+    raw_tags = list(RAW_TAG_INDEX.keys())
+    values = {a_tag: None for a_tag in WKHPTag}
+    tags = list(WKHPTag)
+
+    def per_lookup(func, count: int) -> float:
+        return min(timeit.repeat(func, number=number, repeat=5)) / number / count * 1_000_000_000
+
+    return {
+        "WKHPTag[name]": per_lookup(lambda: [WKHPTag[a_name] for a_name in names], len(names)),
+        "WKHPTag.NAME": per_lookup(lambda: WKHPTag.TEMPERATURE_OUTSIDE, 1),
+        "tag.tags": per_lookup(lambda: [a_tag.tags for a_tag in tags], len(tags)),
+        "dict[tag]": per_lookup(lambda: [values[a_tag] for a_tag in tags], len(tags)),
+        "RAW_TAG_INDEX[raw]": per_lookup(lambda: [RAW_TAG_INDEX[a_raw_tag] for a_raw_tag in raw_tags], len(raw_tags)),
+        "iterate WKHPTag": per_lookup(lambda: list(WKHPTag), len(tags)),
+    }
+
+
+def main(args):
+    print(f"{len(WKHPTag)} WKHPTags, {len(RAW_TAG_INDEX)} raw tags, {args.runs} runs per module")
+    print(f"{'module':<62} {'self ms':>9} {'min ms':>9} {'cumulative ms':>14}")
+    for a_module in args.modules:
+        # the first import will create the bytecode cache
+        measure_import(a_module)
+        samples = [measure_import(a_module) for _ in range(args.runs)]
+        self_times = [a_sample[0] for a_sample in samples]
+        print(f"{a_module:<62} {statistics.median(self_times):>9.2f} {min(self_times):>9.2f} "
+              f"{statistics.median([a_sample[1] for a_sample in samples]):>14.2f}")
+
+    print()
+    print(f"{'lookup':<22} {'ns':>8}")
+    for a_name, a_value in measure_lookups(args.number).items():
+        print(f"{a_name:<22} {a_value:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="startup benchmark for the WKHPTag registry")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--number", type=int, default=200, help="number of loops per lookup measurement")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    main(parser.parse_args())
@@ -1,27 +1,33 @@
 import asyncio
 import logging
+import time
 from datetime import timedelta
-from typing import List, Collection, Sequence, Any, Tuple
+from typing import List, Dict, Collection, Sequence, Any, Tuple
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ID, CONF_HOST, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant, Event, SupportsResponse
+from homeassistant.const import CONF_ID, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, Event, SupportsResponse, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as config_val, entity_registry as entity_reg
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from custom_components.waterkotte_heatpump.pywaterkotte_ha import WaterkotteClient
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.const import ECOTOUCH
-from custom_components.waterkotte_heatpump.pywaterkotte_ha.error import TooManyUsersException, InvalidPasswordException
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.error import TooManyUsersException, InvalidPasswordException, \
+    InvalidValueException, PartialWriteException
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.schedule_model import WKHPSchedule, schedule_tags
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
 from . import service as waterkotte_service
+from .energy_history import WKHPEnergyHistory
 from .const import (
     CONF_IP,
     CONF_POLLING_INTERVAL,
     CONF_TAGS_PER_REQUEST,
+    CONF_MAX_PARALLEL_REQUESTS,
+    CONF_WRITE_DEBOUNCE,
     CONF_BIOS,
     CONF_FW,
     CONF_SERIAL,
@@ -41,16 +47,27 @@ from .const import (
     SERVICE_SET_DISINFECTION_START_TIME,
     SERVICE_GET_ENERGY_BALANCE,
     SERVICE_GET_ENERGY_BALANCE_MONTHLY,
+    SERVICE_REFRESH_TAGS,
+    SERVICE_GET_SCHEDULE,
     FEATURE_VENT,
     FEATURE_HEATING_CURVE,
     FEATURE_DISINFECTION,
     FEATURE_CODE_GEN,
+    METRICS_KEY_PREFIX,
+    WEEKLY_SCHEDULE_KEY_PREFIX,
+    POLL_TIER_INTERVALS,
+    POLL_TIER_ON_DEMAND,
     CONFIG_VERSION, CONFIG_MINOR_VERSION
 )
 from .entity import CustomFriendlyNameEntity
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 SCAN_INTERVAL = timedelta(seconds=60)
+# the last known values will be persisted (delayed), so that the entities are available directly after a restart
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+# the delay (in sec) before the values of new active tags (created/enabled entities) will be read
+NEW_TAGS_READ_DELAY = 2
 CONFIG_SCHEMA = config_val.removed(DOMAIN, raise_if_present=False)
 
 
@@ -101,26 +118,21 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         hass.data.setdefault(DOMAIN, {"manifest_version": value})
 
     coordinator = WKHPDataUpdateCoordinator(hass, config_entry)
-    await coordinator.async_refresh()
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+    if await coordinator.async_restore_snapshot():
+        # the entities will start with the last known values - the first live poll can run in the background
+        config_entry.async_create_background_task(hass, async_initial_refresh(coordinator),
+                                                  f"{DOMAIN}_initial_refresh_{config_entry.entry_id}")
     else:
-        # here we can do some init stuff (like read all data)...
-        pass
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            await coordinator.bridge.close()
+            raise ConfigEntryNotReady
+        await async_enable_operating_hours_totals(coordinator)
 
-    # we check if the operation hours will be returned as TOTAL's (and if this is
-    # not the case, we enable it!
-    try:
-        res = await coordinator.bridge.async_read_value(WKHPTag.OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634)
-        if res.get('status', None) == "S_OK":
-            if not res.get('value', True):
-                _LOGGER.info(f"async_setup_entry(): enable 'total OPERATING_HOURS' counters via OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634")
-                await coordinator.bridge.async_write_value(WKHPTag.OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634, True)
-    except BaseException as e:
-        _LOGGER.warning(f"async_setup_entry(): could not enable OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634: {(type(e).__name__)} {e}")
-
-    # ok now init the platforms...
+    # ok now init the platforms... (the active tags will follow the created/enabled/disabled entities)
     hass.data[DOMAIN][config_entry.entry_id] = coordinator
+    config_entry.async_on_unload(hass.bus.async_listen(entity_reg.EVENT_ENTITY_REGISTRY_UPDATED,
+                                                       coordinator.async_entity_registry_updated))
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     service = waterkotte_service.WaterkotteHeatpumpService(hass, config_entry, coordinator)
@@ -134,15 +146,43 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
                                  supports_response=SupportsResponse.ONLY)
     hass.services.async_register(DOMAIN, SERVICE_GET_ENERGY_BALANCE_MONTHLY, service.get_energy_balance_monthly,
                                  supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH_TAGS, service.refresh_tags,
+                                 supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, SERVICE_GET_SCHEDULE, service.get_schedule,
+                                 supports_response=SupportsResponse.ONLY)
+
+    async def close_bridge(event: Event):
+        await coordinator.bridge.close()
 
-    # we should check (in any CASE!) if the active tags might have...
-    asyncio.create_task(coordinator.update_client_tag_list(hass, config_entry.data.get(CONF_ADD_SERIAL_AS_ID,False), config_entry.entry_id))
+    # the energy history will be refreshed once per day (in the background)
+    await coordinator.energy_history.async_load()
+    config_entry.async_on_unload(coordinator.energy_history.async_start(config_entry))
 
     # ok we are done...
+    config_entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, close_bridge))
     config_entry.async_on_unload(config_entry.add_update_listener(entry_update_listener))
     return True
 
 
+async def async_initial_refresh(coordinator):
+    await coordinator.async_refresh()
+    if coordinator.last_update_success:
+        await async_enable_operating_hours_totals(coordinator)
+
+
+async def async_enable_operating_hours_totals(coordinator):
+    # we check if the operation hours will be returned as TOTAL's (and if this is
+    # not the case, we enable it!
+    try:
+        res = await coordinator.bridge.async_read_value(WKHPTag.OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634)
+        if res is not None and res.status == "S_OK":
+            if not res.value:
+                _LOGGER.info(f"async_setup_entry(): enable 'total OPERATING_HOURS' counters via OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634")
+                await coordinator.bridge.async_write_value(WKHPTag.OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634, True)
+    except BaseException as e:
+        _LOGGER.warning(f"async_setup_entry(): could not enable OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634: {(type(e).__name__)} {e}")
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     _LOGGER.debug(f"async_unload_entry() called for entry: {config_entry.entry_id}")
     unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
@@ -152,6 +192,7 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
             # even if waterkotte does not support logout... I code it here...
             coordinator = hass.data[DOMAIN][config_entry.entry_id]
             await coordinator.bridge._internal_client.logout()
+            await coordinator.bridge.close()
 
             hass.data[DOMAIN].pop(config_entry.entry_id)
 
@@ -159,6 +200,8 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         hass.services.async_remove(DOMAIN, SERVICE_SET_DISINFECTION_START_TIME)
         hass.services.async_remove(DOMAIN, SERVICE_GET_ENERGY_BALANCE)
         hass.services.async_remove(DOMAIN, SERVICE_GET_ENERGY_BALANCE_MONTHLY)
+        hass.services.async_remove(DOMAIN, SERVICE_REFRESH_TAGS)
+        hass.services.async_remove(DOMAIN, SERVICE_GET_SCHEDULE)
 
     return unload_ok
 
@@ -169,34 +212,45 @@ async def entry_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
 
 
 @staticmethod
-def generate_tag_list(hass: HomeAssistant, trim_unique_id:bool, config_entry_id: str) -> List[WKHPTag]:
+def tag_from_unique_id(unique_id: str, trim_unique_id: bool) -> WKHPTag | None:
+    a_temp_tag = unique_id
+
+    # we must remove the DOMAIN prefix!!!
+    prefix = f"{DOMAIN.lower()}.".lower()
+    if a_temp_tag.startswith(prefix):
+        a_temp_tag = a_temp_tag[len(prefix):]
+
+    if trim_unique_id:
+        a_temp_tag = a_temp_tag[0:a_temp_tag.rfind('_')]
+
+    if a_temp_tag is not None and a_temp_tag.upper().startswith(METRICS_KEY_PREFIX):
+        # the metrics sensors do not read any data from the waterkotte
+        return None
+    elif a_temp_tag is not None and a_temp_tag.upper().startswith(WEEKLY_SCHEDULE_KEY_PREFIX):
+        # the weekly schedule sensors will request their (many) tags on demand
+        return None
+    elif a_temp_tag is not None and a_temp_tag.upper() in WKHPTag.__members__:
+        return WKHPTag[a_temp_tag.upper()]
+    else:
+        _LOGGER.warning(f"Tag: {a_temp_tag} not found in WKHPTag.__members__ !")
+        return None
+
+
+def generate_entity_tag_map(hass: HomeAssistant, trim_unique_id:bool, config_entry_id: str) -> Dict[str, WKHPTag]:
+    """the WKHPTags of all enabled entities of the config entry (entity_id -> WKHPTag)"""
     _LOGGER.info(f"(re)build tag list...")
-    tags = []
+    entity_tags = {}
     if hass is not None:
         a_entity_reg = entity_reg.async_get(hass)
         if a_entity_reg is not None:
             # we query from the HA entity registry all entities that are created by this
             # 'config_entry' -> we use here just default api calls [no more hacks!]
-            prefix = f"{DOMAIN.lower()}.".lower()
-            prefix_len = len(prefix)
             for entity in entity_reg.async_entries_for_config_entry(registry=a_entity_reg, config_entry_id=config_entry_id):
                 if entity.disabled is False:
-                    a_temp_tag = (entity.unique_id)
-
-                    # we must remove the DOMAIN prefix!!!
-                    if a_temp_tag.startswith(prefix):
-                        a_temp_tag = a_temp_tag[prefix_len:]
-
-                    if trim_unique_id:
-                        a_temp_tag = a_temp_tag[0:a_temp_tag.rfind('_')]
-
-                    #_LOGGER.debug(f"found active entity: {entity.entity_id} using Tag: {a_temp_tag.upper()}")
-                    if a_temp_tag is not None and a_temp_tag.upper() in WKHPTag.__members__:
-                        if WKHPTag[a_temp_tag.upper()]:
-                            tags.append(WKHPTag[a_temp_tag.upper()])
-                    else:
-                        _LOGGER.warning(f"Tag: {a_temp_tag} not found in WKHPTag.__members__ !")
-    return tags
+                    a_tag = tag_from_unique_id(entity.unique_id, trim_unique_id)
+                    if a_tag is not None:
+                        entity_tags[entity.entity_id] = a_tag
+    return entity_tags
 
 
 class WKHPDataUpdateCoordinator(DataUpdateCoordinator):
@@ -223,11 +277,20 @@ class WKHPDataUpdateCoordinator(DataUpdateCoordinator):
         _pwd = config_entry.options.get(CONF_PASSWORD, config_entry.data.get(CONF_PASSWORD, "waterkotte"))
         _system_type = config_entry.options.get(CONF_SYSTEMTYPE, config_entry.data.get(CONF_SYSTEMTYPE, ECOTOUCH))
         _tags_num = config_entry.options.get(CONF_TAGS_PER_REQUEST, config_entry.data.get(CONF_TAGS_PER_REQUEST, 10))
-        _tags = generate_tag_list(hass=hass, trim_unique_id=self.is_multi_instances, config_entry_id=config_entry.entry_id)
+        _parallel_num = config_entry.options.get(CONF_MAX_PARALLEL_REQUESTS, config_entry.data.get(CONF_MAX_PARALLEL_REQUESTS, 1))
+        # the time window (in ms) in which entity writes will be collected and then written together
+        self._write_debounce = config_entry.options.get(CONF_WRITE_DEBOUNCE, config_entry.data.get(CONF_WRITE_DEBOUNCE, 250)) / 1000
+        # the WKHPTag of each enabled entity - will be maintained via the entity registry events
+        self._entity_tags = generate_entity_tag_map(hass=hass, trim_unique_id=self.is_multi_instances,
+                                                    config_entry_id=config_entry.entry_id)
+        self._new_tags = set()
+        self._new_tags_task = None
+        _tags = list(dict.fromkeys(self._entity_tags.values()))
 
         self.bridge = WaterkotteClient(host=_host, username=_user, pwd=_pwd, system_type=_system_type,
-                                       web_session=async_get_clientsession(hass), tags=_tags,
-                                       tags_per_request=_tags_num, lang=hass.config.language.lower())
+                                       web_session=None, tags=_tags,
+                                       tags_per_request=_tags_num, max_parallel_requests=_parallel_num,
+                                       lang=hass.config.language.lower())
 
         global SCAN_INTERVAL
         # update_interval can be adjusted in the options (not for WebAPI)
@@ -248,17 +311,130 @@ class WKHPDataUpdateCoordinator(DataUpdateCoordinator):
             "hw_version": f"{config_entry.options.get(CONF_ID, config_entry.data.get(CONF_ID))}"
         }
 
+        # timestamp (monotonic) of the last successful read of each tag
+        self._tag_last_read = {}
+        # the WKHPTags that have been changed by the last update (None: all entities must be updated)
+        self._changed_tags = None
+        self._last_notified_success = None
+        # the pending entity writes (last value per WKHPTag) & the futures of the waiting entities
+        self._pending_writes = {}
+        self._pending_write_waiters = []
+        self._write_flush_task = None
+        self._write_lock = asyncio.Lock()
+        # the (persisted) monthly & yearly energy balance
+        self.energy_history = WKHPEnergyHistory(hass, self, config_entry.entry_id)
+        # the last known values (raw records & read timestamps) - the WKHPTags, that have been restored
+        # from this snapshot, will be marked as stale till they have been read again
+        self._snapshot_store = Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.snapshot.{config_entry.entry_id}")
+        self.stale_tags = set()
         super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL)
 
-    async def update_client_tag_list(self, hass: HomeAssistant, trim_unique_id: bool, entry_id: str):
-        _LOGGER.debug(f"rechecking active tags... in 15sec")
-        await asyncio.sleep(15)
-
-        _LOGGER.debug(f"rechecking active tags NOW!")
-        self.bridge.tags = generate_tag_list(hass, trim_unique_id, entry_id)
+    def _get_due_tags(self) -> list:
+        """return the tags (of the active tag list) that must be read in this update cycle"""
+        if self.bridge.tags is None:
+            return []
+
+        now = time.monotonic()
+        due_tags = []
+        for a_tag in self.bridge.tags:
+            last_read = self._tag_last_read.get(a_tag)
+            if last_read is None or self.data is None or a_tag not in self.data or a_tag in self.stale_tags:
+                # the values restored from the snapshot must be replaced with the first live poll
+                due_tags.append(a_tag)
+            elif now - last_read >= POLL_TIER_INTERVALS[a_tag.poll_tier].total_seconds():
+                due_tags.append(a_tag)
+        return due_tags
+
+    async def async_restore_snapshot(self) -> bool:
+        """restore the last known values (without any request to the waterkotte)"""
+        if self.bridge.tags is None:
+            return False
+        try:
+            snapshot = await self._snapshot_store.async_load()
+            if snapshot is None or "raw" not in snapshot:
+                return False
+
+            raw_records = {a_tag: tuple(a_record) for a_tag, a_record in snapshot["raw"].items()}
+            restored = self.bridge.restore_raw_records(self.bridge.tags, raw_records)
+            data = {a_tag: a_value for a_tag, a_value in restored.items() if a_value is not None and a_value.status == "S_OK"}
+            if len(data) == 0:
+                return False
+
+            # the read timestamps are persisted as epoch - our poll scheduling works with monotonic times
+            now = time.time()
+            now_monotonic = time.monotonic()
+            for a_name, a_timestamp in snapshot.get("read", {}).items():
+                if a_name in WKHPTag.__members__ and WKHPTag[a_name] in data:
+                    self._tag_last_read[WKHPTag[a_name]] = now_monotonic - max(0.0, now - a_timestamp)
+
+            _LOGGER.info(f"restored {len(data)} values from the last snapshot")
+            self.stale_tags = set(data)
+            self.data = data
+            return True
+        except Exception as exc:
+            _LOGGER.warning(f"could not restore the last snapshot: {exc}")
+            return False
+
+    @callback
+    def _async_save_snapshot(self):
+        self._snapshot_store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot_data(self) -> dict:
+        now = time.time()
+        now_monotonic = time.monotonic()
+        return {
+            "raw": {a_tag: list(a_record) for a_tag, a_record in self.bridge.get_raw_records().items()},
+            "read": {a_tag.name: round(now - (now_monotonic - a_time), 1) for a_tag, a_time in self._tag_last_read.items()},
+        }
 
-        _LOGGER.debug(f"active tags checked... now refresh sensor data")
-        await self.async_refresh()
+    @callback
+    def async_entity_registry_updated(self, event: Event):
+        """add/remove the WKHPTag of a single entity to/from the active tags, when the entity has been
+        created, enabled, disabled or removed"""
+        action = event.data.get("action")
+        entity_id = event.data.get("entity_id")
+        old_tag = self._entity_tags.pop(entity_id, None)
+        if action == "update" and "old_entity_id" in event.data:
+            old_tag = self._entity_tags.pop(event.data["old_entity_id"], old_tag)
+
+        new_tag = None
+        if action != "remove":
+            entity = entity_reg.async_get(self.hass).async_get(entity_id)
+            if entity is not None and entity.config_entry_id == self._config_entry.entry_id and entity.disabled is False:
+                new_tag = tag_from_unique_id(entity.unique_id, self.is_multi_instances)
+                if new_tag is not None:
+                    self._entity_tags[entity_id] = new_tag
+
+        if old_tag == new_tag:
+            return
+
+        _LOGGER.debug(f"entity registry {action}: {entity_id} -> active tags: -{old_tag} +{new_tag}")
+        self.bridge.tags = list(dict.fromkeys(self._entity_tags.values()))
+        if old_tag is not None and old_tag not in self._entity_tags.values():
+            self._tag_last_read.pop(old_tag, None)
+            self._new_tags.discard(old_tag)
+        if new_tag is not None and (self.data is None or new_tag not in self.data):
+            self.async_request_tags([new_tag])
+
+    @callback
+    def async_request_tags(self, tags: Sequence[WKHPTag]):
+        """the values of the requested tags will be read together (as soon as all entities have been added)"""
+        self._new_tags.update(tags)
+        if len(self._new_tags) > 0 and self._new_tags_task is None:
+            self._new_tags_task = self.hass.async_create_task(self._async_read_new_tags())
+
+    async def _async_read_new_tags(self):
+        await asyncio.sleep(NEW_TAGS_READ_DELAY)
+        tags = list(self._new_tags)
+        self._new_tags = set()
+        self._new_tags_task = None
+        if len(tags) > 0 and self.data is not None:
+            _LOGGER.debug(f"reading {len(tags)} new active tags")
+            try:
+                await self.async_refresh_tags(tags)
+            except Exception as exc:
+                _LOGGER.info(f"could not read the new active tags (will be read with the next update): {exc}")
 
     # Callable[[Event], Any]
     def __call__(self, evt: Event) -> bool:
@@ -267,19 +443,33 @@ class WKHPDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Update data via library."""
+        self._changed_tags = None
         try:
             await self.bridge.login()
-            _LOGGER.info(f"number of entities to query: {len(self.bridge.tags)} (1 entity can consist of n-tags)")
-            result = await self.bridge.async_get_data()
+            due_tags = self._get_due_tags()
+            _LOGGER.info(f"number of entities to query: {len(due_tags)} of {len(self.bridge.tags or [])} (1 entity can consist of n-tags)")
+            result = await self.bridge.async_read_values(due_tags) if len(due_tags) > 0 else {}
             _LOGGER.info(f"number of entity values read: {len(result)}")
 
+            changed_tags = set()
             if self.data is None:
                 self.data = {}
+                changed_tags = None
 
+            read_time = time.monotonic()
             for a_tag_in_result in result:
-                if result[a_tag_in_result]["status"] == "S_OK":
+                self._tag_last_read[a_tag_in_result] = read_time
+                if result[a_tag_in_result] is not None and result[a_tag_in_result].status == "S_OK":
+                    if changed_tags is not None and (self.data.get(a_tag_in_result) != result[a_tag_in_result]
+                                                     or a_tag_in_result in self.stale_tags):
+                        changed_tags.add(a_tag_in_result)
                     self.data[a_tag_in_result] = result[a_tag_in_result]
+                    self.stale_tags.discard(a_tag_in_result)
 
+            if changed_tags is not None:
+                _LOGGER.debug(f"number of changed entity values: {len(changed_tags)}")
+            self._changed_tags = changed_tags
+            self._async_save_snapshot()
             return self.data
 
         except UpdateFailed as exception:
@@ -295,36 +485,170 @@ class WKHPDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error(f"unexpected: {other}")
             raise UpdateFailed() from other
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the entities (listeners) of the WKHPTags that have been changed"""
+        changed_tags = self._changed_tags
+        self._changed_tags = None
+        if changed_tags is None or self._last_notified_success != self.last_update_success:
+            # first data, availability has changed or the update was not triggered by a poll
+            self._last_notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed_tags:
+                update_callback()
+
     async def async_read_values(self, tags: Sequence[WKHPTag]) -> dict:
         """Get data from the API."""
         ret = await self.bridge.async_read_values(tags)
         return ret
 
-    async def async_write_tags(self, kv_pairs: Collection[Tuple[WKHPTag, Any]]) -> dict:
-        """Get data from the API."""
-        ret = await self.bridge.async_write_values(kv_pairs)
+    async def async_write_tags(self, kv_pairs: Collection[Tuple[WKHPTag, Any]], skip_unchanged: bool = False,
+                               skipped_tags: set = None) -> dict:
+        """Write the values (without the write queue)"""
+        async with self._write_lock:
+            try:
+                ret = await self.bridge.async_write_values(kv_pairs, skip_unchanged=skip_unchanged,
+                                                           skipped_tags=skipped_tags)
+            except PartialWriteException as exc:
+                # the values that have been written before the failure are valid anyhow
+                self._async_patch_data(exc.result)
+                raise
+            self._async_patch_data(ret)
         return ret
 
-    async def async_write_tag(self, tag: WKHPTag, value, entity: Entity = None):
-        """Update single data"""
-        result = await self.bridge.async_write_value(tag, value)
-        _LOGGER.debug(f"write result: {result}")
+    async def async_write_schedule(self, kv_pairs: Collection[Tuple[WKHPTag, Any]], skipped_tags: set = None) -> dict:
+        """Write schedule values - only the values that differ from the current values will be sent to the
+        waterkotte (the unchanged WKHPTags will be added to 'skipped_tags')"""
+        # the schedule can be changed at the heatpump itself at any time - so all values, that have not been
+        # read within the last update interval, will be read again (in one batch) before we compare them
+        outdated_tags = self._get_outdated_tags(list(dict.fromkeys(a_tag for a_tag, a_value in kv_pairs)),
+                                                self.update_interval)
+        if len(outdated_tags) > 0:
+            _LOGGER.debug(f"refreshing {len(outdated_tags)} outdated schedule tags before writing")
+            await self.async_refresh_tags(outdated_tags)
+        return await self.async_write_tags(kv_pairs, skip_unchanged=True, skipped_tags=skipped_tags)
 
-        if tag in result:
-            self.data[tag] = result[tag]
-        else:
+    async def async_write_tag(self, tag: WKHPTag, value, entity: Entity = None):
+        """Update single data - the write will be queued and written together with all other writes
+        that arrive within the write debounce window"""
+        if not tag.writeable:
+            raise InvalidValueException("tried to write to an readonly field")
+        # check the value already here, so that an invalid value will not break the writes of other entities
+        tag.encode_f(tag, value, {})
+
+        # only the last value per tag will be written
+        self._pending_writes.pop(tag, None)
+        self._pending_writes[tag] = value
+        waiter = self.hass.loop.create_future()
+        self._pending_write_waiters.append(waiter)
+        if self._write_flush_task is None:
+            self._write_flush_task = self.hass.async_create_task(self._async_flush_writes())
+
+        result = await waiter
+        if tag not in result:
             _LOGGER.error(f"could not write value: '{value}' to: {tag} result was: {result}")
 
-        # after we have written something to the Waterkotte we should force an update of the data...
-        if entity is not None:
-            entity.async_schedule_update_ha_state(force_refresh=True)
+    async def _async_flush_writes(self):
+        await asyncio.sleep(self._write_debounce)
+
+        # all writes that will arrive from now on will be part of the next flush
+        kv_pairs = list(self._pending_writes.items())
+        waiters = self._pending_write_waiters
+        self._pending_writes = {}
+        self._pending_write_waiters = []
+        self._write_flush_task = None
+
+        # the flushes must be written one after another (the order of the values matters)
+        async with self._write_lock:
+            _LOGGER.debug(f"flushing {len(kv_pairs)} queued writes of {len(waiters)} entity updates")
+            try:
+                result = await self.bridge.async_write_values(kv_pairs)
+                _LOGGER.debug(f"write result: {result}")
+            except Exception as exc:
+                if isinstance(exc, PartialWriteException):
+                    # the values that have been written before the failure are valid anyhow
+                    self._async_patch_data(exc.result)
+                for a_waiter in waiters:
+                    if not a_waiter.done():
+                        a_waiter.set_exception(exc)
+                return
+
+            self._async_patch_data(result)
+            for a_waiter in waiters:
+                if not a_waiter.done():
+                    a_waiter.set_result(result)
+
+    async def async_refresh_tags(self, tags: Sequence[WKHPTag]) -> dict:
+        """read only the given WKHPTags (instead of all active tags) & update the entities of the changed values"""
+        await self.bridge.login()
+        result = await self.bridge.async_read_values(tags)
+        _LOGGER.debug(f"refreshed {len(result)} of {len(tags)} tags")
+        self._async_patch_data(result)
+        return result
+
+    def _get_outdated_tags(self, tags: Sequence[WKHPTag], max_age: timedelta) -> list:
+        """return the tags that are unknown or that have not been read within 'max_age'"""
+        now = time.monotonic()
+        return [a_tag for a_tag in tags if self.data is None or a_tag not in self.data or a_tag in self.stale_tags
+                or now - self._tag_last_read.get(a_tag, 0) > max_age.total_seconds()]
+
+    @callback
+    def async_request_schedule(self, schedule_type: str):
+        """request the (outdated) values of a complete schedule - they will be read in the background"""
+        if len(self._get_outdated_tags(schedule_tags(schedule_type), POLL_TIER_INTERVALS[POLL_TIER_ON_DEMAND])) > 0:
+            self.hass.async_create_task(self._async_read_requested_schedule(schedule_type))
+
+    async def _async_read_requested_schedule(self, schedule_type: str):
+        try:
+            await self.async_read_schedule(schedule_type, POLL_TIER_INTERVALS[POLL_TIER_ON_DEMAND])
+        except Exception as exc:
+            _LOGGER.info(f"could not read the {schedule_type} (will be read with the next request): {exc}")
+
+    async def async_read_schedule(self, schedule_type: str, max_age: timedelta | None = None) -> WKHPSchedule:
+        """return a complete schedule - when all values have been read within 'max_age', the schedule will
+        be created from our data (without any request), otherwise all values of the schedule will be read
+        (with the dedicated schedule requests of the bridge)"""
+        if max_age is not None and len(self._get_outdated_tags(schedule_tags(schedule_type), max_age)) == 0:
+            return WKHPSchedule(schedule_type, self.data)
+
+        await self.bridge.login()
+        schedule = await self.bridge.async_read_schedule(schedule_type)
+        _LOGGER.debug(f"read {len(schedule.values)} values of {schedule_type}")
+        self._async_patch_data(schedule.values)
+        return schedule
+
+    @callback
+    def _async_patch_data(self, result: dict):
+        """merge the values of a partial read (or the verified values of a write) into our data and
+        notify only the entities of the changed values"""
+        if self.data is None:
+            return
+
+        changed_tags = set()
+        read_time = time.monotonic()
+        for a_tag, a_value in result.items():
+            if a_value is not None and a_value.status == "S_OK":
+                self._tag_last_read[a_tag] = read_time
+                if self.data.get(a_tag) != a_value or a_tag in self.stale_tags:
+                    changed_tags.add(a_tag)
+                    self.data[a_tag] = a_value
+                    self.stale_tags.discard(a_tag)
+
+        if len(changed_tags) > 0:
+            self._changed_tags = changed_tags
+            self.async_update_listeners()
+            self._async_save_snapshot()
 
 
 class WKHPBaseEntity(CustomFriendlyNameEntity):
     _attr_has_entity_name = True
 
     def __init__(self, entity_type:str, coordinator: WKHPDataUpdateCoordinator, description: EntityDescription) -> None:
-        super().__init__(coordinator)
+        # the WKHPTag is the listener context - so the entity will be only updated when its value has been changed
+        super().__init__(coordinator, context=description.tag)
         if description.feature is not None and FEATURE_CODE_GEN == description.feature:
             self.code_generated = True
         else:
@@ -381,6 +705,13 @@ class WKHPBaseEntity(CustomFriendlyNameEntity):
         """Return True if entity is available."""
         return self.coordinator.last_update_success
 
+    @property
+    def extra_state_attributes(self):
+        # the value has been restored from the last snapshot and has not been read again (yet)
+        if self.wkhp_tag in self.coordinator.stale_tags:
+            return {"stale": True}
+        return None
+
     @property
     def unique_id(self):
         """Return a unique ID to use for this entity."""
@@ -394,7 +725,7 @@ class WKHPBaseEntity(CustomFriendlyNameEntity):
 
     async def async_added_to_hass(self):
         """Connect to dispatcher listening for entity data notifications."""
-        self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+        # the CoordinatorEntity will register the listener (with our WKHPTag as context)
         await super().async_added_to_hass()
 
     def _friendly_name_internal(self) -> str | None:
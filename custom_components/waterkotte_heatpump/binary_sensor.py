@@ -7,7 +7,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import WKHPDataUpdateCoordinator, WKHPBaseEntity
 from .const import DOMAIN, BINARY_SENSORS, ExtBinarySensorEntityDescription
-from .const_gen import BINARY_SENSORS_GENERATED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,10 +18,6 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
     for description in BINARY_SENSORS:
         entity = WKHPBinarySensor(coordinator, description)
         entities.append(entity)
-    if coordinator.add_schedule_entities:
-        for description in BINARY_SENSORS_GENERATED:
-            entity = WKHPBinarySensor(coordinator, description)
-            entities.append(entity)
     add_entity_cb(entities)
 
 
@@ -36,8 +31,8 @@ class WKHPBinarySensor(WKHPBaseEntity, BinarySensorEntity):
             value = None
             if self.wkhp_tag in self.coordinator.data:
                 value_and_state = self.coordinator.data[self.wkhp_tag]
-                if "value" in value_and_state:
-                    value = value_and_state["value"]
+                if value_and_state is not None:
+                    value = value_and_state.value
                 else:
                     _LOGGER.debug(
                         f"is_on: for {self.entity_description.key} could not read value from data: {value_and_state}")
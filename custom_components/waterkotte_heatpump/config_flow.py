@@ -10,13 +10,14 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_ID, CONF_HOST, CONF_USERNAME, CONF_PASSWORD
 from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.util import uuid as uuid_util
 from .const import (
     DOMAIN,
     TITLE,
     CONF_POLLING_INTERVAL,
     CONF_TAGS_PER_REQUEST,
+    CONF_MAX_PARALLEL_REQUESTS,
+    CONF_WRITE_DEBOUNCE,
     CONF_BIOS,
     CONF_FW,
     CONF_SERIAL,
@@ -177,6 +178,8 @@ class WaterkotteHeatpumpFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_PASSWORD, default=user_input.get(CONF_PASSWORD)): str,
                 vol.Required(CONF_POLLING_INTERVAL, default=60): int,
                 vol.Required(CONF_TAGS_PER_REQUEST, default=75): int,
+                vol.Required(CONF_MAX_PARALLEL_REQUESTS, default=1): int,
+                vol.Required(CONF_WRITE_DEBOUNCE, default=250): int,
                 vol.Required(CONF_ADD_SCHEDULE_ENTITIES, default=False): bool,
                 vol.Required(CONF_ADD_SERIAL_AS_ID, default=False): bool,
             }),
@@ -205,10 +208,10 @@ class WaterkotteHeatpumpFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
     async def _test_credentials(self, host, username, pwd, system_type, tags_per_request):
+        client = None
         try:
-            session = async_create_clientsession(self.hass)
             client = WaterkotteClient(host=host, username=username, pwd=pwd, system_type=system_type,
-                                      web_session=session, tags=None, tags_per_request=tags_per_request,
+                                      web_session=None, tags=None, tags_per_request=tags_per_request,
                                       lang=self.hass.config.language.lower())
             await client.login()
             init_tags = [
@@ -220,11 +223,11 @@ class WaterkotteHeatpumpFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             ]
             ret = await client.async_read_values(init_tags)
 
-            self._bios = ret[WKHPTag.VERSION_BIOS]["value"]
-            self._firmware = ret[WKHPTag.VERSION_CONTROLLER]["value"]
-            self._id = str(ret[WKHPTag.INFO_ID]["value"])
-            self._series = str(ret[WKHPTag.INFO_SERIES]["value"])
-            self._serial = str(ret[WKHPTag.INFO_SERIAL]["value"])
+            self._bios = ret[WKHPTag.VERSION_BIOS].value
+            self._firmware = ret[WKHPTag.VERSION_CONTROLLER].value
+            self._id = str(ret[WKHPTag.INFO_ID].value)
+            self._series = str(ret[WKHPTag.INFO_SERIES].value)
+            self._serial = str(ret[WKHPTag.INFO_SERIAL].value)
             if self._serial is None or self._serial == "None":
                 self._serial = uuid_util.random_uuid_hex()
 
@@ -236,6 +239,9 @@ class WaterkotteHeatpumpFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error(f"EASYCON Mode caused HTTP 404")
             else:
                 _LOGGER.error(f"Exception while test credentials: {exc}")
+        finally:
+            if client is not None:
+                await client.close()
         return False
 
     @staticmethod
@@ -269,6 +275,8 @@ class WaterkotteHeatpumpOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(CONF_PASSWORD, default=self.options.get(CONF_PASSWORD, "waterkotte")): str,
                 vol.Required(CONF_POLLING_INTERVAL, default=self.options.get(CONF_POLLING_INTERVAL, 60)): int,
                 vol.Required(CONF_TAGS_PER_REQUEST, default=self.options.get(CONF_TAGS_PER_REQUEST, 75)): int,
+                vol.Required(CONF_MAX_PARALLEL_REQUESTS, default=self.options.get(CONF_MAX_PARALLEL_REQUESTS, 1)): int,
+                vol.Required(CONF_WRITE_DEBOUNCE, default=self.options.get(CONF_WRITE_DEBOUNCE, 250)): int,
                 vol.Required(CONF_ADD_SCHEDULE_ENTITIES, default=self.options.get(CONF_ADD_SCHEDULE_ENTITIES, False)): bool
             }),
             description_placeholders={"repo": "https://github.com/marq24/ha-waterkotte"},
@@ -1,7 +1,14 @@
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Final
 
-from custom_components.waterkotte_heatpump.pywaterkotte_ha.const import FOUR_STEPS_MODES, SIX_STEPS_MODES
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.const import (
+    FOUR_STEPS_MODES,
+    SIX_STEPS_MODES,
+    POLL_TIER_FAST,
+    POLL_TIER_SLOW,
+    POLL_TIER_ON_DEMAND
+)
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntityDescription
 from homeassistant.components.number import NumberEntityDescription, NumberDeviceClass, NumberMode, DEFAULT_STEP
@@ -38,6 +45,14 @@ FEATURE_VENT: Final = "VENT"
 FEATURE_POOL: Final = "POOL"
 FEATURE_CODE_GEN: Final = "GENERATED"
 
+# min time between two reads of a tag (per polling tier) - 'on_demand' tags will be
+# updated when they have been written, the daily re-read is just a safety net
+POLL_TIER_INTERVALS: Final = {
+    POLL_TIER_FAST: timedelta(seconds=0),
+    POLL_TIER_SLOW: timedelta(minutes=60),
+    POLL_TIER_ON_DEMAND: timedelta(hours=24)
+}
+
 # Device classes
 DEVICE_CLASS_ENUM: Final = "enum"
 
@@ -62,6 +77,8 @@ ENUM_OPTIONS_0_4: Final = ["0", "1", "2", "3", "4"]
 CONF_IP: Final = "ip"
 CONF_POLLING_INTERVAL: Final = "polling_interval"
 CONF_TAGS_PER_REQUEST: Final = "tags_per_request"
+CONF_MAX_PARALLEL_REQUESTS: Final = "max_parallel_requests"
+CONF_WRITE_DEBOUNCE: Final = "write_debounce"
 CONF_BIOS: Final = "bios"
 CONF_FW: Final = "fw"
 CONF_SERIAL: Final = "serial"
@@ -88,6 +105,8 @@ SERVICE_SET_DISINFECTION_START_TIME: Final = "set_disinfection_start_time"
 SERVICE_SET_SCHEDULE_DATA: Final = "set_schedule_data"
 SERVICE_GET_ENERGY_BALANCE: Final = "get_energy_balance"
 SERVICE_GET_ENERGY_BALANCE_MONTHLY: Final = "get_energy_balance_monthly"
+SERVICE_REFRESH_TAGS: Final = "refresh_tags"
+SERVICE_GET_SCHEDULE: Final = "get_schedule"
 
 TENTH_STEP = 0.1
 FIFTH_STEP = 0.5
@@ -120,6 +139,20 @@ class ExtSensorEntityDescription(SensorEntityDescription):
     # controls: list[str] | None = None
 
 
+@dataclass(frozen=True)
+class ExtMetricsSensorEntityDescription(ExtSensorEntityDescription):
+    # name of the metric in the BridgeMetrics & the statistic ('last', 'mean', 'max') that should be shown -
+    # when 'statistic' is None, the metric is a simple counter
+    metric: str | None = None
+    statistic: str | None = None
+
+
+@dataclass(frozen=True)
+class ExtScheduleSensorEntityDescription(ExtSensorEntityDescription):
+    # the complete (weekly) schedule - e.g. 'SCHEDULE_HEATING'
+    schedule_type: str | None = None
+
+
 @dataclass(frozen=True)
 class ExtSwitchEntityDescription(SwitchEntityDescription):
     tag: WKHPTag | None = None
@@ -2476,6 +2509,155 @@ SENSOR_SENSORS: Final = [
         suggested_display_precision=1,
     )
 ]
+
+# unique_id's of the metrics sensors start with this prefix (they are not related to any WKHPTag)
+METRICS_KEY_PREFIX: Final = "METRICS_"
+METRICS_SENSORS: Final = [
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_POLL_TIME",
+        metric="poll_time",
+        statistic="mean",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=0,
+    ),
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_REQUEST_TIME",
+        metric="request_time",
+        statistic="mean",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=0,
+    ),
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_PARSE_TIME",
+        metric="parse_time",
+        statistic="mean",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-cog-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=2,
+    ),
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_DECODE_TIME",
+        metric="decode_time",
+        statistic="mean",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-cog-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=2,
+    ),
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_REQUESTS_PER_POLL",
+        metric="requests_per_poll",
+        statistic="last",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:swap-horizontal",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_TAGS_PER_REQUEST",
+        metric="tags_per_request",
+        statistic="mean",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:tag-multiple-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+    ),
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_RETRIES",
+        metric="retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:reload-alert",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtMetricsSensorEntityDescription(
+        key="METRICS_RELOGINS",
+        metric="relogins",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:login",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+]
+# unique_id's of the weekly schedule sensors start with this prefix (each of them covers all tags of a schedule,
+# so they have to be enabled by the user - every enabled schedule will be read once per day)
+WEEKLY_SCHEDULE_KEY_PREFIX: Final = "WEEKLY_SCHEDULE_"
+SCHEDULE_SENSORS: Final = [
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_HEATING",
+        schedule_type="SCHEDULE_HEATING",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_COOLING",
+        schedule_type="SCHEDULE_COOLING",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_WATER",
+        schedule_type="SCHEDULE_WATER",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_POOL",
+        schedule_type="SCHEDULE_POOL",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_MIX1",
+        schedule_type="SCHEDULE_MIX1",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_MIX2",
+        schedule_type="SCHEDULE_MIX2",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_MIX3",
+        schedule_type="SCHEDULE_MIX3",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP",
+        schedule_type="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_SOLAR",
+        schedule_type="SCHEDULE_SOLAR",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+    ExtScheduleSensorEntityDescription(
+        key="WEEKLY_SCHEDULE_PV",
+        schedule_type="SCHEDULE_PV",
+        icon="mdi:calendar-clock",
+        entity_registry_enabled_default=False,
+    ),
+]
 SWITCH_SENSORS: Final = [
     ExtSwitchEntityDescription(
         key="HOLIDAY_ENABLED",
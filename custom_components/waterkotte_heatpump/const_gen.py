@@ -1,368 +1,53 @@
-from typing import Final
+from functools import lru_cache
+from typing import Final, Sequence
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntityDescription
-from homeassistant.components.number import NumberEntityDescription, NumberDeviceClass, NumberMode, DEFAULT_STEP
-from homeassistant.components.select import SelectEntityDescription
-from homeassistant.components.sensor import SensorEntityDescription, SensorDeviceClass, SensorStateClass
-from homeassistant.components.switch import SwitchEntityDescription
-
-from homeassistant.const import UnitOfTemperature
+from homeassistant.components.number import NumberDeviceClass, NumberMode
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import UnitOfTemperature, Platform
 
 from .const import (
     TENTH_STEP,
     FEATURE_CODE_GEN,
-    ExtBinarySensorEntityDescription,
     ExtNumberEntityDescription,
-    ExtSelectEntityDescription,
     ExtSensorEntityDescription,
     ExtSwitchEntityDescription
 )
 
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.schedules import SCHEDULE_TYPES, schedule_tag_names
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
 
-BINARY_SENSORS_GENERATED: Final = []
-NUMBER_SENSORS_GENERATED: Final = [
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
+# the schedule entities (Thanks @flautze) will be only created (on demand) when the user has enabled them - so
+# we do not keep ~660 entity descriptions in memory that are not used at all
+
+# the platform that is used for a schedule field: '_ENABLE' -> switch, '_VALUE' -> number, all others (the
+# '_TIME' fields) -> sensor
+SCHEDULE_FIELD_PLATFORMS: Final = {
+    "_ENABLE": Platform.SWITCH,
+    "_VALUE": Platform.NUMBER,
+    "_TIME": Platform.SENSOR
+}
+
+
+def _schedule_field_platform(field: str) -> Platform:
+    for a_suffix, a_platform in SCHEDULE_FIELD_PLATFORMS.items():
+        if field.endswith(a_suffix):
+            return a_platform
+
+
+def _switch_description(key: str) -> ExtSwitchEntityDescription:
+    return ExtSwitchEntityDescription(
+        key=key,
+        tag=WKHPTag[key],
+        icon="mdi:calendar-today",
         entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
         feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST1_VALUE,
+    )
+
+
+def _number_description(key: str) -> ExtNumberEntityDescription:
+    return ExtNumberEntityDescription(
+        key=key,
+        tag=WKHPTag[key],
         device_class=NumberDeviceClass.TEMPERATURE,
         icon="mdi:thermometer",
         entity_registry_enabled_default=False,
@@ -372,5710 +57,38 @@ NUMBER_SENSORS_GENERATED: Final = [
         mode=NumberMode.BOX,
         native_unit_of_measurement=UnitOfTemperature.KELVIN,
         feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
+    )
+
+
+def _sensor_description(key: str) -> ExtSensorEntityDescription:
+    return ExtSensorEntityDescription(
+        key=key,
+        tag=WKHPTag[key],
+        device_class=SensorDeviceClass.DATE,
+        native_unit_of_measurement=None,
+        icon="mdi:clock-digital",
         entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
         feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtNumberEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_VALUE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_VALUE,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer",
-        entity_registry_enabled_default=False,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=TENTH_STEP,
-        mode=NumberMode.BOX,
-        native_unit_of_measurement=UnitOfTemperature.KELVIN,
-        feature=FEATURE_CODE_GEN
-    ),
-]
-SELECT_SENSORS_GENERATED: Final = []
-SENSOR_SENSORS_GENERATED: Final = [
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_START_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_END_TIME",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_SOLAR_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_SOLAR_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_1MO_START_TIME",
-        tag=WKHPTag.SCHEDULE_PV_1MO_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_1MO_END_TIME",
-        tag=WKHPTag.SCHEDULE_PV_1MO_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_2TU_START_TIME",
-        tag=WKHPTag.SCHEDULE_PV_2TU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_2TU_END_TIME",
-        tag=WKHPTag.SCHEDULE_PV_2TU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_3WE_START_TIME",
-        tag=WKHPTag.SCHEDULE_PV_3WE_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_3WE_END_TIME",
-        tag=WKHPTag.SCHEDULE_PV_3WE_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_4TH_START_TIME",
-        tag=WKHPTag.SCHEDULE_PV_4TH_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_4TH_END_TIME",
-        tag=WKHPTag.SCHEDULE_PV_4TH_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_5FR_START_TIME",
-        tag=WKHPTag.SCHEDULE_PV_5FR_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_5FR_END_TIME",
-        tag=WKHPTag.SCHEDULE_PV_5FR_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_6SA_START_TIME",
-        tag=WKHPTag.SCHEDULE_PV_6SA_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_6SA_END_TIME",
-        tag=WKHPTag.SCHEDULE_PV_6SA_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_7SU_START_TIME",
-        tag=WKHPTag.SCHEDULE_PV_7SU_START_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSensorEntityDescription(
-        key="SCHEDULE_PV_7SU_END_TIME",
-        tag=WKHPTag.SCHEDULE_PV_7SU_END_TIME,
-        device_class=SensorDeviceClass.DATE,
-        native_unit_of_measurement=None,
-        icon="mdi:clock-digital",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-]
-SWITCH_SENSORS_GENERATED: Final = [
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_HEATING_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_HEATING_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_COOLING_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_COOLING_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_WATER_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_WATER_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_POOL_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_POOL_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX1_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX1_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX2_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX2_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_MIX3_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_MIX3_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_ENABLE",
-        tag=WKHPTag.SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_SOLAR_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_SOLAR_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_SOLAR_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_SOLAR_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_SOLAR_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_SOLAR_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_SOLAR_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_SOLAR_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_SOLAR_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_SOLAR_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_SOLAR_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_SOLAR_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_SOLAR_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_SOLAR_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_PV_1MO_ENABLE",
-        tag=WKHPTag.SCHEDULE_PV_1MO_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_PV_2TU_ENABLE",
-        tag=WKHPTag.SCHEDULE_PV_2TU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_PV_3WE_ENABLE",
-        tag=WKHPTag.SCHEDULE_PV_3WE_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_PV_4TH_ENABLE",
-        tag=WKHPTag.SCHEDULE_PV_4TH_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_PV_5FR_ENABLE",
-        tag=WKHPTag.SCHEDULE_PV_5FR_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_PV_6SA_ENABLE",
-        tag=WKHPTag.SCHEDULE_PV_6SA_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-    ExtSwitchEntityDescription(
-        key="SCHEDULE_PV_7SU_ENABLE",
-        tag=WKHPTag.SCHEDULE_PV_7SU_ENABLE,
-        icon="mdi:calendar-today",
-        entity_registry_enabled_default=False,
-        feature=FEATURE_CODE_GEN
-    ),
-]
+    )
+
+
+DESCRIPTION_FACTORIES: Final = {
+    Platform.SWITCH: _switch_description,
+    Platform.NUMBER: _number_description,
+    Platform.SENSOR: _sensor_description
+}
+
+
+@lru_cache(maxsize=None)
+def _generated_descriptions(platform: Platform, schedule_types: tuple) -> tuple:
+    factory = DESCRIPTION_FACTORIES.get(platform)
+    if factory is None:
+        return ()
+    return tuple(factory(a_key) for a_key, a_field in schedule_tag_names(schedule_types)
+                 if _schedule_field_platform(a_field) == platform)
+
 
-# SCHEDULING ENTITIES from here...
-# for a_value in SCHEDULE_LIST:
-#     for a_day in SCHEDULE_DAY_LIST:
-#         for a_type in SCHEDULE_SENSOR_TYPES_LIST:
-#             a_key = f"{a_value}_{a_day}{a_type}"
-#             if a_type.endswith("_ENABLE"):
-#                 SWITCH_SENSORS.append(
-#                     ExtSwitchEntityDescription(
-#                         key=a_key,
-#                         tag=WKHPTag[a_key],
-#                         icon="mdi:calendar-today",
-#                         entity_registry_enabled_default=False,
-#                         feature=FEATURE_CODE_GEN
-#                     )
-#                 )
-#             elif a_type.endswith("_VALUE"):
-#                 NUMBER_SENSORS.append(
-#                     ExtNumberEntityDescription(
-#                         key=a_key,
-#                         tag=WKHPTag[a_key],
-#                         device_class=NumberDeviceClass.TEMPERATURE,
-#                         icon="mdi:thermometer",
-#                         entity_registry_enabled_default=False,
-#                         native_min_value=-10,
-#                         native_max_value=10,
-#                         native_step=TENTH_STEP,
-#                         mode=NumberMode.BOX,
-#                         native_unit_of_measurement=UnitOfTemperature.KELVIN,
-#                         feature=FEATURE_CODE_GEN
-#                     )
-#                 )
-#             else:
-#                 # time sensor...
-#                 SENSOR_SENSORS.append(
-#                     ExtSensorEntityDescription(
-#                         key=a_key,
-#                         tag=WKHPTag[a_key],
-#                         device_class=SensorDeviceClass.DATE,
-#                         native_unit_of_measurement=None,
-#                         icon="mdi:clock-digital",
-#                         entity_registry_enabled_default=False,
-#                         feature=FEATURE_CODE_GEN
-#                     )
-#                 )
+def get_generated_descriptions(platform: Platform, schedule_types: Sequence[str] = SCHEDULE_TYPES) -> tuple:
+    """the entity descriptions of the schedule entities of the given platform (only for the requested
+    schedule types) - they will be generated on the first call"""
+    return _generated_descriptions(platform, tuple(schedule_types))
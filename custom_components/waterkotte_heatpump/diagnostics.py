@@ -0,0 +1,36 @@
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_SERIAL
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, CONF_SERIAL}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    bridge = coordinator.bridge
+
+    tags_per_tier = {}
+    if bridge.tags is not None:
+        for a_tag in bridge.tags:
+            tags_per_tier[a_tag.poll_tier] = tags_per_tier.get(a_tag.poll_tier, 0) + 1
+
+    return {
+        "config_entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": async_redact_data(config_entry.options, TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "number_of_values": len(coordinator.data) if coordinator.data is not None else 0,
+            "number_of_tags": len(bridge.tags) if bridge.tags is not None else 0,
+            "tags_per_poll_tier": tags_per_tier,
+        },
+        "metrics": bridge.metrics.as_dict(),
+    }
@@ -0,0 +1,221 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Final
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
+from .const import DOMAIN
+from .energy_statistics import async_import_energy_statistics
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+STORAGE_VERSION: Final = 1
+# how often we check, if the energy history must be refreshed (it will be only read once per day or
+# when the month of the heatpump has changed)
+ENERGY_HISTORY_CHECK_INTERVAL: Final = timedelta(hours=1)
+
+# the 12 monthly (rolling) registers of the waterkotte: 'ENG_CONSUMPTION_COMPRESSOR01' ... '12'
+ENERGY_MONTHLY_TAG_PREFIXES: Final = {
+    "cop": "ENG_HEATPUMP_COP_MONTH",
+    "compressor": "ENG_CONSUMPTION_COMPRESSOR",
+    "sourcepump": "ENG_CONSUMPTION_SOURCEPUMP",
+    "externalheater": "ENG_CONSUMPTION_EXTERNALHEATER",
+    "heating": "ENG_PRODUCTION_HEATING",
+    "warmwater": "ENG_PRODUCTION_WARMWATER",
+    "pool": "ENG_PRODUCTION_POOL",
+}
+
+ENERGY_YEAR_TAGS: Final = {
+    "year": WKHPTag.COP_HEATPUMP_ACTUAL_YEAR_INFO,
+    "cop": WKHPTag.COP_HEATPUMP_YEAR,
+    "compressor": WKHPTag.COMPRESSOR_ELECTRIC_CONSUMPTION_YEAR,
+    "sourcepump": WKHPTag.SOURCEPUMP_ELECTRIC_CONSUMPTION_YEAR,
+    "externalheater": WKHPTag.ELECTRICAL_HEATER_ELECTRIC_CONSUMPTION_YEAR,
+    "heating": WKHPTag.HEATING_ENERGY_PRODUCTION_YEAR,
+    "warmwater": WKHPTag.HOT_WATER_ENERGY_PRODUCTION_YEAR,
+    "pool": WKHPTag.POOL_ENERGY_PRODUCTION_YEAR,
+}
+
+ENERGY_DATE_TAGS: Final = [WKHPTag.DATE_YEAR, WKHPTag.DATE_MONTH]
+
+
+def monthly_tag(key: str, month: int) -> WKHPTag:
+    return WKHPTag[f"{ENERGY_MONTHLY_TAG_PREFIXES[key]}{month:02d}"]
+
+
+def monthly_tags(months) -> list:
+    """the registers of all ENERGY_MONTHLY_TAG_PREFIXES of the given monthly slots"""
+    return [monthly_tag(a_key, a_month) for a_month in months for a_key in ENERGY_MONTHLY_TAG_PREFIXES]
+
+
+def month_key(year: int, month: int) -> str:
+    return f"{year:04d}-{month:02d}"
+
+
+def slot_year(heatpump_year: int, heatpump_month: int, month: int) -> int:
+    """the monthly registers are a rolling window - all months after the current one are from the last year"""
+    return heatpump_year if month <= heatpump_month else heatpump_year - 1
+
+
+class WKHPEnergyHistory:
+    """the monthly & yearly energy balance of the heatpump - persisted in the HA storage and read from
+    the waterkotte only once per day (or when the month of the heatpump has changed)"""
+
+    def __init__(self, hass: HomeAssistant, coordinator, entry_id: str):
+        self._hass = hass
+        self._coordinator = coordinator
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.energy_history.{entry_id}")
+        self._data = None
+        # the periodic check & the services must not read the energy registers at the same time
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def data(self) -> dict | None:
+        return self._data
+
+    @property
+    def heatpump_year(self) -> int | None:
+        return self._data.get("heatpump_year") if self._data is not None else None
+
+    @property
+    def heatpump_month(self) -> int | None:
+        return self._data.get("heatpump_month") if self._data is not None else None
+
+    async def async_load(self):
+        self._data = await self._store.async_load()
+        if self._data is not None:
+            _LOGGER.debug(f"energy history loaded: {len(self._data.get('months', {}))} months (last refresh: {self._data.get('refreshed')})")
+
+    @callback
+    def async_start(self, config_entry: ConfigEntry):
+        """start the periodic check - returns the function to stop it"""
+        # the first check runs in the background (and will be cancelled, when the entry is unloaded)
+        config_entry.async_create_background_task(self._hass, self.async_refresh_if_due(),
+                                                  f"{DOMAIN}_energy_history_{config_entry.entry_id}")
+        return async_track_time_interval(self._hass, self._async_check_refresh, ENERGY_HISTORY_CHECK_INTERVAL)
+
+    async def _async_check_refresh(self, now=None):
+        await self.async_refresh_if_due()
+
+    def is_refresh_due(self) -> bool:
+        if self._data is None or "refreshed" not in self._data:
+            return True
+
+        refreshed = dt_util.parse_datetime(self._data["refreshed"])
+        if refreshed is None or dt_util.as_local(refreshed).date() != dt_util.now().date():
+            return True
+
+        # the month rollover of the heatpump (when the DATE_MONTH is part of the polled data)
+        if self._coordinator.data is not None:
+            a_month = self._coordinator.data.get(WKHPTag.DATE_MONTH)
+            if a_month is not None and a_month.value is not None and a_month.value != self.heatpump_month:
+                return True
+        return False
+
+    async def async_refresh_if_due(self):
+        async with self._refresh_lock:
+            if self.is_refresh_due():
+                try:
+                    await self._async_refresh()
+                except Exception as exc:
+                    _LOGGER.warning(f"could not refresh the energy history: {exc}")
+
+    async def async_refresh(self):
+        async with self._refresh_lock:
+            await self._async_refresh()
+
+    async def _async_refresh(self):
+        """read the energy registers from the waterkotte and store them - all 12 monthly slots will be only
+        read on the first load or after a month rollover, otherwise only the slot of the current month
+        (together with the year totals & the date of the heatpump)"""
+        full_refresh = self.heatpump_year is None or self.heatpump_month is None
+        tags = list(ENERGY_DATE_TAGS) + list(ENERGY_YEAR_TAGS.values())
+        tags.extend(monthly_tags(range(1, 13) if full_refresh else [self.heatpump_month]))
+        res = await self._async_read_tags(tags)
+
+        heatpump_year = _get_int(res, WKHPTag.DATE_YEAR)
+        heatpump_month = _get_int(res, WKHPTag.DATE_MONTH)
+        if heatpump_year is None or heatpump_month is None:
+            _LOGGER.warning(f"energy history: could not read the date of the heatpump - skipping refresh")
+            return
+        if heatpump_year < 100:
+            heatpump_year = heatpump_year + 2000
+
+        if not full_refresh and (heatpump_year != self.heatpump_year or heatpump_month != self.heatpump_month):
+            # month rollover - the slot of the last month got its final values & the slot of the new month
+            # still holds the values of the last year (and we might have missed more than one month)
+            _LOGGER.debug(f"energy history: month rollover to {month_key(heatpump_year, heatpump_month)} - reading all months")
+            res.update(await self._async_read_tags(monthly_tags(range(1, 13))))
+
+        data = self._data if self._data is not None else {}
+        months = data.setdefault("months", {})
+        for a_month in range(1, 13):
+            values = {}
+            for a_key in ENERGY_MONTHLY_TAG_PREFIXES:
+                a_value = res.get(monthly_tag(a_key, a_month))
+                if a_value is not None and a_value.value is not None:
+                    values[a_key] = a_value.value
+            if len(values) > 0:
+                a_month_key = month_key(slot_year(heatpump_year, heatpump_month, a_month), a_month)
+                months.setdefault(a_month_key, {}).update(values)
+
+        data["year"] = {a_key: res[a_tag].value for a_key, a_tag in ENERGY_YEAR_TAGS.items()
+                        if res.get(a_tag) is not None and res[a_tag].value is not None}
+        data["heatpump_year"] = heatpump_year
+        data["heatpump_month"] = heatpump_month
+        data["refreshed"] = dt_util.now().isoformat()
+        self._data = data
+
+        # the monthly values will be also available in the long-term statistics (only the new or
+        # changed months will be imported)
+        try:
+            async_import_energy_statistics(self._hass, months, data.setdefault("statistics_watermark", {}),
+                                           self._coordinator.serial_id_addon if self._coordinator.is_multi_instances else None)
+        except Exception as exc:
+            _LOGGER.warning(f"could not import the energy statistics: {exc}")
+        await self._store.async_save(data)
+        _LOGGER.debug(f"energy history refreshed: {len(months)} months stored")
+
+    async def _async_read_tags(self, tags: list) -> dict:
+        res = await self._coordinator.async_refresh_tags(tags)
+        # the waterkotte sometimes does not deliver all values - so we try a second time for the missing ones
+        missing = [a_tag for a_tag in tags if res.get(a_tag) is None or res[a_tag].value is None]
+        if len(missing) > 0:
+            _LOGGER.debug(f"energy history: {len(missing)} values missing - will read them again")
+            res.update(await self._coordinator.async_refresh_tags(missing))
+        return res
+
+    async def async_get_data(self) -> dict | None:
+        """the energy history (will be only read from the waterkotte, if we do not have any data yet)"""
+        async with self._refresh_lock:
+            if self._data is None or "heatpump_year" not in self._data:
+                await self._async_refresh()
+        return self._data
+
+    def get_month(self, month: int, default="unknown") -> dict:
+        """the values of the monthly register slot (1-12) of the current rolling window"""
+        values = {}
+        if self._data is not None and "heatpump_year" in self._data:
+            a_month_key = month_key(slot_year(self.heatpump_year, self.heatpump_month, month), month)
+            values = self._data.get("months", {}).get(a_month_key, {})
+        return {a_key: values.get(a_key, default) for a_key in ENERGY_MONTHLY_TAG_PREFIXES}
+
+    def get_year(self, default="unknown") -> dict:
+        values = self._data.get("year", {}) if self._data is not None else {}
+        return {a_key: values.get(a_key, default) for a_key in ENERGY_YEAR_TAGS}
+
+
+def _get_int(values: dict, tag: WKHPTag) -> int | None:
+    a_tag_value = values.get(tag)
+    if a_tag_value is None or a_tag_value.value is None:
+        return None
+    try:
+        return int(a_tag_value.value)
+    except (TypeError, ValueError):
+        return None
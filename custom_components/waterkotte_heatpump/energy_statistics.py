@@ -0,0 +1,100 @@
+import logging
+from datetime import date
+from typing import Final
+
+from homeassistant.components.recorder.models import StatisticMeanType
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# the monthly values of the energy history that will be imported as external statistics (key -> name)
+ENERGY_STATISTICS: Final = {
+    "compressor": "Electric consumption compressor",
+    "sourcepump": "Electric consumption source pump",
+    "externalheater": "Electric consumption external heater",
+    "heating": "Energy production heating",
+    "warmwater": "Energy production warm water",
+    "pool": "Energy production pool",
+    "cop": "COP heatpump",
+}
+# the COP is a mean value - all others are energy values (that will be summed up)
+MEAN_STATISTICS: Final = {"cop"}
+
+
+def statistic_id(id_addon: str, key: str) -> str:
+    if id_addon is not None and len(id_addon) > 0:
+        return f"{DOMAIN}:{id_addon}_monthly_{key}".lower()
+    return f"{DOMAIN}:monthly_{key}"
+
+
+def _month_start(a_month_key: str):
+    a_year, a_month = a_month_key.split("-")
+    return dt_util.as_utc(dt_util.start_of_local_day(date(int(a_year), int(a_month), 1)))
+
+
+def _metadata(id_addon: str, key: str) -> dict:
+    is_mean = key in MEAN_STATISTICS
+    return {
+        "source": DOMAIN,
+        "statistic_id": statistic_id(id_addon, key),
+        "name": f"Waterkotte {ENERGY_STATISTICS[key]} (monthly)",
+        "unit_of_measurement": None if is_mean else UnitOfEnergy.KILO_WATT_HOUR,
+        "unit_class": None if is_mean else "energy",
+        "mean_type": StatisticMeanType.ARITHMETIC if is_mean else StatisticMeanType.NONE,
+        "has_sum": not is_mean,
+    }
+
+
+def async_import_energy_statistics(hass: HomeAssistant, months: dict, watermark: dict, id_addon: str = None) -> int:
+    """import the monthly values as external statistics into the recorder - only the months that are new
+    or have been changed since the last import (the 'watermark') will be written. Returns the number of
+    imported values (the watermark will be updated in place)"""
+    if "recorder" not in hass.config.components:
+        _LOGGER.debug(f"recorder not available - skipping import of the energy statistics")
+        return 0
+
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    imported = 0
+    month_keys = sorted(months.keys())
+    for a_key in ENERGY_STATISTICS:
+        key_watermark = watermark.setdefault(a_key, {})
+
+        # the first month that is not part of the last import (or has been changed since then) - since the
+        # sum of all later months depends on this value, all following months must be written again
+        first_changed = None
+        for idx, a_month_key in enumerate(month_keys):
+            a_value = months[a_month_key].get(a_key)
+            if a_value is not None and key_watermark.get(a_month_key) != a_value:
+                first_changed = idx
+                break
+        if first_changed is None:
+            continue
+
+        statistics = []
+        a_sum = 0.0
+        for idx, a_month_key in enumerate(month_keys):
+            a_value = months[a_month_key].get(a_key)
+            if a_value is None:
+                continue
+            if a_key not in MEAN_STATISTICS:
+                a_sum = a_sum + float(a_value)
+            if idx < first_changed:
+                continue
+
+            if a_key in MEAN_STATISTICS:
+                statistics.append({"start": _month_start(a_month_key), "mean": a_value, "min": a_value, "max": a_value})
+            else:
+                statistics.append({"start": _month_start(a_month_key), "state": a_value, "sum": a_sum})
+            key_watermark[a_month_key] = a_value
+
+        if len(statistics) > 0:
+            async_add_external_statistics(hass, _metadata(id_addon, a_key), statistics)
+            imported = imported + len(statistics)
+
+    _LOGGER.debug(f"imported {imported} monthly energy statistics")
+    return imported
@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import WKHPDataUpdateCoordinator, WKHPBaseEntity
 from .const import DOMAIN, NUMBER_SENSORS, ExtNumberEntityDescription
-from .const_gen import NUMBER_SENSORS_GENERATED
+from .const_gen import get_generated_descriptions
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
         entity = WKHPNumber(coordinator, description)
         entities.append(entity)
     if coordinator.add_schedule_entities:
-        for description in NUMBER_SENSORS_GENERATED:
+        for description in get_generated_descriptions(Platform.NUMBER):
             entity = WKHPNumber(coordinator, description)
             entities.append(entity)
     add_entity_cb(entities)
@@ -35,7 +35,7 @@ class WKHPNumber(WKHPBaseEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         try:
-            value = self.coordinator.data[self.wkhp_tag]["value"]
+            value = self.coordinator.data[self.wkhp_tag].value
             if value is None or value == "":
                 return "unknown"
             if str(self.wkhp_tag.name).upper().endswith("_ADJUST"):
@@ -1,8 +1,10 @@
 import asyncio
 import logging
 import re
+import time
 import xml.etree.ElementTree as ElemTree
 from datetime import datetime
+from urllib.parse import urlencode
 from typing import (
     Any,
     Sequence,
@@ -11,6 +13,8 @@ from typing import (
     Collection
 )
 
+import aiohttp
+
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.const import (
     ECOTOUCH,
     EASYCON,
@@ -24,21 +28,156 @@ from custom_components.waterkotte_heatpump.pywaterkotte_ha.error import (
     InvalidValueException,
     StatusException,
     TooManyUsersException,
+    PartialWriteException,
     Http404Exception, InvalidPasswordException
 )
-from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.metrics import BridgeMetrics, RequestCounter
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.schedule_model import WKHPSchedule, schedule_tags
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import (
+    WKHPTag,
+    TagValue,
+    RAW_TAG_INDEX,
+    FLOAT_PAIR_TAGS,
+    decode_float_pairs
+)
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# a single record of a readTags/writeTags response looks like '#A1\tS_OK\n192\t8.03' - the second
+# line (opt-code & value) can be missing (e.g. for '#I4711\tE_INACTIVETAG')
+_TAG_RECORD_PATTERN = re.compile(
+    r"^#(?P<tag>[^\t\r\n]+)\t(?P<status>[A-Z_]+)\r?(?:\n(?P<opt>\d+)\t(?P<value>[^\r\n]*))?",
+    re.MULTILINE
+)
+_TAG_VALUE_PATTERN = re.compile(r"[-+]?(?:\d*\.?\d+)")
+
+# seconds to wait before we re-request chunks that have been rejected with '#E_TOO_MANY_USERS'
+PARALLEL_REQUESTS_BACKOFF_DELAY = 2
+
+# settings of the own connection pool - the CGI server of the waterkotte is tiny and handles the
+# connection setup badly, so we keep the connections (of a poll) alive and reuse them
+WEB_SESSION_KEEPALIVE_TIMEOUT = 15
+WEB_SESSION_DNS_CACHE_TTL = 300
+WEB_SESSION_REQUEST_TIMEOUT = 30
+
+# the CGI of the waterkotte does not accept more tags in a single readTags request
+MAX_TAGS_PER_REQUEST = 75
+
+# number of different read plans (e.g. 'fast' tags only, 'fast' + 'slow' tags, all tags) we keep
+MAX_CACHED_READ_PLANS = 8
+
+# easycon: registers of the same type will be requested in a single window as long as the gap between
+# two requested registers is not larger than EASYCON_MAX_WINDOW_GAP and the window does not exceed
+# EASYCON_MAX_WINDOW_SIZE registers - a single xml.cgi request contains up to EASYCON_MAX_WINDOWS_PER_REQUEST
+# windows ('D|1|5|D|100|120|A|1|40')
+EASYCON_MAX_WINDOW_GAP = 16
+EASYCON_MAX_WINDOW_SIZE = 128
+EASYCON_MAX_WINDOWS_PER_REQUEST = 8
+EASYCON_REGISTER_TYPES = {"D": "DIGITAL", "A": "ANALOG", "I": "INTEGER"}
+EASYCON_REGISTER_TAGS = {value: key for key, value in EASYCON_REGISTER_TYPES.items()}
+# size of the chunks in which the xml.cgi response will be fed into the parser
+EASYCON_XML_CHUNK_SIZE = 8192
+
+_RAW_TAG_SORT_PATTERN = re.compile(r"^(?P<prefix>.*?)(?P<number>\d+)$")
+
+
+def _raw_tag_sort_key(raw_tag: str):
+    # 'A2' should be requested before 'A10' (and '3:HREG400418' is sorted by its number too)
+    match = _RAW_TAG_SORT_PATTERN.match(raw_tag)
+    if match is None:
+        return raw_tag, -1
+    return match.group("prefix"), int(match.group("number"))
+
+
+def _is_easycon_register(raw_tag: str) -> bool:
+    return raw_tag[0] in EASYCON_REGISTER_TYPES and raw_tag[1:].isdigit()
+
+
+def _plan_register_windows(indexes: Sequence[int]) -> List[Tuple[int, int]]:
+    """group the (sorted) register indexes into tight [start, end] windows"""
+    windows = []
+    for index in indexes:
+        if len(windows) > 0:
+            start, end = windows[-1]
+            if index - end <= EASYCON_MAX_WINDOW_GAP and index - start < EASYCON_MAX_WINDOW_SIZE:
+                windows[-1] = (start, index)
+                continue
+        windows.append((index, index))
+    return windows
+
+
+def _plan_easycon_requests(raw_tags: Sequence[str]) -> List[Tuple[str, List[str]]]:
+    """create the 'D|1|5|A|1|100|...' queries (and the tags they contain) of the xml.cgi requests"""
+    indexes_per_type = {}
+    for a_raw_tag in raw_tags:
+        if _is_easycon_register(a_raw_tag):
+            indexes_per_type.setdefault(a_raw_tag[0], set()).add(int(a_raw_tag[1:]))
+        else:
+            _LOGGER.debug(f"Tag: '{a_raw_tag}' can't be read from easycon")
+
+    segments = []
+    for a_type in EASYCON_REGISTER_TYPES:
+        if a_type in indexes_per_type:
+            indexes = sorted(indexes_per_type[a_type])
+            for start, end in _plan_register_windows(indexes):
+                segment_tags = [f"{a_type}{index}" for index in indexes if start <= index <= end]
+                segments.append((f"{a_type}|{start}|{end}", segment_tags))
+
+    requests = []
+    for idx in range(0, len(segments), EASYCON_MAX_WINDOWS_PER_REQUEST):
+        request_segments = segments[idx:idx + EASYCON_MAX_WINDOWS_PER_REQUEST]
+        query = "|".join(a_segment for a_segment, _ in request_segments)
+        tags = [a_tag for _, segment_tags in request_segments for a_tag in segment_tags]
+        requests.append((query, tags))
+    return requests
+
+
+class ReadPlan:
+    """precompiled layout of all the readTags requests that are required to read a list of WKHPTags"""
+
+    def __init__(self, wkhp_tags: Sequence[WKHPTag], tags_per_request: int, unknown_raw_tags: Collection[str] = ()):
+        self.wkhp_tags = tuple(wkhp_tags)
+
+        # the unique raw tags of all WKHPTags (the global RAW_TAG_INDEX maps them back to their WKHPTags)
+        raw_tags = {a_raw_tag for a_wkhp_tag in self.wkhp_tags for a_raw_tag in a_wkhp_tag.tags}
+
+        # the raw tags that are not known by the waterkotte will not be requested (their result is always
+        # 'E_NOTFOUND')
+        self.unknown_raw_tags = tuple(sorted(raw_tags.intersection(unknown_raw_tags), key=_raw_tag_sort_key))
+        self.raw_tags = sorted(raw_tags.difference(unknown_raw_tags), key=_raw_tag_sort_key)
+        self.chunks = [tuple(self.raw_tags[idx:idx + tags_per_request])
+                       for idx in range(0, len(self.raw_tags), tags_per_request)]
+
+        # the 'n=x&t1=..&tx=..' part of the query is the same for every poll - only the '_' timestamp
+        # must be added when the request is made
+        self.queries = {}
+        for a_chunk in self.chunks:
+            args = {"n": len(a_chunk)}
+            for idx, a_raw_tag in enumerate(a_chunk):
+                args[f"t{(idx + 1)}"] = a_raw_tag
+            self.queries[a_chunk] = urlencode(args, safe=":")
+
+        # the (query, tags) of the xml.cgi requests - will be created by the EasyconBridge on first use
+        self.easycon_requests = None
+
 
 class WaterkotteClient:
     def __init__(self, host: str, username: str, pwd: str, system_type: str, web_session,
-                 tags: list, tags_per_request: int, lang: str = "en") -> None:
+                 tags: list, tags_per_request: int, max_parallel_requests: int = 1, lang: str = "en") -> None:
         self._host = host
         self._systemType = system_type
+        # when no web_session is provided, the client will use its own connection pool (that must be
+        # closed via 'close()')
+        self._own_web_session = web_session is None
+        if self._own_web_session:
+            web_session = self._create_web_session(max_parallel_requests)
+        self._web_session = web_session
+        # the pending read (future) of each raw tag
+        self._in_flight_reads = {}
         if system_type == ECOTOUCH:
             self._internal_client = EcotouchBridge(host=host, web_session=web_session, username=username,
-                                                   pwd=pwd, tags_per_request=tags_per_request, lang=lang)
+                                                   pwd=pwd, tags_per_request=tags_per_request,
+                                                   max_parallel_requests=max_parallel_requests, lang=lang)
         elif system_type == EASYCON:
             self._internal_client = EasyconBridge(host=host, web_session=web_session)
         else:
@@ -56,23 +195,63 @@ class WaterkotteClient:
         if tags is not None:
             _LOGGER.info(f"number of tags to query set to: {len(tags)}")
         self.__tags = tags
+        if hasattr(self._internal_client, "invalidate_read_plans"):
+            self._internal_client.invalidate_read_plans()
+
+    @property
+    def metrics(self) -> BridgeMetrics:
+        return self._internal_client.metrics
+
+    def _create_web_session(self, max_parallel_requests: int) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=max(1, max_parallel_requests),
+            keepalive_timeout=WEB_SESSION_KEEPALIVE_TIMEOUT,
+            use_dns_cache=True,
+            ttl_dns_cache=WEB_SESSION_DNS_CACHE_TTL
+        )
+
+        # counting the new & reused connections
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+        # the waterkotte is usually accessed via its IP - so the cookie jar must accept cookies from IPs
+        return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.CookieJar(unsafe=True),
+                                     timeout=aiohttp.ClientTimeout(total=WEB_SESSION_REQUEST_TIMEOUT),
+                                     trace_configs=[trace_config])
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        self.metrics.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, trace_config_ctx, params):
+        self.metrics.connections_reused += 1
+
+    async def close(self) -> None:
+        """close the own connection pool (if any)"""
+        if self._own_web_session and not self._web_session.closed:
+            await self._web_session.close()
 
     async def login(self) -> None:
         if self._internal_client.auth_cookies is None:
+            self.metrics.logins += 1
             try:
                 await self._internal_client.login()
 
             except TooManyUsersException:
+                self.metrics.login_failures += 1
                 _LOGGER.warning(f"TooManyUsers while try to login - will just sleep 30sec")
                 await asyncio.sleep(30)
 
             except Exception as exc:  # pylint: disable=broad-except
+                self.metrics.login_failures += 1
                 _LOGGER.error(f"Error while login will retry in 15sec: {exc}")
                 await asyncio.sleep(15)
                 await self._internal_client.logout()
                 try:
+                    self.metrics.logins += 1
                     await self._internal_client.login()
                 except Exception as exc2:
+                    self.metrics.login_failures += 1
                     _LOGGER.error(f"Error while RETRY login: {exc2}")
 
     async def logout(self) -> None:
@@ -80,36 +259,115 @@ class WaterkotteClient:
 
     async def async_get_data(self) -> dict:
         if self.tags is not None:
-            res = await self._internal_client.read_values(self.tags)
+            res = await self._read_values_single_flight(self.tags)
             return res
 
     async def async_read_values(self, tags: Sequence[WKHPTag]) -> dict:
-        res = await self._internal_client.read_values(tags)
+        res = await self._read_values_single_flight(tags)
         return res
 
     async def async_read_value(self, tag: WKHPTag) -> dict:
-        res = await self._internal_client.read_value(tag)
-        return res
+        res = await self._read_values_single_flight([tag])
+        return res.get(tag)
+
+    async def async_read_schedule(self, schedule_type: str) -> WKHPSchedule:
+        """read a complete schedule (all fields of all 7 days) - independent of the configured tags_per_request
+        the schedule will be read with requests of up to MAX_TAGS_PER_REQUEST tags: that are 2 readTags
+        requests for the 119 tags of e.g. the SCHEDULE_HEATING (and a single one for SOLAR & PV)"""
+        res = await self._read_values_single_flight(schedule_tags(schedule_type), MAX_TAGS_PER_REQUEST)
+        return WKHPSchedule(schedule_type, res)
+
+    async def _read_values_single_flight(self, tags: Sequence[WKHPTag], tags_per_request: int = None) -> dict:
+        """read the values of the given WKHPTags - all WKHPTags whose raw tags are already requested by
+        another (concurrent) read will not be requested again, instead we wait for the result of that read"""
+        new_tags = []
+        shared_tags = []
+        shared_reads = set()
+        for a_tag in tags:
+            pending_reads = [self._in_flight_reads.get(a_raw_tag) for a_raw_tag in a_tag.tags]
+            if len(pending_reads) == 0 or None in pending_reads:
+                new_tags.append(a_tag)
+            else:
+                shared_tags.append(a_tag)
+                shared_reads.update(pending_reads)
+
+        result = {}
+        if len(new_tags) > 0:
+            raw_tags = {a_raw_tag for a_tag in new_tags for a_raw_tag in a_tag.tags}
+            pending_read = asyncio.get_running_loop().create_future()
+            for a_raw_tag in raw_tags:
+                self._in_flight_reads[a_raw_tag] = pending_read
+            try:
+                res = await self._internal_client.read_values(new_tags, tags_per_request)
+                pending_read.set_result(res)
+            except BaseException as exc:
+                pending_read.set_exception(exc)
+                # mark the exception as retrieved (there might be no other reader waiting for it)
+                pending_read.exception()
+                raise
+            finally:
+                for a_raw_tag in raw_tags:
+                    if self._in_flight_reads.get(a_raw_tag) is pending_read:
+                        del self._in_flight_reads[a_raw_tag]
+            result.update(res)
+
+        if len(shared_tags) > 0:
+            _LOGGER.debug(f"{len(shared_tags)} tags will be taken from {len(shared_reads)} pending read(s)")
+            self.metrics.shared_reads += len(shared_tags)
+            shared_results = await asyncio.gather(*shared_reads)
+            missing_tags = []
+            for a_tag in shared_tags:
+                for a_shared_result in shared_results:
+                    if a_tag in a_shared_result:
+                        result[a_tag] = a_shared_result[a_tag]
+                        break
+                else:
+                    # the raw tags have been read, but the WKHPTag itself was not part of the other read
+                    missing_tags.append(a_tag)
+            if len(missing_tags) > 0:
+                # ... so they can be decoded from the raw records of that read (without another request)
+                result.update(self._internal_client.decode_last_raw_records(missing_tags))
+
+        return result
 
     async def async_write_value(self, tag: WKHPTag, value):
         res = await self._internal_client.write_value(tag, value)
         return res
 
-    async def async_write_values(self, kv_pairs: Collection[Tuple[WKHPTag, Any]]):
-        res = await self._internal_client.write_values(kv_pairs)
+    async def async_write_values(self, kv_pairs: Collection[Tuple[WKHPTag, Any]], skip_unchanged: bool = False,
+                                 skipped_tags: set = None):
+        res = await self._internal_client.write_values(kv_pairs, skip_unchanged=skip_unchanged, skipped_tags=skipped_tags)
         return res
 
+    def get_raw_records(self) -> dict:
+        return self._internal_client.get_raw_records()
+
+    def restore_raw_records(self, tags: Sequence[WKHPTag], raw_records: dict) -> dict:
+        return self._internal_client.restore_raw_records(tags, raw_records)
+
 
 #
 class EcotouchBridge:
     auth_cookies = None
 
-    def __init__(self, host: str, web_session, username: str ="waterkotte", pwd: str = "waterkotte", tags_per_request: int = 10, lang: str = "en"):
+    def __init__(self, host: str, web_session, username: str ="waterkotte", pwd: str = "waterkotte", tags_per_request: int = 10,
+                 max_parallel_requests: int = 1, lang: str = "en"):
         self.host = host
         self.username = username
         self.pwd = pwd
         self.web_session = web_session
-        self.tags_per_request = min(tags_per_request, 75)
+        self.tags_per_request = min(tags_per_request, MAX_TAGS_PER_REQUEST)
+        self.max_parallel_requests = max(1, max_parallel_requests)
+        self._in_flight_limit = self.max_parallel_requests
+        self._login_lock = asyncio.Lock()
+        self._read_plans = {}
+        # the last raw (value, status) of each tag & the last decoded result of each WKHPTag
+        self._last_raw_records = {}
+        self._decoded_values = {}
+        self._dirty_tags = set()
+        # the raw tags of the ALARM_BITS that are not known by the waterkotte
+        self._unknown_raw_tags = set()
+        self.metrics = BridgeMetrics()
         self.lang_map = None
         if lang in TRANSLATIONS:
             self.lang_map = TRANSLATIONS[lang]
@@ -188,56 +446,106 @@ class EcotouchBridge:
             return res[tag]
         return None
 
-    async def read_values(self, tags: Sequence[WKHPTag]):
+    def get_read_plan(self, tags: Sequence[WKHPTag], tags_per_request: int = None) -> ReadPlan:
+        """return the (cached) read plan for the given list of WKHPTags"""
+        if tags_per_request is None:
+            tags_per_request = self.tags_per_request
+        key = (tuple(tags), tags_per_request)
+        plan = self._read_plans.get(key)
+        if plan is None:
+            if len(self._read_plans) >= MAX_CACHED_READ_PLANS:
+                # drop the oldest plan
+                del self._read_plans[next(iter(self._read_plans))]
+            plan = ReadPlan(key[0], tags_per_request, self._unknown_raw_tags)
+            self._read_plans[key] = plan
+            _LOGGER.debug(f"new read plan: {len(plan.wkhp_tags)} WKHPTags -> {len(plan.raw_tags)} tags in {len(plan.chunks)} requests")
+        return plan
+
+    def invalidate_read_plans(self):
+        self._read_plans.clear()
+
+    def _add_unknown_raw_tag(self, raw_tag: str):
+        """the raw tag will not be requested anymore (the WKHPTags are immutable, so the unknown raw tags
+        are excluded by the read plans)"""
+        if raw_tag not in self._unknown_raw_tags:
+            self._unknown_raw_tags.add(raw_tag)
+            # the read plans must be rebuild without the unknown raw tag
+            self.invalidate_read_plans()
+            for a_wkhp_tag in RAW_TAG_INDEX.get(raw_tag, ()):
+                self._decoded_values.pop(a_wkhp_tag, None)
+            _LOGGER.info(f"Tag: '{raw_tag}' not found in response - will not request it again")
+
+    async def read_values(self, tags: Sequence[WKHPTag], tags_per_request: int = None):
         if self.auth_cookies is None:
             await self.login()
 
         """Async read values"""
-        # create flat list of ecotouch tags to be read
-        e_tags = list(set([etag for tag in tags for etag in tag.tags]))
-        e_values, e_status = await self._read_tags(e_tags)
+        poll_start = time.perf_counter()
+        counter = RequestCounter()
+
+        plan = self.get_read_plan(tags, tags_per_request)
+        e_values, e_status = await self._read_tags(plan, counter=counter)
+
+        decode_start = time.perf_counter()
+        result = self._decode_results(plan.wkhp_tags, e_values, e_status)
 
+        poll_end = time.perf_counter()
+        self.metrics.decode_time.add((poll_end - decode_start) * 1000)
+        self.metrics.poll_time.add((poll_end - poll_start) * 1000)
+        self.metrics.requests_per_poll.add(counter.requests)
+        self.metrics.retries_per_poll.add(counter.retries)
+        return result
+
+    def get_raw_records(self) -> dict:
+        """the last raw (value, status) of each tag - e.g. to persist a snapshot"""
+        return dict(self._last_raw_records)
+
+    def restore_raw_records(self, tags: Sequence[WKHPTag], raw_records: dict) -> dict:
+        """decode the given WKHPTags from previously persisted raw (value, status) records (without any
+        request) - these records will be the base for the next read"""
+        e_values = {a_tag: a_record[0] for a_tag, a_record in raw_records.items()}
+        e_status = {a_tag: a_record[1] for a_tag, a_record in raw_records.items()}
+        return self._decode_results(tags, e_values, e_status)
+
+    def decode_last_raw_records(self, tags: Sequence[WKHPTag]) -> dict:
+        """decode the given WKHPTags from the last read raw records (without any request)"""
+        raw_records = {a_raw_tag: self._last_raw_records[a_raw_tag] for a_tag in tags for a_raw_tag in a_tag.tags
+                       if a_raw_tag in self._last_raw_records}
+        return self.restore_raw_records(tags, raw_records)
+
+    def _decode_results(self, wkhp_tags: Sequence[WKHPTag], e_values: dict, e_status: dict) -> dict:
         result = {}
         if e_values is not None and len(e_values) > 0:
-            for a_wphp_tag in tags:
+            # all WKHPTags that make use of a raw tag, that has been changed since the last
+            # read, must be decoded again - all other WKHPTags can reuse their last result
+            for a_tag, a_value in e_values.items():
+                raw_record = (a_value, e_status.get(a_tag))
+                if self._last_raw_records.get(a_tag) != raw_record:
+                    self._last_raw_records[a_tag] = raw_record
+                    self._dirty_tags.update(RAW_TAG_INDEX.get(a_tag, ()))
+
+            float_pair_tags = []
+            float_pair_values = []
+            for a_wphp_tag in wkhp_tags:
+                if a_wphp_tag not in self._dirty_tags and a_wphp_tag in self._decoded_values:
+                    if all(a_tag in e_values for a_tag in a_wphp_tag.tags):
+                        result[a_wphp_tag] = self._decoded_values[a_wphp_tag]
+                        continue
+
+                t_values = None
+                t_states = None
                 try:
                     t_values = [e_values[a_tag] for a_tag in a_wphp_tag.tags]
                     t_states = [e_status[a_tag] for a_tag in a_wphp_tag.tags]
+                    if a_wphp_tag in FLOAT_PAIR_TAGS and None not in t_values:
+                        # will be decoded together with all other float pairs (see below)
+                        float_pair_tags.append(a_wphp_tag)
+                        float_pair_values.append(t_values)
+                        continue
 
-                    if t_values is None or (len(t_values) > 0 and t_values[0] is None):
-                        if t_states is not None and len(t_states)>0:
-                            result[a_wphp_tag] = {
-                                "value": None,
-                                "status": t_states[0]
-                            }
-                        else:
-                            result[a_wphp_tag] = None
-                    else:
-                        if a_wphp_tag.decode_f == WKHPTag._decode_alarms:
-                            result[a_wphp_tag] = {
-                                "value": a_wphp_tag.decode_f(a_wphp_tag, t_values, self.lang_map),
-                                "status": t_states[0]
-                            }
-                        else:
-                            result[a_wphp_tag] = {
-                                "value": a_wphp_tag.decode_f(a_wphp_tag, t_values),
-                                "status": t_states[0]
-                            }
-
-                        if a_wphp_tag.translate and a_wphp_tag.tags[0] in self.lang_map:
-                            value_map = self.lang_map[a_wphp_tag.tags[0]]
-                            final_value = ""
-                            temp_values = result[a_wphp_tag]["value"]
-                            if temp_values is not None:
-                                for idx in range(len(temp_values)):
-                                    if temp_values[idx]:
-                                        final_value = final_value + ", " + str(value_map[idx])
-
-                                # we need to trim the firsts initial added ', '
-                                if len(final_value) > 0:
-                                    final_value = final_value[2:]
-
-                                result[a_wphp_tag]["value"] = final_value
+                    result[a_wphp_tag] = self._decode_values(a_wphp_tag, t_values, t_states)
+                    self._decoded_values[a_wphp_tag] = result[a_wphp_tag]
+                    self._dirty_tags.discard(a_wphp_tag)
 
                 except KeyError:
                     _LOGGER.warning(
@@ -247,109 +555,228 @@ class EcotouchBridge:
                         f"Exception of type '{other_exc}' while read_values. EcoTag: {a_wphp_tag} t_values: {t_values} t_states: {t_states} -> {other_exc}"
                     )
 
+            if len(float_pair_tags) > 0:
+                self._decode_float_pair_values(float_pair_tags, float_pair_values, e_status, result)
         return result
 
-    async def _read_tags(self, tags: Sequence[WKHPTag], results=None, results_status=None):
+    def _decode_float_pair_values(self, float_pair_tags: List[WKHPTag], float_pair_values: List[List[str]],
+                                  e_status: dict, result: dict):
+        try:
+            floats = decode_float_pairs(float_pair_values)
+        except Exception as other_exc:
+            # fallback: decode the tags one by one (so only the tags with invalid values will be skipped)
+            _LOGGER.debug(f"could not decode {len(float_pair_tags)} float pairs in a single pass: {other_exc}")
+            floats = []
+            for a_wphp_tag, t_values in zip(float_pair_tags, float_pair_values):
+                try:
+                    floats.append(a_wphp_tag.decode_f(a_wphp_tag, t_values))
+                except Exception as decode_exc:
+                    _LOGGER.error(
+                        f"Exception of type '{decode_exc}' while read_values. EcoTag: {a_wphp_tag} t_values: {t_values} -> {decode_exc}"
+                    )
+                    floats.append(decode_exc)
+
+        for a_wphp_tag, a_float in zip(float_pair_tags, floats):
+            if isinstance(a_float, Exception):
+                continue
+            result[a_wphp_tag] = TagValue(a_float, e_status[a_wphp_tag.tags[0]])
+            self._decoded_values[a_wphp_tag] = result[a_wphp_tag]
+            self._dirty_tags.discard(a_wphp_tag)
+
+    def _decode_values(self, a_wphp_tag: WKHPTag, t_values: List[str], t_states: List[str]):
+        if t_values is None or (len(t_values) > 0 and t_values[0] is None):
+            if t_states is not None and len(t_states) > 0:
+                return TagValue(None, t_states[0])
+            return None
+
+        if a_wphp_tag.decode_f == WKHPTag._decode_alarms:
+            decoded = TagValue(a_wphp_tag.decode_f(a_wphp_tag, t_values, self.lang_map), t_states[0])
+        else:
+            decoded = TagValue(a_wphp_tag.decode_f(a_wphp_tag, t_values), t_states[0])
+
+        if a_wphp_tag.translate and a_wphp_tag.tags[0] in self.lang_map:
+            value_map = self.lang_map[a_wphp_tag.tags[0]]
+            final_value = ""
+            temp_values = decoded.value
+            if temp_values is not None:
+                for idx in range(len(temp_values)):
+                    if temp_values[idx]:
+                        final_value = final_value + ", " + str(value_map[idx])
+
+                # we need to trim the firsts initial added ', '
+                if len(final_value) > 0:
+                    final_value = final_value[2:]
+
+                decoded.value = final_value
+
+        return decoded
+
+    async def _read_tags(self, plan: ReadPlan, results=None, results_status=None, counter: RequestCounter = None):
+        if counter is None:
+            counter = RequestCounter()
         if results is None:
             results = {}
         if results_status is None:
             results_status = {}
 
-        max_read_tags = self.tags_per_request
-        while len(tags) > max_read_tags:
-            results, results_status = await self._read_tags(tags[:max_read_tags], results, results_status)
-            tags = tags[max_read_tags:]
+        chunks = plan.chunks
 
-        args = {}
-        args["n"] = len(tags)
-        for i in range(len(tags)):
-            args[f"t{(i + 1)}"] = tags[i]
+        if self._in_flight_limit > 1 and len(chunks) > 1:
+            semaphore = asyncio.Semaphore(self._in_flight_limit)
+            chunks_done = await asyncio.gather(
+                *[self._read_tags_chunk_limited(semaphore, a_chunk, plan.queries[a_chunk], results, results_status,
+                                                counter) for a_chunk in chunks]
+            )
+            failed_chunks = [a_chunk for a_chunk, done in zip(chunks, chunks_done) if not done]
+            if len(failed_chunks) > 0:
+                # the waterkotte does not like our parallel requests - so we reduce the number of
+                # requests in flight and read the missing chunks one after another
+                self._in_flight_limit = max(1, self._in_flight_limit // 2)
+                _LOGGER.info(f"TooManyUsers response for {len(failed_chunks)} parallel requests - reducing number of parallel requests to {self._in_flight_limit}")
+                await asyncio.sleep(PARALLEL_REQUESTS_BACKOFF_DELAY)
+                self.metrics.retries += len(failed_chunks)
+                counter.retries += len(failed_chunks)
+                for a_chunk in failed_chunks:
+                    if not await self._read_tags_chunk(a_chunk, plan.queries[a_chunk], results, results_status, counter):
+                        raise TooManyUsersException("TOO_MANY_USERS")
+
+            elif self._in_flight_limit < self.max_parallel_requests:
+                # all fine - slowly increase the number of parallel requests again
+                self._in_flight_limit = self._in_flight_limit + 1
+        else:
+            for a_chunk in chunks:
+                if not await self._read_tags_chunk(a_chunk, plan.queries[a_chunk], results, results_status, counter):
+                    raise TooManyUsersException("TOO_MANY_USERS")
+
+            if self._in_flight_limit < self.max_parallel_requests:
+                # all fine - the next poll will probe the parallel requests again (after a TooManyUsers
+                # period the limit could be 1 - and without this, we would never leave the serial mode)
+                self._in_flight_limit = self._in_flight_limit + 1
+
+        self._set_unknown_raw_tags_results(plan, results, results_status)
+        return results, results_status
+
+    @staticmethod
+    def _set_unknown_raw_tags_results(plan: ReadPlan, results: dict, results_status: dict):
+        for a_raw_tag in plan.unknown_raw_tags:
+            results_status[a_raw_tag] = "E_NOTFOUND"
+            results[a_raw_tag] = None
+
+    async def _read_tags_chunk_limited(self, semaphore: asyncio.Semaphore, tags: Sequence[str], query: str,
+                                       results: dict, results_status: dict, counter: RequestCounter) -> bool:
+        async with semaphore:
+            return await self._read_tags_chunk(tags, query, results, results_status, counter)
 
+    async def _read_tags_chunk(self, tags: Sequence[str], query: str, results: dict, results_status: dict,
+                               counter: RequestCounter, retry_login: bool = True) -> bool:
+        """read a single chunk of tags - returns False, if the waterkotte responded with TOO_MANY_USERS"""
         # also the readTags have a timestamp in each request...
-        args["_"] = str(int(round(datetime.now().timestamp() * 1000)))
-        _LOGGER.info(f"going to request {args['n']} tags in a single call from waterkotte@{self.host}")
-        async with self.web_session.get(f"http://{self.host}/cgi/readTags", params=args) as response:
+        timestamp = str(int(round(datetime.now().timestamp() * 1000)))
+        used_auth_cookies = self.auth_cookies
+        _LOGGER.info(f"going to request {len(tags)} tags in a single call from waterkotte@{self.host}")
+        self.metrics.requests += 1
+        counter.requests += 1
+        self.metrics.tags_per_request.add(len(tags))
+        request_start = time.perf_counter()
+        async with self.web_session.get(f"http://{self.host}/cgi/readTags?{query}&_={timestamp}") as response:
             try:
                 response.raise_for_status()
                 if response.status == 200:
                     _LOGGER.debug(f"requested: {response.url}")
                     content = await response.text()
+                    self.metrics.request_time.add((time.perf_counter() - request_start) * 1000)
 
                     # faking READING 3:HREG values... [DEBUG ONLY]
                     # content = content.replace('\n4\t', '\n192\t52')
 
                     if content.startswith("#E_NEED_LOGIN"):
-                        try:
-                            await self.login()
-                            return await self._read_tags(tags=tags, results=results, results_status=results_status)
-                        except StatusException as status_exec:
-                            _LOGGER.warning(f"StatusException (_read_tags) while trying to login: {status_exec}")
-                            return None, None
+                        if retry_login:
+                            try:
+                                await self._relogin(used_auth_cookies)
+                                self.metrics.retries += 1
+                                counter.retries += 1
+                                return await self._read_tags_chunk(tags, query, results, results_status, counter,
+                                                                   retry_login=False)
+                            except StatusException as status_exec:
+                                _LOGGER.warning(f"StatusException (_read_tags) while trying to login: {status_exec}")
+                        return True
 
                     if content.startswith("#E_TOO_MANY_USERS"):
-                        return None
+                        return False
 
-                    for tag in tags:
-                        match = re.search(
-                            # rf"#{tag}\t(?P<status>[A-Z_]+)\n\d+\t(?P<value>\-?\d+)",
-                            rf"#{tag}\t(?P<status>[A-Z_]+)\n(?P<opt>\d+)\t(?P<value>[-+]?(?:\d*\.?\d+))",
-                            content,
-                            re.MULTILINE,
-                        )
-                        if match is None:
-                            match = re.search(
-                                rf"#{tag}\t(?P<status>[A-Z_]+)\n(?P<opt>\d+)\t",
-                                content,
-                                re.MULTILINE,
-                            )
-                            if match is None:
-                                # ok let's check for INACTIVETAG...
-                                match = re.search(
-                                    rf"#{tag}\tE_INACTIVETAG",
-                                    content,
-                                    re.MULTILINE,
-                                )
-                                if match is None:
-                                    # special handling for "unknown" tags in the ALARM_BITS field...  [if one of the
-                                    # I2xxx Tags is not known, we're simply going to remove that tag from the tag list]
-                                    if tag in WKHPTag.ALARM_BITS.tags:
-                                        WKHPTag.ALARM_BITS.tags.remove(tag)
-                                        _LOGGER.info(f"Tag: '{tag}' not found in response - removing tag from WKHPTag.ALARM_BITS")
-                                    else:
-                                        _LOGGER.warning(f"Tag: '{tag}' not found in response!")
-                                    results_status[tag] = "E_NOTFOUND"
-                                else:
-                                    results_status[tag] = "E_INACTIVE"
-                            else:
-                                _LOGGER.warning(f"Tag: '{tag}' without value! -> opt-code: {match.group('opt')}")
-                                results_status[tag] = match.group("status")
-
-                            results[tag] = None
-                        else:
-                            results_status[tag] = match.group("status")
-                            results[tag] = match.group("value")
+                    parse_start = time.perf_counter()
+                    self._parse_tags_response(content=content, tags=tags, results=results,
+                                              results_status=results_status, is_read=True)
+                    self.metrics.parse_time.add((time.perf_counter() - parse_start) * 1000)
 
                 else:
                     _LOGGER.warning(f"{response}")
             except Exception as exc:
-                if response is not None and response.status == 500:
-                    self.auth_cookies = None
-                    await self.login()
-                    return await self._read_tags(tags)
+                if response is not None and response.status == 500 and retry_login:
+                    await self._relogin(used_auth_cookies)
+                    self.metrics.retries += 1
+                    counter.retries += 1
+                    return await self._read_tags_chunk(tags, query, results, results_status, counter,
+                                                       retry_login=False)
                 else:
                     _LOGGER.warning(f"{exc}")
 
-        return results, results_status
+        return True
+
+    async def _relogin(self, expired_auth_cookies):
+        async with self._login_lock:
+            # when multiple requests are in flight, only the first one that detects the expired session
+            # should perform the login - all others can simply reuse the new session
+            if self.auth_cookies is None or self.auth_cookies is expired_auth_cookies:
+                self.auth_cookies = None
+                self.metrics.relogins += 1
+                await self.login()
+
+    def _parse_tags_response(self, content: str, tags: Sequence[str], results: dict, results_status: dict,
+                             is_read: bool):
+        """parse all tag records of a readTags/writeTags response in a single pass"""
+        records = {}
+        for match in _TAG_RECORD_PATTERN.finditer(content):
+            # like the previous 're.search()' per tag, the first record of a tag wins
+            records.setdefault(match.group("tag"), match)
+
+        for tag in tags:
+            match = records.get(tag)
+            if match is not None and match.group("opt") is not None:
+                value_match = _TAG_VALUE_PATTERN.match(match.group("value"))
+                results_status[tag] = match.group("status")
+                if value_match is not None:
+                    results[tag] = value_match.group(0)
+                    continue
+
+                _LOGGER.warning(f"Tag: '{tag}' without value! -> opt-code: {match.group('opt')}")
+
+            elif match is not None and match.group("status") == "E_INACTIVETAG":
+                results_status[tag] = "E_INACTIVE"
+
+            else:
+                # special handling for "unknown" tags in the ALARM_BITS field...  [if one of the
+                # I2xxx Tags is not known, we're simply going to remove that tag from the tag list]
+                if is_read and tag in WKHPTag.ALARM_BITS.tags:
+                    self._add_unknown_raw_tag(tag)
+                else:
+                    _LOGGER.warning(f"Tag: '{tag}' not found in response!")
+                results_status[tag] = "E_NOTFOUND"
+
+            results[tag] = None
 
     async def write_value(self, tag, value):
         """Write a value"""
         return await self.write_values([(tag, value)])
 
-    async def write_values(self, kv_pairs: Collection[Tuple[WKHPTag, Any]]):
+    async def write_values(self, kv_pairs: Collection[Tuple[WKHPTag, Any]], skip_unchanged: bool = False,
+                           skipped_tags: set = None):
+        """Write values to Tag - with 'skip_unchanged' only the raw tags, whose value differs from the last
+        read (or written) raw value, will be sent to the waterkotte (the WKHPTags, that have not been sent
+        at all, will be added to 'skipped_tags')"""
         if self.auth_cookies is None:
             await self.login()
 
-        """Write values to Tag"""
         to_write = {}
         result = {}
 
@@ -361,37 +788,86 @@ class EcotouchBridge:
             # converting the HA values to the final int or bools that the waterkotte understand
             a_wkhp_tag.encode_f(a_wkhp_tag, value, to_write)
 
-        _LOGGER.info(f"before writing WKHPTags -> {len(to_write)} tags")
-        # '.keys()' doesn't support insertion - so we need to create a new list object!
-        e_values, e_status = await self._write_tags(tags=list(to_write.keys()), values=list(to_write.values()))
-
-        if e_values is not None and len(e_values) > 0:
+        unchanged = {}
+        if skip_unchanged:
+            unchanged = {a_tag: a_value for a_tag, a_value in to_write.items() if self._is_raw_value_unchanged(a_tag, a_value)}
+            for a_tag in unchanged:
+                to_write.pop(a_tag)
+            if skipped_tags is not None:
+                skipped_tags.update(a_wkhp_tag for a_wkhp_tag, value in kv_pairs
+                                    if all(a_tag in unchanged for a_tag in a_wkhp_tag.tags))
+
+        _LOGGER.info(f"before writing WKHPTags -> {len(to_write)} tags ({len(unchanged)} unchanged tags skipped)")
+        e_values = {}
+        e_status = {}
+        write_exception = None
+        if len(to_write) > 0:
+            try:
+                # '.keys()' doesn't support insertion - so we need to create a new list object!
+                await self._write_tags(tags=list(to_write.keys()), values=list(to_write.values()),
+                                       results=e_values, results_status=e_status)
+            except StatusException as exc:
+                # the chunks that have been written before the failure must be verified anyhow
+                _LOGGER.info(f"writing WKHPTags failed after {len(e_values)} of {len(to_write)} tags: {exc}")
+                write_exception = exc
+
+        if len(unchanged) > 0:
+            # the skipped tags will be verified with their last known raw values
+            for a_tag in unchanged:
+                e_values[a_tag] = self._last_raw_records[a_tag][0]
+                e_status[a_tag] = "S_OK"
+
+        if len(e_values) > 0:
             _LOGGER.info(f"after writing WKHPTags -> raw-values: {len(e_values)} states: {len(e_status)}")
 
-            all_ok = True
-            for a_tag in e_status:
-                if e_status[a_tag] != "S_OK":
-                    all_ok = False
-
-            if all_ok:
-                str_vals = [e_values[a_tag] for a_tag in a_wkhp_tag.tags]
-                val = a_wkhp_tag.decode_f(a_wkhp_tag, str_vals)
-
-                # special 24:00:00 time handling
-                if str(value).startswith("23:59:59.9"):
-                    value = "00:00:00"
-
-                if str(val) != str(value):
-                    _LOGGER.error(f"WRITE value does not match READ value: '{val}' (read) != '{value}' (write)")
-                else:
-                    result[a_wkhp_tag] = {
-                        "value": val,
+            # the waterkotte returns the new values of the written tags ('returnValue=true') - so we can
+            # update our raw records (all WKHPTags that use one of the changed tags must be decoded again)
+            for a_tag, a_value in e_values.items():
+                if a_value is not None and e_status.get(a_tag) == "S_OK":
+                    raw_record = (a_value, e_status[a_tag])
+                    if self._last_raw_records.get(a_tag) != raw_record:
+                        self._last_raw_records[a_tag] = raw_record
+                        self._dirty_tags.update(RAW_TAG_INDEX.get(a_tag, ()))
+
+            # since the writes can be queued, each WKHPTag must be checked individually
+            for a_wkhp_tag, value in kv_pairs:
+                if all(e_status.get(a_tag) == "S_OK" for a_tag in a_wkhp_tag.tags):
+                    str_vals = [e_values[a_tag] for a_tag in a_wkhp_tag.tags]
+                    val = a_wkhp_tag.decode_f(a_wkhp_tag, str_vals)
+
+                    # special 24:00:00 time handling
+                    if str(value).startswith("23:59:59.9"):
+                        value = "00:00:00"
+
+                    if str(val) != str(value):
+                        _LOGGER.error(f"WRITE value does not match READ value: '{val}' (read) != '{value}' (write)")
+                    else:
                         # here we also take just the first status...
-                        "status": e_status[a_wkhp_tag.tags[0]]
-                    }
+                        result[a_wkhp_tag] = TagValue(val, e_status[a_wkhp_tag.tags[0]])
+                        self._decoded_values[a_wkhp_tag] = result[a_wkhp_tag]
+                        self._dirty_tags.discard(a_wkhp_tag)
+
+        if write_exception is not None:
+            raise PartialWriteException(f"only {len(result)} of {len(kv_pairs)} values written: {write_exception}",
+                                        result) from write_exception
         return result
 
-    async def _write_tags(self, tags: list[str], values: list[Any], results=None, results_status=None):
+    def _is_raw_value_unchanged(self, raw_tag: str, value: str) -> bool:
+        raw_record = self._last_raw_records.get(raw_tag)
+        if raw_record is None or raw_record[0] is None or raw_record[1] != "S_OK":
+            return False
+        if str(raw_record[0]) == value:
+            return True
+        try:
+            # the waterkotte might return e.g. '24.0' for a written '24'
+            return float(raw_record[0]) == float(value)
+        except ValueError:
+            return False
+
+    async def _write_tags(self, tags: list[str], values: list[Any], results=None, results_status=None,
+                          retry_login: bool = True):
+        """write the tags (in chunks of 'tags_per_request') - the results of the written chunks will be added
+        to 'results' & 'results_status' (so they are still available, when a later chunk fails)"""
         if results is None:
             results = {}
         if results_status is None:
@@ -399,10 +875,8 @@ class EcotouchBridge:
 
         max_write_tags = self.tags_per_request
         while len(tags) > max_write_tags:
-            results, results_status = await self._write_tags(
-                tags=tags[:max_write_tags], values=values[:max_write_tags],
-                results=results, results_status=results_status
-            )
+            await self._write_tags(tags=tags[:max_write_tags], values=values[:max_write_tags],
+                                   results=results, results_status=results_status)
             tags = tags[max_write_tags:]
             values = values[max_write_tags:]
 
@@ -415,6 +889,8 @@ class EcotouchBridge:
             args[f"v{i + 1}"] = list(values)[i]
 
         _LOGGER.info(f"going to request {args['n']} tags in a single call from waterkotte@{self.host}")
+        need_login = False
+        too_many_users = False
         async with self.web_session.get(f"http://{self.host}/cgi/writeTags", params=args) as response:
             try:
                 response.raise_for_status()
@@ -422,55 +898,28 @@ class EcotouchBridge:
                     _LOGGER.debug(f"requested: {response.url}")
                     content = await response.text()  # pylint: disable=invalid-name
                     if content.startswith("#E_NEED_LOGIN"):
-                        try:
-                            await self.login()
-                            return await self._write_tags(tags=tags, values=values)
-                        except StatusException as status_exec:
-                            _LOGGER.warning(f"StatusException (_write_tags) while trying to login: {status_exec}")
-                            return None
-                    if content.startswith("#E_TOO_MANY_USERS"):
-                        return None
-
-                    ###
-                    for tag in tags:
-                        match = re.search(
-                            # rf"#{tag}\t(?P<status>[A-Z_]+)\n\d+\t(?P<value>\-?\d+)",
-                            rf"#{tag}\t(?P<status>[A-Z_]+)\n(?P<opt>\d+)\t(?P<value>[-+]?(?:\d*\.?\d+))",
-                            content,
-                            re.MULTILINE
-                        )
-                        if match is None:
-                            match = re.search(
-                                rf"#{tag}\t(?P<status>[A-Z_]+)\n(?P<opt>\d+)\t",
-                                content,
-                                re.MULTILINE,
-                            )
-                            if match is None:
-                                # ok let's check for INACTIVETAG...
-                                match = re.search(
-                                    rf"#{tag}\tE_INACTIVETAG",
-                                    content,
-                                    re.MULTILINE,
-                                )
-                                if match is None:
-                                    _LOGGER.warning(f"Tag: '{tag}' not found in response!")
-                                    results_status[tag] = "E_NOTFOUND"
-                                else:
-                                    results_status[tag] = "E_INACTIVE"
-                            else:
-                                _LOGGER.warning(f"Tag: '{tag}' without value! -> opt-code: {match.group('opt')}")
-                                results_status[tag] = match.group("status")
-
-                            results[tag] = None
-                        else:
-                            results_status[tag] = match.group("status")
-                            results[tag] = match.group("value")
+                        need_login = True
+                    elif content.startswith("#E_TOO_MANY_USERS"):
+                        too_many_users = True
+                    else:
+                        self._parse_tags_response(content=content, tags=tags, results=results,
+                                                  results_status=results_status, is_read=False)
 
                 else:
                     _LOGGER.warning(f"{response}")
             except Exception as exc:
                 _LOGGER.warning(f"{exc}")
 
+        if too_many_users:
+            raise TooManyUsersException("TOO_MANY_USERS")
+        if need_login:
+            if not retry_login:
+                raise StatusException("E_NEED_LOGIN")
+            # a failed login will raise its StatusException
+            await self.login()
+            return await self._write_tags(tags=tags, values=values, results=results, results_status=results_status,
+                                          retry_login=False)
+
         return results, results_status
 
 
@@ -487,99 +936,69 @@ class EasyconBridge(EcotouchBridge):
 
     # reads a list of ecotouch tags
     #
-    async def _read_tags(self, tags: Sequence[WKHPTag], results=None, results_status=None):
+    async def _read_tags(self, plan: ReadPlan, results=None, results_status=None, counter: RequestCounter = None):
         """async read tags"""
+        if counter is None:
+            counter = RequestCounter()
         if results is None:
             results = {}
         if results_status is None:
             results_status = {}
-        D = []  # pylint: disable=invalid-name
-        I = []  # pylint: disable=invalid-name
-        A = []  # pylint: disable=invalid-name
-        for tag in tags:
-            print(tag)
-            # for entry in tag.tags:
-            #     print(entry)
-            if tag[0] == "D":
-                D.append(int(tag[1:]))
-            elif tag[0] == "I":
-                I.append(int(tag[1:]))
-            elif tag[0] == "A":
-                A.append(int(tag[1:]))
-
-        D.sort()
-        I.sort()
-        A.sort()
-
-        query = ""
-        if len(D) > 0:
-            query += f"|D|{D[0]}|{D[len(D) - 1]}"
-        if len(A) > 0:
-            query += f"|A|{A[0]}|{A[len(A) - 1]}"
-        if len(I) > 0:
-            query += f"|I|{I[0]}|{I[len(I) - 1]}"
-        # query="?" + query[1:]
-        print(query)
-        if query == "":
+
+        if plan.easycon_requests is None:
+            plan.easycon_requests = _plan_easycon_requests(plan.raw_tags)
+            _LOGGER.debug(f"easycon read plan: {len(plan.raw_tags)} tags in {len(plan.easycon_requests)} requests: {[query for query, _ in plan.easycon_requests]}")
+
+        if len(plan.easycon_requests) == 0:
             return None, None
 
-        async with self.web_session.get(f"http://{self.host}/config/xml.cgi?{query[1:]}") as response:
+        for query, tags in plan.easycon_requests:
+            await self._read_xml_tags(query, tags, results, results_status, counter)
+
+        for a_raw_tag in plan.raw_tags:
+            if not _is_easycon_register(a_raw_tag):
+                # e.g. the '3:HREG' tags
+                results_status[a_raw_tag] = "E_NOTFOUND"
+                results[a_raw_tag] = None
+
+        self._set_unknown_raw_tags_results(plan, results, results_status)
+        return results, results_status
+
+    async def _read_xml_tags(self, query: str, tags: Sequence[str], results: dict, results_status: dict,
+                             counter: RequestCounter):
+        self.metrics.requests += 1
+        counter.requests += 1
+        self.metrics.tags_per_request.add(len(tags))
+        request_start = time.perf_counter()
+        async with self.web_session.get(f"http://{self.host}/config/xml.cgi?{query}") as response:
             try:
                 response.raise_for_status()
                 if response.status == 200:
                     try:
-                        content = await response.text()  # pylint: disable=invalid-name
-                        tree = ElemTree.fromstring(content)
-                        root = tree[0]
-
-                        for tagType in root:
-                            for tag in tagType:
-                                if int(tag[0].text) < 50:
-                                    print(f"{tagType.tag[0]}{tag[0].text}={tag[1].text}")
-
-                        # return None, None
+                        values = await self._parse_xml_response(response)
+                        self.metrics.request_time.add((time.perf_counter() - request_start) * 1000)
                     except Exception as exc:
-                        _LOGGER.debug(f"Response was: {content} caused {exc}")
-                        raise Exception(f"Error in easycon.py parsing. Received: {content}")
+                        _LOGGER.debug(f"Response of {response.url} caused {exc}")
+                        raise Exception(f"Error in easycon.py parsing: {exc}")
 
                     for tag in tags:
-                        if tag[0] == "D":
-                            valType = "DIGITAL"
-                        elif tag[0] == "I":
-                            valType = "INTEGER"
-                        elif tag[0] == "A":
-                            valType = "ANALOG"
-                        match = root.find(f".//{valType}/*/INDEX[.='{tag[1:]}']/../VALUE")
-                        if match is None:
-                            match = re.search(
-                                # r"#%s\tE_INACTIVETAG" % tag,
-                                f"#{tag}\tE_INACTIVETAG",
-                                content,
-                                re.MULTILINE,
-                            )
-                            # val_status = "E_INACTIVE"  # pylint: disable=possibly-unused-variable
-                            # print("Tag: %s is inactive!", tag)
-                            if match is None:
-                                # special handling for "unknown" tags in the ALARM_BITS field...  [if one of the
-                                # I2xxx Tags is not known, we're simply going to remove that tag from the tag list]
-                                if tag in WKHPTag.ALARM_BITS.tags:
-                                    WKHPTag.ALARM_BITS.tags.remove(tag)
-                                    _LOGGER.info(f"Tag: '{tag}' not found in response - removing tag from WKHPTag.ALARM_BITS")
-                                else:
-                                    _LOGGER.warning(f"Tag: '{tag}' not found in response!")
-                                results_status[tag] = "E_NOTFOUND"
+                        value = values.get((tag[0], int(tag[1:])))
+                        if value is None:
+                            # special handling for "unknown" tags in the ALARM_BITS field...  [if one of the
+                            # I2xxx Tags is not known, we're simply going to remove that tag from the tag list]
+                            if tag in WKHPTag.ALARM_BITS.tags:
+                                self._add_unknown_raw_tag(tag)
                             else:
-                                # if val_status == "E_INACTIVE":
-                                results_status[tag] = "E_INACTIVE"
-
+                                _LOGGER.warning(f"Tag: '{tag}' not found in response!")
+                            results_status[tag] = "E_NOTFOUND"
                             results[tag] = None
                         else:
                             results_status[tag] = "S_OK"
-                            if valType == "ANALOG":
-                                results[tag] = str(float(match.text) * 10.0)
+                            if tag[0] == "A":
+                                results[tag] = str(float(value) * 10.0)
                             else:
-                                results[tag] = match.text
-                if response.status == 404:
+                                results[tag] = value
+                elif response.status == 404:
                     _LOGGER.debug(f"http 404 caused by requesting {response.url} - full: {response}")
                     raise Http404Exception(f"HTTP 404 {response.url}")
                 else:
@@ -591,7 +1010,43 @@ class EasyconBridge(EcotouchBridge):
                 else:
                     _LOGGER.warning(f"{exc}")
 
-        return results, results_status
+    async def _parse_xml_response(self, response) -> dict:
+        """parse the streamed xml.cgi response in a single pass into a (type, index) -> value map"""
+        parse_start = time.perf_counter()
+        parse_time = 0.0
+        values = {}
+        parser = ElemTree.XMLPullParser(events=("start", "end"))
+        # the register type (D, A or I) of the elements we are currently in
+        current_type = [None]
+
+        def collect():
+            for event, elem in parser.read_events():
+                if elem.tag in EASYCON_REGISTER_TAGS:
+                    if event == "start":
+                        current_type[0] = EASYCON_REGISTER_TAGS[elem.tag]
+                    else:
+                        current_type[0] = None
+                        elem.clear()
+                elif event == "end" and current_type[0] is not None and elem.tag not in ("INDEX", "VALUE"):
+                    # a single register: '<VARIABLE><INDEX>12</INDEX><VALUE>1</VALUE></VARIABLE>'
+                    index = elem.findtext("INDEX")
+                    if index is not None:
+                        values[(current_type[0], int(index))] = elem.findtext("VALUE")
+                    elem.clear()
+
+        async for chunk in response.content.iter_chunked(EASYCON_XML_CHUNK_SIZE):
+            chunk_start = time.perf_counter()
+            parser.feed(chunk)
+            collect()
+            parse_time += time.perf_counter() - chunk_start
+
+        chunk_start = time.perf_counter()
+        parser.close()
+        collect()
+        parse_time += time.perf_counter() - chunk_start
+        self.metrics.parse_time.add(parse_time * 1000)
+        _LOGGER.debug(f"parsed {len(values)} registers from xml.cgi response in {(time.perf_counter() - parse_start) * 1000:.1f}ms")
+        return values
 
     async def _write_tags(self, tags: list[str], values: list[Any], results=None, results_status=None):
         """write tag"""
@@ -606,8 +1061,10 @@ class EasyconBridge(EcotouchBridge):
         for i, tag in enumerate(tags):
             param += f"var|{tag[0].upper()}|{tag[1:]}|{list(values)[i]}|"
 
-        results = {}
-        resultsStatus = {}
+        if results is None:
+            results = {}
+        if results_status is None:
+            results_status = {}
 
         async with self.web_session.get(f"http://{self.host}/config/query.cgi?{param}") as response:
             try:
@@ -620,11 +1077,11 @@ class EasyconBridge(EcotouchBridge):
                 if is_ok and response.status == 200:
 
                     for i, tag in enumerate(tags):
-                        resultsStatus[tag] = "S_OK"
+                        results_status[tag] = "S_OK"
                         results[tag] = list(values)[i]
                 else:
                     _LOGGER.warning(f"{response}")
             except Exception as exc:
                 _LOGGER.warning(f"{exc}")
 
-            return results, resultsStatus
+            return results, results_status
@@ -2,6 +2,12 @@ from typing import Final
 
 ECOTOUCH: Final = "ECOTOUCH"
 EASYCON: Final = "EASYCON"
+
+# polling tiers of the tags: 'fast' tags will be read on every update, 'slow' tags (like the energy
+# counters) and 'on_demand' tags (like schedules or firmware infos) only from time to time
+POLL_TIER_FAST: Final = "fast"
+POLL_TIER_SLOW: Final = "slow"
+POLL_TIER_ON_DEMAND: Final = "on_demand"
 FOUR_STEPS_MODES: Final = {
     0: "mode0",
     1: "mode1",
@@ -20,6 +20,13 @@ class TooManyUsersException(StatusException):
     """A TooManyUsers Exception."""
     # pass
 
+class PartialWriteException(StatusException):
+    """Not all values could be written - the 'result' contains the verified values of the written ones."""
+
+    def __init__(self, message: str, result: dict):
+        super().__init__(message)
+        self.result = result
+
 class InvalidPasswordException(StatusException):
     """A TooManyUsers Exception."""
     # pass
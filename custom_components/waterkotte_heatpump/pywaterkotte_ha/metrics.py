@@ -0,0 +1,93 @@
+from collections import deque
+from typing import Final
+
+# number of samples that will be kept for each metric
+METRICS_WINDOW_SIZE: Final = 50
+
+
+class RollingMetric:
+    """the last n samples of a value (e.g. the round trip time of a request)"""
+
+    def __init__(self, window_size: int = METRICS_WINDOW_SIZE):
+        self._samples = deque(maxlen=window_size)
+        self.total_count = 0
+
+    def add(self, value: float):
+        self._samples.append(value)
+        self.total_count += 1
+
+    @property
+    def last(self) -> float | None:
+        return self._samples[-1] if len(self._samples) > 0 else None
+
+    @property
+    def mean(self) -> float | None:
+        return sum(self._samples) / len(self._samples) if len(self._samples) > 0 else None
+
+    @property
+    def max(self) -> float | None:
+        return max(self._samples) if len(self._samples) > 0 else None
+
+    def as_dict(self) -> dict:
+        return {
+            "last": self.last,
+            "mean": self.mean,
+            "max": self.max,
+            "samples": len(self._samples),
+            "total_count": self.total_count
+        }
+
+
+class RequestCounter:
+    """the requests & retries of a single read_values() call (the counters of the BridgeMetrics are shared
+    by all reads, that might overlap)"""
+    __slots__ = ("requests", "retries")
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+
+
+class BridgeMetrics:
+    """hot-path metrics of the communication with the waterkotte (all times in milliseconds)"""
+
+    def __init__(self, window_size: int = METRICS_WINDOW_SIZE):
+        # per readTags request
+        self.request_time = RollingMetric(window_size)
+        self.parse_time = RollingMetric(window_size)
+        self.tags_per_request = RollingMetric(window_size)
+        # per read_values() call (= poll)
+        self.poll_time = RollingMetric(window_size)
+        self.decode_time = RollingMetric(window_size)
+        self.requests_per_poll = RollingMetric(window_size)
+        self.retries_per_poll = RollingMetric(window_size)
+
+        self.requests = 0
+        self.retries = 0
+        self.logins = 0
+        self.relogins = 0
+        self.login_failures = 0
+        # WKHPTags that have been taken from another (concurrent) read
+        self.shared_reads = 0
+        # connections of the own connection pool
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "request_time_ms": self.request_time.as_dict(),
+            "parse_time_ms": self.parse_time.as_dict(),
+            "tags_per_request": self.tags_per_request.as_dict(),
+            "poll_time_ms": self.poll_time.as_dict(),
+            "decode_time_ms": self.decode_time.as_dict(),
+            "requests_per_poll": self.requests_per_poll.as_dict(),
+            "retries_per_poll": self.retries_per_poll.as_dict(),
+            "requests": self.requests,
+            "retries": self.retries,
+            "logins": self.logins,
+            "relogins": self.relogins,
+            "login_failures": self.login_failures,
+            "shared_reads": self.shared_reads,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused
+        }
@@ -0,0 +1,83 @@
+from datetime import time
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.schedules import (
+    SCHEDULE_DAYS,
+    schedule_fields,
+    schedule_tag_name
+)
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag, TagValue
+
+
+@lru_cache(maxsize=None)
+def schedule_tags(schedule_type: str) -> Tuple[WKHPTag, ...]:
+    """all WKHPTags of a schedule (all fields of all 7 days) - they will be read together"""
+    return tuple(WKHPTag[schedule_tag_name(schedule_type, a_day, a_field)]
+                 for a_day in SCHEDULE_DAYS for a_field in schedule_fields(schedule_type))
+
+
+def schedule_name(schedule_type: str) -> str:
+    """'SCHEDULE_HEATING' -> 'heating' (like the schedule_type of the set_schedule_data service)"""
+    return schedule_type[len("SCHEDULE_"):].lower()
+
+
+def field_key(field: str) -> str:
+    """'_ADJUST1_START_TIME' -> 'adjust1_start_time'"""
+    return field[1:].lower()
+
+
+def _format_value(value):
+    if isinstance(value, time):
+        return "24:00" if value == time.max else value.strftime("%H:%M")
+    return value
+
+
+class WKHPSchedule:
+    """a complete (7 days) time schedule of the waterkotte - e.g. the SCHEDULE_HEATING"""
+
+    def __init__(self, schedule_type: str, values: Dict[WKHPTag, TagValue]):
+        self.schedule_type = schedule_type
+        # the TagValues of all WKHPTags of this schedule (that are available)
+        self.values = {a_tag: values[a_tag] for a_tag in schedule_tags(schedule_type) if values.get(a_tag) is not None}
+
+    @property
+    def name(self) -> str:
+        return schedule_name(self.schedule_type)
+
+    @property
+    def is_complete(self) -> bool:
+        """True, when all fields of all days are known"""
+        return all(self.get_tag_value(a_tag) is not None for a_tag in schedule_tags(self.schedule_type))
+
+    def tag(self, day: str, field: str) -> WKHPTag:
+        """the WKHPTag of a single field of a day - e.g. tag('1MO', '_START_TIME')"""
+        return WKHPTag[schedule_tag_name(self.schedule_type, day.upper(), field.upper())]
+
+    def get_tag_value(self, tag: WKHPTag) -> Any:
+        a_tag_value = self.values.get(tag)
+        if a_tag_value is None or a_tag_value.status != "S_OK":
+            return None
+        return a_tag_value.value
+
+    def get(self, day: str, field: str) -> Any:
+        return self.get_tag_value(self.tag(day, field))
+
+    def get_day(self, day: str) -> Dict[str, Any]:
+        """all fields of a day - e.g. {'enable': True, 'start_time': '06:00', 'end_time': '22:00', ...}"""
+        return {field_key(a_field): _format_value(self.get(day, a_field)) for a_field in schedule_fields(self.schedule_type)}
+
+    def is_active(self, day: str, a_time: time) -> bool | None:
+        """True, when the given time of the day is within the (enabled) time window of the day"""
+        enabled = self.get(day, "_ENABLE")
+        start_time = self.get(day, "_START_TIME")
+        end_time = self.get(day, "_END_TIME")
+        if enabled is None or start_time is None or end_time is None:
+            return None
+        return enabled and start_time <= a_time < end_time
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "schedule_type": self.name,
+            "days": {a_day.lower(): self.get_day(a_day) for a_day in SCHEDULE_DAYS}
+        }
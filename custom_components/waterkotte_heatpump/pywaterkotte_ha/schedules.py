@@ -0,0 +1,94 @@
+from typing import Final, Iterator, List, Sequence, Tuple
+
+# all time schedules of the waterkotte (Thanks @flautze) share the same register layout - so the 658 schedule
+# tags can be generated from this small table
+
+SCHEDULE_TYPES: Final = [
+    "SCHEDULE_HEATING",
+    "SCHEDULE_COOLING",
+    "SCHEDULE_WATER",
+    "SCHEDULE_POOL",
+    "SCHEDULE_MIX1",
+    "SCHEDULE_MIX2",
+    "SCHEDULE_MIX3",
+    "SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP",
+    "SCHEDULE_SOLAR",
+    "SCHEDULE_PV"
+]
+SCHEDULE_DAYS: Final = ["1MO", "2TU", "3WE", "4TH", "5FR", "6SA", "7SU"]
+SCHEDULE_FIELDS: Final = ["_ENABLE", "_START_TIME", "_END_TIME",
+                          "_ADJUST1_ENABLE", "_ADJUST1_VALUE", "_ADJUST1_START_TIME", "_ADJUST1_END_TIME",
+                          "_ADJUST2_ENABLE", "_ADJUST2_VALUE", "_ADJUST2_START_TIME", "_ADJUST2_END_TIME"]
+# the schedules without the two adjust (temperature) blocks
+SCHEDULE_BASIC_FIELDS: Final = ["_ENABLE", "_START_TIME", "_END_TIME"]
+
+# the first register (monday) of: enable (D), adjust value (A), start hh (I), start mm (I), end hh (I) & end mm (I)
+# the registers of the following days are located at +4 (per day) - the adjust 1 & 2 registers at +1 & +2
+SCHEDULE_REGISTERS: Final = {
+    "SCHEDULE_HEATING": (42, 63, 151, 179, 207, 235),
+    "SCHEDULE_COOLING": (86, 112, 276, 304, 332, 360),
+    "SCHEDULE_WATER": (125, 141, 393, 421, 449, 447),
+    "SCHEDULE_POOL": (168, 176, 528, 556, 584, 612),
+    "SCHEDULE_MIX1": (259, 247, 777, 805, 833, 861),
+    "SCHEDULE_MIX2": (302, 293, 897, 925, 953, 981),
+    "SCHEDULE_MIX3": (345, 339, 1018, 1046, 1074, 1102),
+    "SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP": (388, 385, 1139, 1167, 1195, 1223),
+    "SCHEDULE_SOLAR": (204, None, 648, 676, 704, 732),
+    "SCHEDULE_PV": (642, None, 1483, 1511, 1539, 1567),
+}
+SCHEDULE_DAY_OFFSET: Final = 4
+
+
+def schedule_fields(schedule_type: str) -> List[str]:
+    if SCHEDULE_REGISTERS[schedule_type][1] is None:
+        return SCHEDULE_BASIC_FIELDS
+    return SCHEDULE_FIELDS
+
+
+def is_time_field(field: str) -> bool:
+    return field.endswith("_TIME")
+
+
+def schedule_field_registers(schedule_type: str, day_idx: int, field: str) -> List[str]:
+    """the raw registers of a single field (e.g. '_ADJUST1_START_TIME') of a schedule day (0=monday)"""
+    enable_idx, value_idx, start_hh_idx, start_mm_idx, end_hh_idx, end_mm_idx = SCHEDULE_REGISTERS[schedule_type]
+    day_addon = day_idx * SCHEDULE_DAY_OFFSET
+    if field.startswith("_ADJUST1"):
+        block = 1
+    elif field.startswith("_ADJUST2"):
+        block = 2
+    else:
+        block = 0
+
+    if field.endswith("_ENABLE"):
+        return [f"D{enable_idx + day_addon + block}"]
+    elif field.endswith("_VALUE"):
+        return [f"A{value_idx + day_addon + block - 1}"]
+    elif field.endswith("_START_TIME"):
+        return [f"I{start_hh_idx + day_addon + block}", f"I{start_mm_idx + day_addon + block}"]
+    else:
+        return [f"I{end_hh_idx + day_addon + block}", f"I{end_mm_idx + day_addon + block}"]
+
+
+def schedule_tag_name(schedule_type: str, day: str, field: str) -> str:
+    return f"{schedule_type}_{day}{field}"
+
+
+def schedule_tag_names(schedule_types: Sequence[str] = SCHEDULE_TYPES) -> Iterator[Tuple[str, str]]:
+    """the (name, field) of all schedule tags of the given schedule types"""
+    for a_type in schedule_types:
+        for a_day in SCHEDULE_DAYS:
+            for a_field in schedule_fields(a_type):
+                yield schedule_tag_name(a_type, a_day, a_field), a_field
+
+
+def parse_schedule_tag_name(name: str) -> Tuple[str, int, str] | None:
+    """'SCHEDULE_HEATING_1MO_START_TIME' -> ('SCHEDULE_HEATING', 0, '_START_TIME') - None for all other names"""
+    for a_type in SCHEDULE_TYPES:
+        type_len = len(a_type)
+        if name.startswith(a_type) and name[type_len:type_len + 1] == "_":
+            a_day = name[type_len + 1:type_len + 4]
+            a_field = name[type_len + 4:]
+            if a_day in SCHEDULE_DAYS and a_field in schedule_fields(a_type):
+                return a_type, SCHEDULE_DAYS.index(a_day), a_field
+    return None
@@ -1,32 +1,59 @@
 import logging
 import math
 import struct
+import sys
 from datetime import datetime, timedelta, time
-from enum import Enum
+from operator import itemgetter
+from types import MappingProxyType
 from typing import (
     NamedTuple,
     Callable,
+    Iterator,
     List,
-    Collection
+    Collection,
+    Final,
+    Mapping
 )
 
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.const import (
+    POLL_TIER_FAST,
+    POLL_TIER_SLOW,
+    POLL_TIER_ON_DEMAND,
     SERIES,
     SYSTEM_IDS,
     FOUR_STEPS_MODES,
-    SIX_STEPS_MODES,
-    # SCHEDULE_DAY_LIST,
-    # SCHEDULE_SENSOR_TYPES_LIST
+    SIX_STEPS_MODES
 )
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.error import (
     InvalidValueException,
 )
-
-# from aenum import Enum, extend_enum
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.schedules import (
+    schedule_tag_names,
+    schedule_field_registers,
+    parse_schedule_tag_name,
+    is_time_field
+)
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+class TagValue:
+    """the (decoded) value & the status of a WKHPTag"""
+    __slots__ = ("value", "status")
+
+    def __init__(self, value, status: str | None):
+        self.value = value
+        self.status = status
+
+    def __eq__(self, other):
+        if isinstance(other, TagValue):
+            return self.value == other.value and self.status == other.status
+        return NotImplemented
+
+    def __repr__(self):
+        return f"TagValue(value={self.value!r}, status={self.status!r})"
+
+
 class DataTag(NamedTuple):
 
     def _decode_value_default(self, str_vals: List[str]):
@@ -431,11 +458,195 @@ class DataTag(NamedTuple):
     bit: int = None
     bits: list[int] = None
     translate: bool = False
+    poll: str = None
+
+
+# the id & the name of a WKHPTag are stored behind the DataTag fields
+_TAG_ID_IDX: Final = len(DataTag._fields)
+_TAG_NAME_IDX: Final = _TAG_ID_IDX + 1
+_TAG_TAGS_IDX: Final = DataTag._fields.index("tags")
+_TAG_BITS_IDX: Final = DataTag._fields.index("bits")
+
+
+class TagRegistry(type):
+    """the metaclass of WKHPTag: all DataTag definitions of the class body will be converted into immutable
+    WKHPTags (with an integer id & their name). The registry provides the (former) Enum access: WKHPTag.NAME,
+    WKHPTag["NAME"], WKHPTag.__members__, iteration & len() - without the costs of the Enum machinery.
+    Further members can be provided lazily: 'lazy_definition(name)' returns the DataTag of such a member (or
+    None) & 'lazy_names()' all of their names - the WKHPTag will be created on its first access"""
+
+    def __new__(mcs, cls_name: str, bases: tuple, namespace: dict, lazy_definition: Callable = None,
+                lazy_names: Callable = None):
+        definitions = [(a_name, a_value) for a_name, a_value in namespace.items() if type(a_value) is DataTag]
+        for a_name, _ in definitions:
+            del namespace[a_name]
+        cls = super().__new__(mcs, cls_name, bases, namespace)
+
+        type.__setattr__(cls, "_tags_by_id", [])
+        type.__setattr__(cls, "_tags_by_name", {})
+        # reverse index: raw tag -> all WKHPTags that make use of it
+        type.__setattr__(cls, "_tags_by_raw_tag", {})
+        # equal raw tag lists will share the same (interned) tuple
+        type.__setattr__(cls, "_raw_tags_pool", {})
+        type.__setattr__(cls, "_lazy_definition", lazy_definition)
+        type.__setattr__(cls, "_lazy_names", lazy_names)
+        for a_name, a_definition in definitions:
+            cls._add_tag(a_name, a_definition)
+        return cls
+
+    def _add_tag(cls, name: str, definition: DataTag):
+        # the member is built from the fields of the definition directly (no intermediate namedtuple)
+        values = [*definition, len(cls._tags_by_id), sys.intern(name)]
+        raw_tags = tuple(map(sys.intern, definition.tags))
+        values[_TAG_TAGS_IDX] = cls._raw_tags_pool.setdefault(raw_tags, raw_tags)
+        if definition.bits is not None:
+            values[_TAG_BITS_IDX] = tuple(definition.bits)
+        a_tag = tuple.__new__(cls, values)
+        type.__setattr__(cls, name, a_tag)
+        cls._tags_by_id.append(a_tag)
+        cls._tags_by_name[name] = a_tag
+        for a_raw_tag in a_tag.tags:
+            wkhp_tags_of_raw_tag = cls._tags_by_raw_tag.get(a_raw_tag, ())
+            if a_tag not in wkhp_tags_of_raw_tag:
+                cls._tags_by_raw_tag[a_raw_tag] = wkhp_tags_of_raw_tag + (a_tag,)
+        return a_tag
+
+    def _create_lazy_tag(cls, name: str):
+        lazy_definition = cls.__dict__.get("_lazy_definition")
+        if lazy_definition is None:
+            return None
+        a_definition = lazy_definition(name)
+        if a_definition is None:
+            return None
+        return cls._add_tag(name, a_definition)
 
+    def _create_lazy_tags(cls):
+        if cls._lazy_names is not None:
+            for a_name in cls._lazy_names():
+                if a_name not in cls._tags_by_name:
+                    cls._create_lazy_tag(a_name)
+            # all members exist from now on
+            type.__setattr__(cls, "_lazy_names", None)
+
+    def __getitem__(cls, name: str):
+        try:
+            return cls._tags_by_name[name]
+        except KeyError:
+            a_tag = cls._create_lazy_tag(name)
+            if a_tag is None:
+                raise
+            return a_tag
+
+    def __getattr__(cls, name: str):
+        # only called for the names that are not (yet) an attribute of the class
+        a_tag = None if name.startswith("_") else cls._create_lazy_tag(name)
+        if a_tag is None:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        return a_tag
+
+    def __iter__(cls):
+        cls._create_lazy_tags()
+        return iter(cls._tags_by_id)
+
+    def __len__(cls) -> int:
+        cls._create_lazy_tags()
+        return len(cls._tags_by_id)
+
+    def __contains__(cls, item) -> bool:
+        return isinstance(item, cls)
+
+    def _is_tag_name(cls, name: str) -> bool:
+        if name in cls.__dict__.get("_tags_by_name", ()):
+            return True
+        lazy_definition = cls.__dict__.get("_lazy_definition")
+        return lazy_definition is not None and lazy_definition(name) is not None
+
+    def __setattr__(cls, name: str, value):
+        if cls._is_tag_name(name):
+            raise AttributeError(f"cannot reassign {cls.__name__}.{name}")
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name: str):
+        if cls._is_tag_name(name):
+            raise AttributeError(f"cannot delete {cls.__name__}.{name}")
+        super().__delattr__(name)
+
+    @property
+    def __members__(cls) -> Mapping[str, "WKHPTag"]:
+        return _TagMembers(cls)
+
+    def from_id(cls, tag_id: int):
+        return cls._tags_by_id[tag_id]
+
+
+class _TagMembers(Mapping):
+    """the name -> WKHPTag mapping of all members of a TagRegistry (the lazy members will be created on access)"""
+    __slots__ = ("_cls",)
+
+    def __init__(self, cls: TagRegistry):
+        self._cls = cls
+
+    def __getitem__(self, name: str):
+        return self._cls[name]
+
+    def __contains__(self, name) -> bool:
+        try:
+            self._cls[name]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return (a_tag.name for a_tag in self._cls)
+
+    def __len__(self) -> int:
+        return len(self._cls)
+
+
+def _schedule_tag_definition(name: str) -> DataTag | None:
+    """the DataTag of a schedule tag (e.g. 'SCHEDULE_HEATING_1MO_START_TIME') - generated from the register
+    table in schedules.py"""
+    a_schedule_field = parse_schedule_tag_name(name)
+    if a_schedule_field is None:
+        return None
+    a_type, day_idx, a_field = a_schedule_field
+    raw_tags = schedule_field_registers(a_type, day_idx, a_field)
+    if is_time_field(a_field):
+        return DataTag(raw_tags, writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
+    return DataTag(raw_tags, writeable=True)
+
+
+def _schedule_tag_names() -> Iterator[str]:
+    return (a_name for a_name, a_field in schedule_tag_names())
+
+
+# the 658 schedule tags will be only created, when they are used (e.g. by the entities of the enabled
+# schedule types)
+class WKHPTag(DataTag, metaclass=TagRegistry, lazy_definition=_schedule_tag_definition,
+              lazy_names=_schedule_tag_names):
+    __slots__ = ()
+
+    id = property(itemgetter(_TAG_ID_IDX), doc="the (registry) id of the WKHPTag")
+    name = property(itemgetter(_TAG_NAME_IDX), doc="the name of the WKHPTag")
 
-class WKHPTag(DataTag, Enum):
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self[_TAG_ID_IDX]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.{self.name}"
+
+    def __reduce_ex__(self, protocol):
+        # like the Enum members: copies (and unpickled instances) are the registered WKHPTag itself
+        return getattr, (type(self), self.name)
+
+    @property
+    def poll_tier(self) -> str:
+        if self.poll is not None:
+            return self.poll
+        # the (generated) schedule tags will be only read on demand
+        if self.name.startswith("SCHEDULE_"):
+            return POLL_TIER_ON_DEMAND
+        return POLL_TIER_FAST
 
     #################################################
     # waterkotte operational hours [/easycon/pgOpH.html]
@@ -446,60 +657,60 @@ class WKHPTag(DataTag, Enum):
     OPERATING_HOURS_V2_SHOW_TOTALS_SWITCH_D634 = DataTag(["D634"], writeable=True)
 
     # Verdichter 1
-    OPERATING_HOURS_V2_COMPRESSOR_1_A516 = DataTag(["A516", "A517"])
+    OPERATING_HOURS_V2_COMPRESSOR_1_A516 = DataTag(["A516", "A517"], poll=POLL_TIER_SLOW)
     # Verdichter 2 / Außeneinheit
-    OPERATING_HOURS_V2_COMPRESSOR_2_A518 = DataTag(["A518", "A519"])
+    OPERATING_HOURS_V2_COMPRESSOR_2_A518 = DataTag(["A518", "A519"], poll=POLL_TIER_SLOW)
     # Vollbetriebsstunden
-    OPERATING_HOURS_V2_FULL_OPERATING_HOURS_A520 = DataTag(["A520", "A521"])
+    OPERATING_HOURS_V2_FULL_OPERATING_HOURS_A520 = DataTag(["A520", "A521"], poll=POLL_TIER_SLOW)
     # Heizungspumpe
-    OPERATING_HOURS_V2_HEATINGPUMP_A522 = DataTag(["A522", "A523"])
+    OPERATING_HOURS_V2_HEATINGPUMP_A522 = DataTag(["A522", "A523"], poll=POLL_TIER_SLOW)
     # Wärmequellenpumpe
-    OPERATING_HOURS_V2_SOURCE_PUMP_A524 = DataTag(["A524", "A525"])
+    OPERATING_HOURS_V2_SOURCE_PUMP_A524 = DataTag(["A524", "A525"], poll=POLL_TIER_SLOW)
     # Solarkreispumpe
-    OPERATING_HOURS_V2_SOLAR_CIRCULATION_PUMP_A526 = DataTag(["A526", "A527"])
+    OPERATING_HOURS_V2_SOLAR_CIRCULATION_PUMP_A526 = DataTag(["A526", "A527"], poll=POLL_TIER_SLOW)
     # Externer Wärmeerzeuger
-    OPERATING_HOURS_V2_EXTERNALHEATER_A528 = DataTag(["A528", "A529"])
+    OPERATING_HOURS_V2_EXTERNALHEATER_A528 = DataTag(["A528", "A529"], poll=POLL_TIER_SLOW)
     # Heizbetrieb
-    OPERATING_HOURS_V2_HEATING_A530 = DataTag(["A530", "A531"])
+    OPERATING_HOURS_V2_HEATING_A530 = DataTag(["A530", "A531"], poll=POLL_TIER_SLOW)
     # Kühlbetrieb
-    OPERATING_HOURS_V2_COOLING_A532 = DataTag(["A532", "A533"])
+    OPERATING_HOURS_V2_COOLING_A532 = DataTag(["A532", "A533"], poll=POLL_TIER_SLOW)
     # Warmwasserbetrieb
-    OPERATING_HOURS_V2_HOT_WATER_A534 = DataTag(["A534", "A535"])
+    OPERATING_HOURS_V2_HOT_WATER_A534 = DataTag(["A534", "A535"], poll=POLL_TIER_SLOW)
     # Pool-Heizbetrieb
-    OPERATING_HOURS_V2_POOL_HEATING_A536 = DataTag(["A536", "A537"])
+    OPERATING_HOURS_V2_POOL_HEATING_A536 = DataTag(["A536", "A537"], poll=POLL_TIER_SLOW)
     # Solarbetrieb
-    OPERATING_HOURS_V2_SOLAR_A538 = DataTag(["A538", "A539"])
+    OPERATING_HOURS_V2_SOLAR_A538 = DataTag(["A538", "A539"], poll=POLL_TIER_SLOW)
     # Funktionsheizbetrieb
-    OPERATING_HOURS_V2_FUNCTIONAL_HEATING_A540 = DataTag(["A540", "A541"])
+    OPERATING_HOURS_V2_FUNCTIONAL_HEATING_A540 = DataTag(["A540", "A541"], poll=POLL_TIER_SLOW)
     # Abtauvorgang
-    OPERATING_HOURS_V2_DEFROSTER_A542 = DataTag(["A542", "A543"])
+    OPERATING_HOURS_V2_DEFROSTER_A542 = DataTag(["A542", "A543"], poll=POLL_TIER_SLOW)
     # Bivalent parallel
-    OPERATING_HOURS_V2_BIVALENT_PARALLEL_A544 = DataTag(["A544", "A545"])
+    OPERATING_HOURS_V2_BIVALENT_PARALLEL_A544 = DataTag(["A544", "A545"], poll=POLL_TIER_SLOW)
     # Bivalent alternativ
-    OPERATING_HOURS_V2_BIVALENT_ALTERNATIVE_A546 = DataTag(["A546", "A547"])
+    OPERATING_HOURS_V2_BIVALENT_ALTERNATIVE_A546 = DataTag(["A546", "A547"], poll=POLL_TIER_SLOW)
 
     # PV-Ertrag
-    OPERATING_HOURS_V2_PV_YIELD_ALT_A576 = DataTag(["A576", "A577"])
+    OPERATING_HOURS_V2_PV_YIELD_ALT_A576 = DataTag(["A576", "A577"], poll=POLL_TIER_SLOW)
     # PV-Ertrag
-    OPERATING_HOURS_V2_PV_YIELD_A963 = DataTag(["A963", "A964"])
+    OPERATING_HOURS_V2_PV_YIELD_A963 = DataTag(["A963", "A964"], poll=POLL_TIER_SLOW)
 
     # Außeneinheit 3
-    OPERATING_HOURS_V2_COMPRESSOR_3_A706 = DataTag(["A706", "A707"])
+    OPERATING_HOURS_V2_COMPRESSOR_3_A706 = DataTag(["A706", "A707"], poll=POLL_TIER_SLOW)
     # Außeneinheit 4
-    OPERATING_HOURS_V2_COMPRESSOR_4_A708 = DataTag(["A708", "A709"])
+    OPERATING_HOURS_V2_COMPRESSOR_4_A708 = DataTag(["A708", "A709"], poll=POLL_TIER_SLOW)
 
     # Abtauvorgang 2
-    OPERATING_HOURS_V2_DEFROSTER_2_A710 = DataTag(["A710", "A711"])
+    OPERATING_HOURS_V2_DEFROSTER_2_A710 = DataTag(["A710", "A711"], poll=POLL_TIER_SLOW)
     # Abtauvorgang 3
-    OPERATING_HOURS_V2_DEFROSTER_3_A712 = DataTag(["A712", "A713"])
+    OPERATING_HOURS_V2_DEFROSTER_3_A712 = DataTag(["A712", "A713"], poll=POLL_TIER_SLOW)
     # Abtauvorgang 4
-    OPERATING_HOURS_V2_DEFROSTER_4_A714 = DataTag(["A714", "A715"])
+    OPERATING_HOURS_V2_DEFROSTER_4_A714 = DataTag(["A714", "A715"], poll=POLL_TIER_SLOW)
     # Heizungspumpe 2
-    OPERATING_HOURS_V2_HEATINGPUMP_2_A716 = DataTag(["A716", "A717"])
+    OPERATING_HOURS_V2_HEATINGPUMP_2_A716 = DataTag(["A716", "A717"], poll=POLL_TIER_SLOW)
     # Heizungspumpe 3
-    OPERATING_HOURS_V2_HEATINGPUMP_3_A718 = DataTag(["A718", "A719"])
+    OPERATING_HOURS_V2_HEATINGPUMP_3_A718 = DataTag(["A718", "A719"], poll=POLL_TIER_SLOW)
     # Heizungspumpe 4
-    OPERATING_HOURS_V2_HEATINGPUMP_4_A720 = DataTag(["A720", "A721"])
+    OPERATING_HOURS_V2_HEATINGPUMP_4_A720 = DataTag(["A720", "A721"], poll=POLL_TIER_SLOW)
 
     # D628 - Externer Wärmeerzeuger für Notbetrieb verwenden
 
@@ -576,119 +787,119 @@ class WKHPTag(DataTag, Enum):
     COP_COOLING = DataTag(["A29"], "")
 
     # ENERGY-YEAR-BALANCE
-    COP_HEATPUMP_YEAR = DataTag(["A460"], "")  # HEATPUMP_COP
-    COP_HEATPUMP_ACTUAL_YEAR_INFO = DataTag(["I1261"], decode_f=DataTag._decode_year)  # HEATPUMP_COP_YEAR
-    COP_TOTAL_SYSTEM_YEAR = DataTag(["A461"], "")
-    COP_HEATING_YEAR = DataTag(["A695"])
-    COP_HOT_WATER_YEAR = DataTag(["A697"])
-
-    ENERGY_CONSUMPTION_TOTAL_YEAR = DataTag(["A450", "A451"], "kWh")
-    COMPRESSOR_ELECTRIC_CONSUMPTION_YEAR = DataTag(["A444", "A445"], "kWh")  # ANUAL_CONSUMPTION_COMPRESSOR
-    SOURCEPUMP_ELECTRIC_CONSUMPTION_YEAR = DataTag(["A446", "A447"], "kWh")  # ANUAL_CONSUMPTION_SOURCEPUMP
-    ELECTRICAL_HEATER_ELECTRIC_CONSUMPTION_YEAR = DataTag(["A448", "A449"], "kWh")  # ANUAL_CONSUMPTION_EXTERNALHEATER
-    ENERGY_PRODUCTION_TOTAL_YEAR = DataTag(["A458", "A459"], "kWh")
-    HEATING_ENERGY_PRODUCTION_YEAR = DataTag(["A452", "A453"], "kWh")  # ANUAL_CONSUMPTION_HEATING
-    HOT_WATER_ENERGY_PRODUCTION_YEAR = DataTag(["A454", "A455"], "kWh")  # ANUAL_CONSUMPTION_WATER
-    POOL_ENERGY_PRODUCTION_YEAR = DataTag(["A456", "A457"], "kWh")  # ANUAL_CONSUMPTION_POOL
-    COOLING_ENERGY_YEAR = DataTag(["A462", "A463"], "kWh")
+    COP_HEATPUMP_YEAR = DataTag(["A460"], "", poll=POLL_TIER_SLOW)  # HEATPUMP_COP
+    COP_HEATPUMP_ACTUAL_YEAR_INFO = DataTag(["I1261"], decode_f=DataTag._decode_year, poll=POLL_TIER_SLOW)  # HEATPUMP_COP_YEAR
+    COP_TOTAL_SYSTEM_YEAR = DataTag(["A461"], "", poll=POLL_TIER_SLOW)
+    COP_HEATING_YEAR = DataTag(["A695"], poll=POLL_TIER_SLOW)
+    COP_HOT_WATER_YEAR = DataTag(["A697"], poll=POLL_TIER_SLOW)
+
+    ENERGY_CONSUMPTION_TOTAL_YEAR = DataTag(["A450", "A451"], "kWh", poll=POLL_TIER_SLOW)
+    COMPRESSOR_ELECTRIC_CONSUMPTION_YEAR = DataTag(["A444", "A445"], "kWh", poll=POLL_TIER_SLOW)  # ANUAL_CONSUMPTION_COMPRESSOR
+    SOURCEPUMP_ELECTRIC_CONSUMPTION_YEAR = DataTag(["A446", "A447"], "kWh", poll=POLL_TIER_SLOW)  # ANUAL_CONSUMPTION_SOURCEPUMP
+    ELECTRICAL_HEATER_ELECTRIC_CONSUMPTION_YEAR = DataTag(["A448", "A449"], "kWh", poll=POLL_TIER_SLOW)  # ANUAL_CONSUMPTION_EXTERNALHEATER
+    ENERGY_PRODUCTION_TOTAL_YEAR = DataTag(["A458", "A459"], "kWh", poll=POLL_TIER_SLOW)
+    HEATING_ENERGY_PRODUCTION_YEAR = DataTag(["A452", "A453"], "kWh", poll=POLL_TIER_SLOW)  # ANUAL_CONSUMPTION_HEATING
+    HOT_WATER_ENERGY_PRODUCTION_YEAR = DataTag(["A454", "A455"], "kWh", poll=POLL_TIER_SLOW)  # ANUAL_CONSUMPTION_WATER
+    POOL_ENERGY_PRODUCTION_YEAR = DataTag(["A456", "A457"], "kWh", poll=POLL_TIER_SLOW)  # ANUAL_CONSUMPTION_POOL
+    COOLING_ENERGY_YEAR = DataTag(["A462", "A463"], "kWh", poll=POLL_TIER_SLOW)
 
     # The LAST12M values for ENERGY_CONSUMPTION_TOTAL (also the individual values for compressor, sourcepump & e-heater
     # will be calculated based on values for each month (and will be summarized in the FE))
     # The same applies to the ENERGY_PRODUCTION_TOTAL (with the individual values for heating, hot_water & pool)
-    COP_TOTAL_SYSTEM_LAST12M = DataTag(["A435"])
-    COOLING_ENERGY_LAST12M = DataTag(["A436"], "kWh")
-
-    ENG_CONSUMPTION_COMPRESSOR01 = DataTag(["A782"])
-    ENG_CONSUMPTION_COMPRESSOR02 = DataTag(["A783"])
-    ENG_CONSUMPTION_COMPRESSOR03 = DataTag(["A784"])
-    ENG_CONSUMPTION_COMPRESSOR04 = DataTag(["A785"])
-    ENG_CONSUMPTION_COMPRESSOR05 = DataTag(["A786"])
-    ENG_CONSUMPTION_COMPRESSOR06 = DataTag(["A787"])
-    ENG_CONSUMPTION_COMPRESSOR07 = DataTag(["A788"])
-    ENG_CONSUMPTION_COMPRESSOR08 = DataTag(["A789"])
-    ENG_CONSUMPTION_COMPRESSOR09 = DataTag(["A790"])
-    ENG_CONSUMPTION_COMPRESSOR10 = DataTag(["A791"])
-    ENG_CONSUMPTION_COMPRESSOR11 = DataTag(["A792"])
-    ENG_CONSUMPTION_COMPRESSOR12 = DataTag(["A793"])
-
-    ENG_CONSUMPTION_SOURCEPUMP01 = DataTag(["A794"])
-    ENG_CONSUMPTION_SOURCEPUMP02 = DataTag(["A795"])
-    ENG_CONSUMPTION_SOURCEPUMP03 = DataTag(["A796"])
-    ENG_CONSUMPTION_SOURCEPUMP04 = DataTag(["A797"])
-    ENG_CONSUMPTION_SOURCEPUMP05 = DataTag(["A798"])
-    ENG_CONSUMPTION_SOURCEPUMP06 = DataTag(["A799"])
-    ENG_CONSUMPTION_SOURCEPUMP07 = DataTag(["A800"])
-    ENG_CONSUMPTION_SOURCEPUMP08 = DataTag(["A802"])
-    ENG_CONSUMPTION_SOURCEPUMP09 = DataTag(["A804"])
-    ENG_CONSUMPTION_SOURCEPUMP10 = DataTag(["A805"])
-    ENG_CONSUMPTION_SOURCEPUMP11 = DataTag(["A806"])
-    ENG_CONSUMPTION_SOURCEPUMP12 = DataTag(["A807"])
+    COP_TOTAL_SYSTEM_LAST12M = DataTag(["A435"], poll=POLL_TIER_SLOW)
+    COOLING_ENERGY_LAST12M = DataTag(["A436"], "kWh", poll=POLL_TIER_SLOW)
+
+    ENG_CONSUMPTION_COMPRESSOR01 = DataTag(["A782"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR02 = DataTag(["A783"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR03 = DataTag(["A784"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR04 = DataTag(["A785"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR05 = DataTag(["A786"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR06 = DataTag(["A787"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR07 = DataTag(["A788"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR08 = DataTag(["A789"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR09 = DataTag(["A790"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR10 = DataTag(["A791"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR11 = DataTag(["A792"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_COMPRESSOR12 = DataTag(["A793"], poll=POLL_TIER_SLOW)
+
+    ENG_CONSUMPTION_SOURCEPUMP01 = DataTag(["A794"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP02 = DataTag(["A795"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP03 = DataTag(["A796"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP04 = DataTag(["A797"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP05 = DataTag(["A798"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP06 = DataTag(["A799"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP07 = DataTag(["A800"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP08 = DataTag(["A802"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP09 = DataTag(["A804"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP10 = DataTag(["A805"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP11 = DataTag(["A806"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_SOURCEPUMP12 = DataTag(["A807"], poll=POLL_TIER_SLOW)
 
     # Docs say it should start at 806 for external heater but there is an overlapp to source pump
-    ENG_CONSUMPTION_EXTERNALHEATER01 = DataTag(["A808"])
-    ENG_CONSUMPTION_EXTERNALHEATER02 = DataTag(["A809"])
-    ENG_CONSUMPTION_EXTERNALHEATER03 = DataTag(["A810"])
-    ENG_CONSUMPTION_EXTERNALHEATER04 = DataTag(["A811"])
-    ENG_CONSUMPTION_EXTERNALHEATER05 = DataTag(["A812"])
-    ENG_CONSUMPTION_EXTERNALHEATER06 = DataTag(["A813"])
-    ENG_CONSUMPTION_EXTERNALHEATER07 = DataTag(["A814"])
-    ENG_CONSUMPTION_EXTERNALHEATER08 = DataTag(["A815"])
-    ENG_CONSUMPTION_EXTERNALHEATER09 = DataTag(["A816"])
-    ENG_CONSUMPTION_EXTERNALHEATER10 = DataTag(["A817"])
-    ENG_CONSUMPTION_EXTERNALHEATER11 = DataTag(["A818"])
-    ENG_CONSUMPTION_EXTERNALHEATER12 = DataTag(["A819"])
-
-    ENG_PRODUCTION_HEATING01 = DataTag(["A830"])
-    ENG_PRODUCTION_HEATING02 = DataTag(["A831"])
-    ENG_PRODUCTION_HEATING03 = DataTag(["A832"])
-    ENG_PRODUCTION_HEATING04 = DataTag(["A833"])
-    ENG_PRODUCTION_HEATING05 = DataTag(["A834"])
-    ENG_PRODUCTION_HEATING06 = DataTag(["A835"])
-    ENG_PRODUCTION_HEATING07 = DataTag(["A836"])
-    ENG_PRODUCTION_HEATING08 = DataTag(["A837"])
-    ENG_PRODUCTION_HEATING09 = DataTag(["A838"])
-    ENG_PRODUCTION_HEATING10 = DataTag(["A839"])
-    ENG_PRODUCTION_HEATING11 = DataTag(["A840"])
-    ENG_PRODUCTION_HEATING12 = DataTag(["A841"])
-
-    ENG_PRODUCTION_WARMWATER01 = DataTag(["A842"])
-    ENG_PRODUCTION_WARMWATER02 = DataTag(["A843"])
-    ENG_PRODUCTION_WARMWATER03 = DataTag(["A844"])
-    ENG_PRODUCTION_WARMWATER04 = DataTag(["A845"])
-    ENG_PRODUCTION_WARMWATER05 = DataTag(["A846"])
-    ENG_PRODUCTION_WARMWATER06 = DataTag(["A847"])
-    ENG_PRODUCTION_WARMWATER07 = DataTag(["A848"])
-    ENG_PRODUCTION_WARMWATER08 = DataTag(["A849"])
-    ENG_PRODUCTION_WARMWATER09 = DataTag(["A850"])
-    ENG_PRODUCTION_WARMWATER10 = DataTag(["A851"])
-    ENG_PRODUCTION_WARMWATER11 = DataTag(["A852"])
-    ENG_PRODUCTION_WARMWATER12 = DataTag(["A853"])
-
-    ENG_PRODUCTION_POOL01 = DataTag(["A854"])
-    ENG_PRODUCTION_POOL02 = DataTag(["A855"])
-    ENG_PRODUCTION_POOL03 = DataTag(["A856"])
-    ENG_PRODUCTION_POOL04 = DataTag(["A857"])
-    ENG_PRODUCTION_POOL05 = DataTag(["A858"])
-    ENG_PRODUCTION_POOL06 = DataTag(["A859"])
-    ENG_PRODUCTION_POOL07 = DataTag(["A860"])
-    ENG_PRODUCTION_POOL08 = DataTag(["A861"])
-    ENG_PRODUCTION_POOL09 = DataTag(["A862"])
-    ENG_PRODUCTION_POOL10 = DataTag(["A863"])
-    ENG_PRODUCTION_POOL11 = DataTag(["A864"])
-    ENG_PRODUCTION_POOL12 = DataTag(["A865"])
-
-    ENG_HEATPUMP_COP_MONTH01 = DataTag(["A924"])
-    ENG_HEATPUMP_COP_MONTH02 = DataTag(["A925"])
-    ENG_HEATPUMP_COP_MONTH03 = DataTag(["A926"])
-    ENG_HEATPUMP_COP_MONTH04 = DataTag(["A927"])
-    ENG_HEATPUMP_COP_MONTH05 = DataTag(["A928"])
-    ENG_HEATPUMP_COP_MONTH06 = DataTag(["A929"])
-    ENG_HEATPUMP_COP_MONTH07 = DataTag(["A930"])
-    ENG_HEATPUMP_COP_MONTH08 = DataTag(["A930"])
-    ENG_HEATPUMP_COP_MONTH09 = DataTag(["A931"])
-    ENG_HEATPUMP_COP_MONTH10 = DataTag(["A932"])
-    ENG_HEATPUMP_COP_MONTH11 = DataTag(["A933"])
-    ENG_HEATPUMP_COP_MONTH12 = DataTag(["A934"])
+    ENG_CONSUMPTION_EXTERNALHEATER01 = DataTag(["A808"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER02 = DataTag(["A809"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER03 = DataTag(["A810"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER04 = DataTag(["A811"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER05 = DataTag(["A812"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER06 = DataTag(["A813"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER07 = DataTag(["A814"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER08 = DataTag(["A815"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER09 = DataTag(["A816"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER10 = DataTag(["A817"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER11 = DataTag(["A818"], poll=POLL_TIER_SLOW)
+    ENG_CONSUMPTION_EXTERNALHEATER12 = DataTag(["A819"], poll=POLL_TIER_SLOW)
+
+    ENG_PRODUCTION_HEATING01 = DataTag(["A830"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING02 = DataTag(["A831"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING03 = DataTag(["A832"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING04 = DataTag(["A833"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING05 = DataTag(["A834"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING06 = DataTag(["A835"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING07 = DataTag(["A836"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING08 = DataTag(["A837"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING09 = DataTag(["A838"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING10 = DataTag(["A839"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING11 = DataTag(["A840"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_HEATING12 = DataTag(["A841"], poll=POLL_TIER_SLOW)
+
+    ENG_PRODUCTION_WARMWATER01 = DataTag(["A842"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER02 = DataTag(["A843"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER03 = DataTag(["A844"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER04 = DataTag(["A845"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER05 = DataTag(["A846"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER06 = DataTag(["A847"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER07 = DataTag(["A848"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER08 = DataTag(["A849"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER09 = DataTag(["A850"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER10 = DataTag(["A851"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER11 = DataTag(["A852"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_WARMWATER12 = DataTag(["A853"], poll=POLL_TIER_SLOW)
+
+    ENG_PRODUCTION_POOL01 = DataTag(["A854"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL02 = DataTag(["A855"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL03 = DataTag(["A856"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL04 = DataTag(["A857"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL05 = DataTag(["A858"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL06 = DataTag(["A859"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL07 = DataTag(["A860"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL08 = DataTag(["A861"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL09 = DataTag(["A862"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL10 = DataTag(["A863"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL11 = DataTag(["A864"], poll=POLL_TIER_SLOW)
+    ENG_PRODUCTION_POOL12 = DataTag(["A865"], poll=POLL_TIER_SLOW)
+
+    ENG_HEATPUMP_COP_MONTH01 = DataTag(["A924"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH02 = DataTag(["A925"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH03 = DataTag(["A926"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH04 = DataTag(["A927"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH05 = DataTag(["A928"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH06 = DataTag(["A929"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH07 = DataTag(["A930"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH08 = DataTag(["A930"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH09 = DataTag(["A931"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH10 = DataTag(["A932"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH11 = DataTag(["A933"], poll=POLL_TIER_SLOW)
+    ENG_HEATPUMP_COP_MONTH12 = DataTag(["A934"], poll=POLL_TIER_SLOW)
 
     # Temperature stuff
     TEMPERATURE_HEATING = DataTag(["A30"], "°C")
@@ -836,12 +1047,12 @@ class WKHPTag(DataTag, Enum):
     TEMPERATURE_COLLECTOR = DataTag(["A42"], "°C")  # aktuelle Temperatur Kollektor
     TEMPERATURE_FLOW2 = DataTag(["A43"], "°C")  # aktuelle Temperatur Vorlauf
 
-    VERSION_CONTROLLER = DataTag(["I1", "I2"], decode_f=DataTag._decode_ro_fw)
+    VERSION_CONTROLLER = DataTag(["I1", "I2"], decode_f=DataTag._decode_ro_fw, poll=POLL_TIER_ON_DEMAND)
     # VERSION_CONTROLLER_BUILD = DataTag(["I2"])
-    VERSION_BIOS = DataTag(["I3"], decode_f=DataTag._decode_ro_bios)
+    VERSION_BIOS = DataTag(["I3"], decode_f=DataTag._decode_ro_bios, poll=POLL_TIER_ON_DEMAND)
     DATE_DAY = DataTag(["I5"])
     DATE_MONTH = DataTag(["I6"])
-    DATE_YEAR = DataTag(["I7"])
+    DATE_YEAR = DataTag(["I7"], poll=POLL_TIER_SLOW)
     TIME_HOUR = DataTag(["I8"])
     TIME_MINUTE = DataTag(["I9"])
 
@@ -871,11 +1082,11 @@ class WKHPTag(DataTag, Enum):
     # I28	interne Diagnosevariable
     # I29	interne Diagnosevariable
 
-    OPERATING_HOURS_COMPRESSOR_1 = DataTag(["I10"])
-    OPERATING_HOURS_COMPRESSOR_2 = DataTag(["I14"])
-    OPERATING_HOURS_CIRCULATION_PUMP = DataTag(["I18"])
-    OPERATING_HOURS_SOURCE_PUMP = DataTag(["I20"])
-    OPERATING_HOURS_SOLAR = DataTag(["I22"])
+    OPERATING_HOURS_COMPRESSOR_1 = DataTag(["I10"], poll=POLL_TIER_SLOW)
+    OPERATING_HOURS_COMPRESSOR_2 = DataTag(["I14"], poll=POLL_TIER_SLOW)
+    OPERATING_HOURS_CIRCULATION_PUMP = DataTag(["I18"], poll=POLL_TIER_SLOW)
+    OPERATING_HOURS_SOURCE_PUMP = DataTag(["I20"], poll=POLL_TIER_SLOW)
+    OPERATING_HOURS_SOLAR = DataTag(["I22"], poll=POLL_TIER_SLOW)
 
     # AI-Phantasie
     # I30–I39: Pumpen, Ventile, Durchfluss, Betriebszustände
@@ -971,9 +1182,9 @@ class WKHPTag(DataTag, Enum):
     STATUS_COMPRESSOR = DataTag(["I1307"], decode_f=DataTag._decode_status)
     MANUAL_MULTIEXT = DataTag(["I1319"])
 
-    INFO_SERIES = DataTag(["I105"], decode_f=DataTag._decode_ro_series)
-    INFO_ID = DataTag(["I110"], decode_f=DataTag._decode_ro_id)
-    INFO_SERIAL = DataTag(["I114", "I115"], decode_f=DataTag._decode_ro_sn)
+    INFO_SERIES = DataTag(["I105"], decode_f=DataTag._decode_ro_series, poll=POLL_TIER_ON_DEMAND)
+    INFO_ID = DataTag(["I110"], decode_f=DataTag._decode_ro_id, poll=POLL_TIER_ON_DEMAND)
+    INFO_SERIAL = DataTag(["I114", "I115"], decode_f=DataTag._decode_ro_sn, poll=POLL_TIER_ON_DEMAND)
     ADAPT_HEATING = DataTag(["I263"], writeable=True)
 
     STATE_BLOCKING_TIME = DataTag(["D71"])
@@ -1312,710 +1523,33 @@ class WKHPTag(DataTag, Enum):
     #####################################
     #####################################
     #####################################
-    # _1MO, _2TU, _3WE, _4TH, _5FR, _6SA, _7SU
-    SCHEDULE_HEATING_1MO_ENABLE = DataTag(['D42'], writeable=True)
-    SCHEDULE_HEATING_1MO_START_TIME = DataTag(['I151', 'I179'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_1MO_END_TIME = DataTag(['I207', 'I235'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_1MO_ADJUST1_ENABLE = DataTag(['D43'], writeable=True)
-    SCHEDULE_HEATING_1MO_ADJUST1_VALUE = DataTag(['A63'], writeable=True)
-    SCHEDULE_HEATING_1MO_ADJUST1_START_TIME = DataTag(['I152', 'I180'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_1MO_ADJUST1_END_TIME = DataTag(['I208', 'I236'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_1MO_ADJUST2_ENABLE = DataTag(['D44'], writeable=True)
-    SCHEDULE_HEATING_1MO_ADJUST2_VALUE = DataTag(['A64'], writeable=True)
-    SCHEDULE_HEATING_1MO_ADJUST2_START_TIME = DataTag(['I153', 'I181'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_1MO_ADJUST2_END_TIME = DataTag(['I209', 'I237'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_2TU_ENABLE = DataTag(['D46'], writeable=True)
-    SCHEDULE_HEATING_2TU_START_TIME = DataTag(['I155', 'I183'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_2TU_END_TIME = DataTag(['I211', 'I239'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_2TU_ADJUST1_ENABLE = DataTag(['D47'], writeable=True)
-    SCHEDULE_HEATING_2TU_ADJUST1_VALUE = DataTag(['A67'], writeable=True)
-    SCHEDULE_HEATING_2TU_ADJUST1_START_TIME = DataTag(['I156', 'I184'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_2TU_ADJUST1_END_TIME = DataTag(['I212', 'I240'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_2TU_ADJUST2_ENABLE = DataTag(['D48'], writeable=True)
-    SCHEDULE_HEATING_2TU_ADJUST2_VALUE = DataTag(['A68'], writeable=True)
-    SCHEDULE_HEATING_2TU_ADJUST2_START_TIME = DataTag(['I157', 'I185'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_2TU_ADJUST2_END_TIME = DataTag(['I213', 'I241'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_3WE_ENABLE = DataTag(['D50'], writeable=True)
-    SCHEDULE_HEATING_3WE_START_TIME = DataTag(['I159', 'I187'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_3WE_END_TIME = DataTag(['I215', 'I243'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_3WE_ADJUST1_ENABLE = DataTag(['D51'], writeable=True)
-    SCHEDULE_HEATING_3WE_ADJUST1_VALUE = DataTag(['A71'], writeable=True)
-    SCHEDULE_HEATING_3WE_ADJUST1_START_TIME = DataTag(['I160', 'I188'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_3WE_ADJUST1_END_TIME = DataTag(['I216', 'I244'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_3WE_ADJUST2_ENABLE = DataTag(['D52'], writeable=True)
-    SCHEDULE_HEATING_3WE_ADJUST2_VALUE = DataTag(['A72'], writeable=True)
-    SCHEDULE_HEATING_3WE_ADJUST2_START_TIME = DataTag(['I161', 'I189'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_3WE_ADJUST2_END_TIME = DataTag(['I217', 'I245'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_4TH_ENABLE = DataTag(['D54'], writeable=True)
-    SCHEDULE_HEATING_4TH_START_TIME = DataTag(['I163', 'I191'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_4TH_END_TIME = DataTag(['I219', 'I247'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_4TH_ADJUST1_ENABLE = DataTag(['D55'], writeable=True)
-    SCHEDULE_HEATING_4TH_ADJUST1_VALUE = DataTag(['A75'], writeable=True)
-    SCHEDULE_HEATING_4TH_ADJUST1_START_TIME = DataTag(['I164', 'I192'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_4TH_ADJUST1_END_TIME = DataTag(['I220', 'I248'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_4TH_ADJUST2_ENABLE = DataTag(['D56'], writeable=True)
-    SCHEDULE_HEATING_4TH_ADJUST2_VALUE = DataTag(['A76'], writeable=True)
-    SCHEDULE_HEATING_4TH_ADJUST2_START_TIME = DataTag(['I165', 'I193'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_4TH_ADJUST2_END_TIME = DataTag(['I221', 'I249'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_5FR_ENABLE = DataTag(['D58'], writeable=True)
-    SCHEDULE_HEATING_5FR_START_TIME = DataTag(['I167', 'I195'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_5FR_END_TIME = DataTag(['I223', 'I251'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_5FR_ADJUST1_ENABLE = DataTag(['D59'], writeable=True)
-    SCHEDULE_HEATING_5FR_ADJUST1_VALUE = DataTag(['A79'], writeable=True)
-    SCHEDULE_HEATING_5FR_ADJUST1_START_TIME = DataTag(['I168', 'I196'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_5FR_ADJUST1_END_TIME = DataTag(['I224', 'I252'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_5FR_ADJUST2_ENABLE = DataTag(['D60'], writeable=True)
-    SCHEDULE_HEATING_5FR_ADJUST2_VALUE = DataTag(['A80'], writeable=True)
-    SCHEDULE_HEATING_5FR_ADJUST2_START_TIME = DataTag(['I169', 'I197'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_5FR_ADJUST2_END_TIME = DataTag(['I225', 'I253'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_6SA_ENABLE = DataTag(['D62'], writeable=True)
-    SCHEDULE_HEATING_6SA_START_TIME = DataTag(['I171', 'I199'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_6SA_END_TIME = DataTag(['I227', 'I255'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_6SA_ADJUST1_ENABLE = DataTag(['D63'], writeable=True)
-    SCHEDULE_HEATING_6SA_ADJUST1_VALUE = DataTag(['A83'], writeable=True)
-    SCHEDULE_HEATING_6SA_ADJUST1_START_TIME = DataTag(['I172', 'I200'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_6SA_ADJUST1_END_TIME = DataTag(['I228', 'I256'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_6SA_ADJUST2_ENABLE = DataTag(['D64'], writeable=True)
-    SCHEDULE_HEATING_6SA_ADJUST2_VALUE = DataTag(['A84'], writeable=True)
-    SCHEDULE_HEATING_6SA_ADJUST2_START_TIME = DataTag(['I173', 'I201'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_6SA_ADJUST2_END_TIME = DataTag(['I229', 'I257'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_7SU_ENABLE = DataTag(['D66'], writeable=True)
-    SCHEDULE_HEATING_7SU_START_TIME = DataTag(['I175', 'I203'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_7SU_END_TIME = DataTag(['I231', 'I259'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_7SU_ADJUST1_ENABLE = DataTag(['D67'], writeable=True)
-    SCHEDULE_HEATING_7SU_ADJUST1_VALUE = DataTag(['A87'], writeable=True)
-    SCHEDULE_HEATING_7SU_ADJUST1_START_TIME = DataTag(['I176', 'I204'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_7SU_ADJUST1_END_TIME = DataTag(['I232', 'I260'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_7SU_ADJUST2_ENABLE = DataTag(['D68'], writeable=True)
-    SCHEDULE_HEATING_7SU_ADJUST2_VALUE = DataTag(['A88'], writeable=True)
-    SCHEDULE_HEATING_7SU_ADJUST2_START_TIME = DataTag(['I177', 'I205'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_HEATING_7SU_ADJUST2_END_TIME = DataTag(['I233', 'I261'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_1MO_ENABLE = DataTag(['D86'], writeable=True)
-    SCHEDULE_COOLING_1MO_START_TIME = DataTag(['I276', 'I304'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_1MO_END_TIME = DataTag(['I332', 'I360'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_1MO_ADJUST1_ENABLE = DataTag(['D87'], writeable=True)
-    SCHEDULE_COOLING_1MO_ADJUST1_VALUE = DataTag(['A112'], writeable=True)
-    SCHEDULE_COOLING_1MO_ADJUST1_START_TIME = DataTag(['I277', 'I305'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_1MO_ADJUST1_END_TIME = DataTag(['I333', 'I361'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_1MO_ADJUST2_ENABLE = DataTag(['D88'], writeable=True)
-    SCHEDULE_COOLING_1MO_ADJUST2_VALUE = DataTag(['A113'], writeable=True)
-    SCHEDULE_COOLING_1MO_ADJUST2_START_TIME = DataTag(['I278', 'I306'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_1MO_ADJUST2_END_TIME = DataTag(['I334', 'I362'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_2TU_ENABLE = DataTag(['D90'], writeable=True)
-    SCHEDULE_COOLING_2TU_START_TIME = DataTag(['I280', 'I308'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_2TU_END_TIME = DataTag(['I336', 'I364'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_2TU_ADJUST1_ENABLE = DataTag(['D91'], writeable=True)
-    SCHEDULE_COOLING_2TU_ADJUST1_VALUE = DataTag(['A116'], writeable=True)
-    SCHEDULE_COOLING_2TU_ADJUST1_START_TIME = DataTag(['I281', 'I309'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_2TU_ADJUST1_END_TIME = DataTag(['I337', 'I365'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_2TU_ADJUST2_ENABLE = DataTag(['D92'], writeable=True)
-    SCHEDULE_COOLING_2TU_ADJUST2_VALUE = DataTag(['A117'], writeable=True)
-    SCHEDULE_COOLING_2TU_ADJUST2_START_TIME = DataTag(['I282', 'I310'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_2TU_ADJUST2_END_TIME = DataTag(['I338', 'I366'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_3WE_ENABLE = DataTag(['D94'], writeable=True)
-    SCHEDULE_COOLING_3WE_START_TIME = DataTag(['I284', 'I312'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_3WE_END_TIME = DataTag(['I340', 'I368'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_3WE_ADJUST1_ENABLE = DataTag(['D95'], writeable=True)
-    SCHEDULE_COOLING_3WE_ADJUST1_VALUE = DataTag(['A120'], writeable=True)
-    SCHEDULE_COOLING_3WE_ADJUST1_START_TIME = DataTag(['I285', 'I313'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_3WE_ADJUST1_END_TIME = DataTag(['I341', 'I369'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_3WE_ADJUST2_ENABLE = DataTag(['D96'], writeable=True)
-    SCHEDULE_COOLING_3WE_ADJUST2_VALUE = DataTag(['A121'], writeable=True)
-    SCHEDULE_COOLING_3WE_ADJUST2_START_TIME = DataTag(['I286', 'I314'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_3WE_ADJUST2_END_TIME = DataTag(['I342', 'I370'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_4TH_ENABLE = DataTag(['D98'], writeable=True)
-    SCHEDULE_COOLING_4TH_START_TIME = DataTag(['I288', 'I316'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_4TH_END_TIME = DataTag(['I344', 'I372'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_4TH_ADJUST1_ENABLE = DataTag(['D99'], writeable=True)
-    SCHEDULE_COOLING_4TH_ADJUST1_VALUE = DataTag(['A124'], writeable=True)
-    SCHEDULE_COOLING_4TH_ADJUST1_START_TIME = DataTag(['I289', 'I317'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_4TH_ADJUST1_END_TIME = DataTag(['I345', 'I373'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_4TH_ADJUST2_ENABLE = DataTag(['D100'], writeable=True)
-    SCHEDULE_COOLING_4TH_ADJUST2_VALUE = DataTag(['A125'], writeable=True)
-    SCHEDULE_COOLING_4TH_ADJUST2_START_TIME = DataTag(['I290', 'I318'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_4TH_ADJUST2_END_TIME = DataTag(['I346', 'I374'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_5FR_ENABLE = DataTag(['D102'], writeable=True)
-    SCHEDULE_COOLING_5FR_START_TIME = DataTag(['I292', 'I320'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_5FR_END_TIME = DataTag(['I348', 'I376'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_5FR_ADJUST1_ENABLE = DataTag(['D103'], writeable=True)
-    SCHEDULE_COOLING_5FR_ADJUST1_VALUE = DataTag(['A128'], writeable=True)
-    SCHEDULE_COOLING_5FR_ADJUST1_START_TIME = DataTag(['I293', 'I321'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_5FR_ADJUST1_END_TIME = DataTag(['I349', 'I377'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_5FR_ADJUST2_ENABLE = DataTag(['D104'], writeable=True)
-    SCHEDULE_COOLING_5FR_ADJUST2_VALUE = DataTag(['A129'], writeable=True)
-    SCHEDULE_COOLING_5FR_ADJUST2_START_TIME = DataTag(['I294', 'I322'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_5FR_ADJUST2_END_TIME = DataTag(['I350', 'I378'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_6SA_ENABLE = DataTag(['D106'], writeable=True)
-    SCHEDULE_COOLING_6SA_START_TIME = DataTag(['I296', 'I324'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_6SA_END_TIME = DataTag(['I352', 'I380'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_6SA_ADJUST1_ENABLE = DataTag(['D107'], writeable=True)
-    SCHEDULE_COOLING_6SA_ADJUST1_VALUE = DataTag(['A132'], writeable=True)
-    SCHEDULE_COOLING_6SA_ADJUST1_START_TIME = DataTag(['I297', 'I325'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_6SA_ADJUST1_END_TIME = DataTag(['I353', 'I381'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_6SA_ADJUST2_ENABLE = DataTag(['D108'], writeable=True)
-    SCHEDULE_COOLING_6SA_ADJUST2_VALUE = DataTag(['A133'], writeable=True)
-    SCHEDULE_COOLING_6SA_ADJUST2_START_TIME = DataTag(['I298', 'I326'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_6SA_ADJUST2_END_TIME = DataTag(['I354', 'I382'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_7SU_ENABLE = DataTag(['D110'], writeable=True)
-    SCHEDULE_COOLING_7SU_START_TIME = DataTag(['I300', 'I328'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_7SU_END_TIME = DataTag(['I356', 'I384'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_7SU_ADJUST1_ENABLE = DataTag(['D111'], writeable=True)
-    SCHEDULE_COOLING_7SU_ADJUST1_VALUE = DataTag(['A136'], writeable=True)
-    SCHEDULE_COOLING_7SU_ADJUST1_START_TIME = DataTag(['I301', 'I329'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_7SU_ADJUST1_END_TIME = DataTag(['I357', 'I385'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_7SU_ADJUST2_ENABLE = DataTag(['D112'], writeable=True)
-    SCHEDULE_COOLING_7SU_ADJUST2_VALUE = DataTag(['A137'], writeable=True)
-    SCHEDULE_COOLING_7SU_ADJUST2_START_TIME = DataTag(['I302', 'I330'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_COOLING_7SU_ADJUST2_END_TIME = DataTag(['I358', 'I386'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_1MO_ENABLE = DataTag(['D125'], writeable=True)
-    SCHEDULE_WATER_1MO_START_TIME = DataTag(['I393', 'I421'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_1MO_END_TIME = DataTag(['I449', 'I447'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_1MO_ADJUST1_ENABLE = DataTag(['D126'], writeable=True)
-    SCHEDULE_WATER_1MO_ADJUST1_VALUE = DataTag(['A141'], writeable=True)
-    SCHEDULE_WATER_1MO_ADJUST1_START_TIME = DataTag(['I394', 'I422'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_1MO_ADJUST1_END_TIME = DataTag(['I450', 'I448'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_1MO_ADJUST2_ENABLE = DataTag(['D127'], writeable=True)
-    SCHEDULE_WATER_1MO_ADJUST2_VALUE = DataTag(['A142'], writeable=True)
-    SCHEDULE_WATER_1MO_ADJUST2_START_TIME = DataTag(['I395', 'I423'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_1MO_ADJUST2_END_TIME = DataTag(['I451', 'I449'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_2TU_ENABLE = DataTag(['D129'], writeable=True)
-    SCHEDULE_WATER_2TU_START_TIME = DataTag(['I397', 'I425'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_2TU_END_TIME = DataTag(['I453', 'I451'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_2TU_ADJUST1_ENABLE = DataTag(['D130'], writeable=True)
-    SCHEDULE_WATER_2TU_ADJUST1_VALUE = DataTag(['A145'], writeable=True)
-    SCHEDULE_WATER_2TU_ADJUST1_START_TIME = DataTag(['I398', 'I426'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_2TU_ADJUST1_END_TIME = DataTag(['I454', 'I452'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_2TU_ADJUST2_ENABLE = DataTag(['D131'], writeable=True)
-    SCHEDULE_WATER_2TU_ADJUST2_VALUE = DataTag(['A146'], writeable=True)
-    SCHEDULE_WATER_2TU_ADJUST2_START_TIME = DataTag(['I399', 'I427'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_2TU_ADJUST2_END_TIME = DataTag(['I455', 'I453'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_3WE_ENABLE = DataTag(['D133'], writeable=True)
-    SCHEDULE_WATER_3WE_START_TIME = DataTag(['I401', 'I429'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_3WE_END_TIME = DataTag(['I457', 'I455'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_3WE_ADJUST1_ENABLE = DataTag(['D134'], writeable=True)
-    SCHEDULE_WATER_3WE_ADJUST1_VALUE = DataTag(['A149'], writeable=True)
-    SCHEDULE_WATER_3WE_ADJUST1_START_TIME = DataTag(['I402', 'I430'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_3WE_ADJUST1_END_TIME = DataTag(['I458', 'I456'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_3WE_ADJUST2_ENABLE = DataTag(['D135'], writeable=True)
-    SCHEDULE_WATER_3WE_ADJUST2_VALUE = DataTag(['A150'], writeable=True)
-    SCHEDULE_WATER_3WE_ADJUST2_START_TIME = DataTag(['I403', 'I431'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_3WE_ADJUST2_END_TIME = DataTag(['I459', 'I457'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_4TH_ENABLE = DataTag(['D137'], writeable=True)
-    SCHEDULE_WATER_4TH_START_TIME = DataTag(['I405', 'I433'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_4TH_END_TIME = DataTag(['I461', 'I459'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_4TH_ADJUST1_ENABLE = DataTag(['D138'], writeable=True)
-    SCHEDULE_WATER_4TH_ADJUST1_VALUE = DataTag(['A153'], writeable=True)
-    SCHEDULE_WATER_4TH_ADJUST1_START_TIME = DataTag(['I406', 'I434'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_4TH_ADJUST1_END_TIME = DataTag(['I462', 'I460'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_4TH_ADJUST2_ENABLE = DataTag(['D139'], writeable=True)
-    SCHEDULE_WATER_4TH_ADJUST2_VALUE = DataTag(['A154'], writeable=True)
-    SCHEDULE_WATER_4TH_ADJUST2_START_TIME = DataTag(['I407', 'I435'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_4TH_ADJUST2_END_TIME = DataTag(['I463', 'I461'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_5FR_ENABLE = DataTag(['D141'], writeable=True)
-    SCHEDULE_WATER_5FR_START_TIME = DataTag(['I409', 'I437'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_5FR_END_TIME = DataTag(['I465', 'I463'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_5FR_ADJUST1_ENABLE = DataTag(['D142'], writeable=True)
-    SCHEDULE_WATER_5FR_ADJUST1_VALUE = DataTag(['A157'], writeable=True)
-    SCHEDULE_WATER_5FR_ADJUST1_START_TIME = DataTag(['I410', 'I438'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_5FR_ADJUST1_END_TIME = DataTag(['I466', 'I464'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_5FR_ADJUST2_ENABLE = DataTag(['D143'], writeable=True)
-    SCHEDULE_WATER_5FR_ADJUST2_VALUE = DataTag(['A158'], writeable=True)
-    SCHEDULE_WATER_5FR_ADJUST2_START_TIME = DataTag(['I411', 'I439'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_5FR_ADJUST2_END_TIME = DataTag(['I467', 'I465'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_6SA_ENABLE = DataTag(['D145'], writeable=True)
-    SCHEDULE_WATER_6SA_START_TIME = DataTag(['I413', 'I441'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_6SA_END_TIME = DataTag(['I469', 'I467'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_6SA_ADJUST1_ENABLE = DataTag(['D146'], writeable=True)
-    SCHEDULE_WATER_6SA_ADJUST1_VALUE = DataTag(['A161'], writeable=True)
-    SCHEDULE_WATER_6SA_ADJUST1_START_TIME = DataTag(['I414', 'I442'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_6SA_ADJUST1_END_TIME = DataTag(['I470', 'I468'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_6SA_ADJUST2_ENABLE = DataTag(['D147'], writeable=True)
-    SCHEDULE_WATER_6SA_ADJUST2_VALUE = DataTag(['A162'], writeable=True)
-    SCHEDULE_WATER_6SA_ADJUST2_START_TIME = DataTag(['I415', 'I443'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_6SA_ADJUST2_END_TIME = DataTag(['I471', 'I469'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_7SU_ENABLE = DataTag(['D149'], writeable=True)
-    SCHEDULE_WATER_7SU_START_TIME = DataTag(['I417', 'I445'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_7SU_END_TIME = DataTag(['I473', 'I471'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_7SU_ADJUST1_ENABLE = DataTag(['D150'], writeable=True)
-    SCHEDULE_WATER_7SU_ADJUST1_VALUE = DataTag(['A165'], writeable=True)
-    SCHEDULE_WATER_7SU_ADJUST1_START_TIME = DataTag(['I418', 'I446'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_7SU_ADJUST1_END_TIME = DataTag(['I474', 'I472'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_7SU_ADJUST2_ENABLE = DataTag(['D151'], writeable=True)
-    SCHEDULE_WATER_7SU_ADJUST2_VALUE = DataTag(['A166'], writeable=True)
-    SCHEDULE_WATER_7SU_ADJUST2_START_TIME = DataTag(['I419', 'I447'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_WATER_7SU_ADJUST2_END_TIME = DataTag(['I475', 'I473'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_1MO_ENABLE = DataTag(['D168'], writeable=True)
-    SCHEDULE_POOL_1MO_START_TIME = DataTag(['I528', 'I556'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_1MO_END_TIME = DataTag(['I584', 'I612'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_1MO_ADJUST1_ENABLE = DataTag(['D169'], writeable=True)
-    SCHEDULE_POOL_1MO_ADJUST1_VALUE = DataTag(['A176'], writeable=True)
-    SCHEDULE_POOL_1MO_ADJUST1_START_TIME = DataTag(['I529', 'I557'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_1MO_ADJUST1_END_TIME = DataTag(['I585', 'I613'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_1MO_ADJUST2_ENABLE = DataTag(['D170'], writeable=True)
-    SCHEDULE_POOL_1MO_ADJUST2_VALUE = DataTag(['A177'], writeable=True)
-    SCHEDULE_POOL_1MO_ADJUST2_START_TIME = DataTag(['I530', 'I558'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_1MO_ADJUST2_END_TIME = DataTag(['I586', 'I614'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_2TU_ENABLE = DataTag(['D172'], writeable=True)
-    SCHEDULE_POOL_2TU_START_TIME = DataTag(['I532', 'I560'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_2TU_END_TIME = DataTag(['I588', 'I616'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_2TU_ADJUST1_ENABLE = DataTag(['D173'], writeable=True)
-    SCHEDULE_POOL_2TU_ADJUST1_VALUE = DataTag(['A180'], writeable=True)
-    SCHEDULE_POOL_2TU_ADJUST1_START_TIME = DataTag(['I533', 'I561'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_2TU_ADJUST1_END_TIME = DataTag(['I589', 'I617'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_2TU_ADJUST2_ENABLE = DataTag(['D174'], writeable=True)
-    SCHEDULE_POOL_2TU_ADJUST2_VALUE = DataTag(['A181'], writeable=True)
-    SCHEDULE_POOL_2TU_ADJUST2_START_TIME = DataTag(['I534', 'I562'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_2TU_ADJUST2_END_TIME = DataTag(['I590', 'I618'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_3WE_ENABLE = DataTag(['D176'], writeable=True)
-    SCHEDULE_POOL_3WE_START_TIME = DataTag(['I536', 'I564'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_3WE_END_TIME = DataTag(['I592', 'I620'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_3WE_ADJUST1_ENABLE = DataTag(['D177'], writeable=True)
-    SCHEDULE_POOL_3WE_ADJUST1_VALUE = DataTag(['A184'], writeable=True)
-    SCHEDULE_POOL_3WE_ADJUST1_START_TIME = DataTag(['I537', 'I565'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_3WE_ADJUST1_END_TIME = DataTag(['I593', 'I621'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_3WE_ADJUST2_ENABLE = DataTag(['D178'], writeable=True)
-    SCHEDULE_POOL_3WE_ADJUST2_VALUE = DataTag(['A185'], writeable=True)
-    SCHEDULE_POOL_3WE_ADJUST2_START_TIME = DataTag(['I538', 'I566'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_3WE_ADJUST2_END_TIME = DataTag(['I594', 'I622'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_4TH_ENABLE = DataTag(['D180'], writeable=True)
-    SCHEDULE_POOL_4TH_START_TIME = DataTag(['I540', 'I568'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_4TH_END_TIME = DataTag(['I596', 'I624'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_4TH_ADJUST1_ENABLE = DataTag(['D181'], writeable=True)
-    SCHEDULE_POOL_4TH_ADJUST1_VALUE = DataTag(['A188'], writeable=True)
-    SCHEDULE_POOL_4TH_ADJUST1_START_TIME = DataTag(['I541', 'I569'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_4TH_ADJUST1_END_TIME = DataTag(['I597', 'I625'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_4TH_ADJUST2_ENABLE = DataTag(['D182'], writeable=True)
-    SCHEDULE_POOL_4TH_ADJUST2_VALUE = DataTag(['A189'], writeable=True)
-    SCHEDULE_POOL_4TH_ADJUST2_START_TIME = DataTag(['I542', 'I570'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_4TH_ADJUST2_END_TIME = DataTag(['I598', 'I626'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_5FR_ENABLE = DataTag(['D184'], writeable=True)
-    SCHEDULE_POOL_5FR_START_TIME = DataTag(['I544', 'I572'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_5FR_END_TIME = DataTag(['I600', 'I628'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_5FR_ADJUST1_ENABLE = DataTag(['D185'], writeable=True)
-    SCHEDULE_POOL_5FR_ADJUST1_VALUE = DataTag(['A192'], writeable=True)
-    SCHEDULE_POOL_5FR_ADJUST1_START_TIME = DataTag(['I545', 'I573'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_5FR_ADJUST1_END_TIME = DataTag(['I601', 'I629'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_5FR_ADJUST2_ENABLE = DataTag(['D186'], writeable=True)
-    SCHEDULE_POOL_5FR_ADJUST2_VALUE = DataTag(['A193'], writeable=True)
-    SCHEDULE_POOL_5FR_ADJUST2_START_TIME = DataTag(['I546', 'I574'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_5FR_ADJUST2_END_TIME = DataTag(['I602', 'I630'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_6SA_ENABLE = DataTag(['D188'], writeable=True)
-    SCHEDULE_POOL_6SA_START_TIME = DataTag(['I548', 'I576'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_6SA_END_TIME = DataTag(['I604', 'I632'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_6SA_ADJUST1_ENABLE = DataTag(['D189'], writeable=True)
-    SCHEDULE_POOL_6SA_ADJUST1_VALUE = DataTag(['A196'], writeable=True)
-    SCHEDULE_POOL_6SA_ADJUST1_START_TIME = DataTag(['I549', 'I577'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_6SA_ADJUST1_END_TIME = DataTag(['I605', 'I633'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_6SA_ADJUST2_ENABLE = DataTag(['D190'], writeable=True)
-    SCHEDULE_POOL_6SA_ADJUST2_VALUE = DataTag(['A197'], writeable=True)
-    SCHEDULE_POOL_6SA_ADJUST2_START_TIME = DataTag(['I550', 'I578'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_6SA_ADJUST2_END_TIME = DataTag(['I606', 'I634'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_7SU_ENABLE = DataTag(['D192'], writeable=True)
-    SCHEDULE_POOL_7SU_START_TIME = DataTag(['I552', 'I580'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_7SU_END_TIME = DataTag(['I608', 'I636'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_7SU_ADJUST1_ENABLE = DataTag(['D193'], writeable=True)
-    SCHEDULE_POOL_7SU_ADJUST1_VALUE = DataTag(['A200'], writeable=True)
-    SCHEDULE_POOL_7SU_ADJUST1_START_TIME = DataTag(['I553', 'I581'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_7SU_ADJUST1_END_TIME = DataTag(['I609', 'I637'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_7SU_ADJUST2_ENABLE = DataTag(['D194'], writeable=True)
-    SCHEDULE_POOL_7SU_ADJUST2_VALUE = DataTag(['A201'], writeable=True)
-    SCHEDULE_POOL_7SU_ADJUST2_START_TIME = DataTag(['I554', 'I582'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_POOL_7SU_ADJUST2_END_TIME = DataTag(['I610', 'I638'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_1MO_ENABLE = DataTag(['D259'], writeable=True)
-    SCHEDULE_MIX1_1MO_START_TIME = DataTag(['I777', 'I805'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_1MO_END_TIME = DataTag(['I833', 'I861'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_1MO_ADJUST1_ENABLE = DataTag(['D260'], writeable=True)
-    SCHEDULE_MIX1_1MO_ADJUST1_VALUE = DataTag(['A247'], writeable=True)
-    SCHEDULE_MIX1_1MO_ADJUST1_START_TIME = DataTag(['I778', 'I806'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_1MO_ADJUST1_END_TIME = DataTag(['I834', 'I862'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_1MO_ADJUST2_ENABLE = DataTag(['D261'], writeable=True)
-    SCHEDULE_MIX1_1MO_ADJUST2_VALUE = DataTag(['A248'], writeable=True)
-    SCHEDULE_MIX1_1MO_ADJUST2_START_TIME = DataTag(['I779', 'I807'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_1MO_ADJUST2_END_TIME = DataTag(['I835', 'I863'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_2TU_ENABLE = DataTag(['D263'], writeable=True)
-    SCHEDULE_MIX1_2TU_START_TIME = DataTag(['I781', 'I809'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_2TU_END_TIME = DataTag(['I837', 'I865'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_2TU_ADJUST1_ENABLE = DataTag(['D264'], writeable=True)
-    SCHEDULE_MIX1_2TU_ADJUST1_VALUE = DataTag(['A251'], writeable=True)
-    SCHEDULE_MIX1_2TU_ADJUST1_START_TIME = DataTag(['I782', 'I810'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_2TU_ADJUST1_END_TIME = DataTag(['I838', 'I866'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_2TU_ADJUST2_ENABLE = DataTag(['D265'], writeable=True)
-    SCHEDULE_MIX1_2TU_ADJUST2_VALUE = DataTag(['A252'], writeable=True)
-    SCHEDULE_MIX1_2TU_ADJUST2_START_TIME = DataTag(['I783', 'I811'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_2TU_ADJUST2_END_TIME = DataTag(['I839', 'I867'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_3WE_ENABLE = DataTag(['D267'], writeable=True)
-    SCHEDULE_MIX1_3WE_START_TIME = DataTag(['I785', 'I813'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_3WE_END_TIME = DataTag(['I841', 'I869'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_3WE_ADJUST1_ENABLE = DataTag(['D268'], writeable=True)
-    SCHEDULE_MIX1_3WE_ADJUST1_VALUE = DataTag(['A255'], writeable=True)
-    SCHEDULE_MIX1_3WE_ADJUST1_START_TIME = DataTag(['I786', 'I814'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_3WE_ADJUST1_END_TIME = DataTag(['I842', 'I870'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_3WE_ADJUST2_ENABLE = DataTag(['D269'], writeable=True)
-    SCHEDULE_MIX1_3WE_ADJUST2_VALUE = DataTag(['A256'], writeable=True)
-    SCHEDULE_MIX1_3WE_ADJUST2_START_TIME = DataTag(['I787', 'I815'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_3WE_ADJUST2_END_TIME = DataTag(['I843', 'I871'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_4TH_ENABLE = DataTag(['D271'], writeable=True)
-    SCHEDULE_MIX1_4TH_START_TIME = DataTag(['I789', 'I817'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_4TH_END_TIME = DataTag(['I845', 'I873'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_4TH_ADJUST1_ENABLE = DataTag(['D272'], writeable=True)
-    SCHEDULE_MIX1_4TH_ADJUST1_VALUE = DataTag(['A259'], writeable=True)
-    SCHEDULE_MIX1_4TH_ADJUST1_START_TIME = DataTag(['I790', 'I818'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_4TH_ADJUST1_END_TIME = DataTag(['I846', 'I874'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_4TH_ADJUST2_ENABLE = DataTag(['D273'], writeable=True)
-    SCHEDULE_MIX1_4TH_ADJUST2_VALUE = DataTag(['A260'], writeable=True)
-    SCHEDULE_MIX1_4TH_ADJUST2_START_TIME = DataTag(['I791', 'I819'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_4TH_ADJUST2_END_TIME = DataTag(['I847', 'I875'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_5FR_ENABLE = DataTag(['D275'], writeable=True)
-    SCHEDULE_MIX1_5FR_START_TIME = DataTag(['I793', 'I821'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_5FR_END_TIME = DataTag(['I849', 'I877'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_5FR_ADJUST1_ENABLE = DataTag(['D276'], writeable=True)
-    SCHEDULE_MIX1_5FR_ADJUST1_VALUE = DataTag(['A263'], writeable=True)
-    SCHEDULE_MIX1_5FR_ADJUST1_START_TIME = DataTag(['I794', 'I822'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_5FR_ADJUST1_END_TIME = DataTag(['I850', 'I878'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_5FR_ADJUST2_ENABLE = DataTag(['D277'], writeable=True)
-    SCHEDULE_MIX1_5FR_ADJUST2_VALUE = DataTag(['A264'], writeable=True)
-    SCHEDULE_MIX1_5FR_ADJUST2_START_TIME = DataTag(['I795', 'I823'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_5FR_ADJUST2_END_TIME = DataTag(['I851', 'I879'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_6SA_ENABLE = DataTag(['D279'], writeable=True)
-    SCHEDULE_MIX1_6SA_START_TIME = DataTag(['I797', 'I825'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_6SA_END_TIME = DataTag(['I853', 'I881'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_6SA_ADJUST1_ENABLE = DataTag(['D280'], writeable=True)
-    SCHEDULE_MIX1_6SA_ADJUST1_VALUE = DataTag(['A267'], writeable=True)
-    SCHEDULE_MIX1_6SA_ADJUST1_START_TIME = DataTag(['I798', 'I826'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_6SA_ADJUST1_END_TIME = DataTag(['I854', 'I882'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_6SA_ADJUST2_ENABLE = DataTag(['D281'], writeable=True)
-    SCHEDULE_MIX1_6SA_ADJUST2_VALUE = DataTag(['A268'], writeable=True)
-    SCHEDULE_MIX1_6SA_ADJUST2_START_TIME = DataTag(['I799', 'I827'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_6SA_ADJUST2_END_TIME = DataTag(['I855', 'I883'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_7SU_ENABLE = DataTag(['D283'], writeable=True)
-    SCHEDULE_MIX1_7SU_START_TIME = DataTag(['I801', 'I829'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_7SU_END_TIME = DataTag(['I857', 'I885'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_7SU_ADJUST1_ENABLE = DataTag(['D284'], writeable=True)
-    SCHEDULE_MIX1_7SU_ADJUST1_VALUE = DataTag(['A271'], writeable=True)
-    SCHEDULE_MIX1_7SU_ADJUST1_START_TIME = DataTag(['I802', 'I830'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_7SU_ADJUST1_END_TIME = DataTag(['I858', 'I886'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_7SU_ADJUST2_ENABLE = DataTag(['D285'], writeable=True)
-    SCHEDULE_MIX1_7SU_ADJUST2_VALUE = DataTag(['A272'], writeable=True)
-    SCHEDULE_MIX1_7SU_ADJUST2_START_TIME = DataTag(['I803', 'I831'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX1_7SU_ADJUST2_END_TIME = DataTag(['I859', 'I887'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_1MO_ENABLE = DataTag(['D302'], writeable=True)
-    SCHEDULE_MIX2_1MO_START_TIME = DataTag(['I897', 'I925'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_1MO_END_TIME = DataTag(['I953', 'I981'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_1MO_ADJUST1_ENABLE = DataTag(['D303'], writeable=True)
-    SCHEDULE_MIX2_1MO_ADJUST1_VALUE = DataTag(['A293'], writeable=True)
-    SCHEDULE_MIX2_1MO_ADJUST1_START_TIME = DataTag(['I898', 'I926'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_1MO_ADJUST1_END_TIME = DataTag(['I954', 'I982'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_1MO_ADJUST2_ENABLE = DataTag(['D304'], writeable=True)
-    SCHEDULE_MIX2_1MO_ADJUST2_VALUE = DataTag(['A294'], writeable=True)
-    SCHEDULE_MIX2_1MO_ADJUST2_START_TIME = DataTag(['I899', 'I927'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_1MO_ADJUST2_END_TIME = DataTag(['I955', 'I983'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_2TU_ENABLE = DataTag(['D306'], writeable=True)
-    SCHEDULE_MIX2_2TU_START_TIME = DataTag(['I901', 'I929'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_2TU_END_TIME = DataTag(['I957', 'I985'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_2TU_ADJUST1_ENABLE = DataTag(['D307'], writeable=True)
-    SCHEDULE_MIX2_2TU_ADJUST1_VALUE = DataTag(['A297'], writeable=True)
-    SCHEDULE_MIX2_2TU_ADJUST1_START_TIME = DataTag(['I902', 'I930'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_2TU_ADJUST1_END_TIME = DataTag(['I958', 'I986'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_2TU_ADJUST2_ENABLE = DataTag(['D308'], writeable=True)
-    SCHEDULE_MIX2_2TU_ADJUST2_VALUE = DataTag(['A298'], writeable=True)
-    SCHEDULE_MIX2_2TU_ADJUST2_START_TIME = DataTag(['I903', 'I931'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_2TU_ADJUST2_END_TIME = DataTag(['I959', 'I987'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_3WE_ENABLE = DataTag(['D310'], writeable=True)
-    SCHEDULE_MIX2_3WE_START_TIME = DataTag(['I905', 'I933'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_3WE_END_TIME = DataTag(['I961', 'I989'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_3WE_ADJUST1_ENABLE = DataTag(['D311'], writeable=True)
-    SCHEDULE_MIX2_3WE_ADJUST1_VALUE = DataTag(['A301'], writeable=True)
-    SCHEDULE_MIX2_3WE_ADJUST1_START_TIME = DataTag(['I906', 'I934'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_3WE_ADJUST1_END_TIME = DataTag(['I962', 'I990'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_3WE_ADJUST2_ENABLE = DataTag(['D312'], writeable=True)
-    SCHEDULE_MIX2_3WE_ADJUST2_VALUE = DataTag(['A302'], writeable=True)
-    SCHEDULE_MIX2_3WE_ADJUST2_START_TIME = DataTag(['I907', 'I935'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_3WE_ADJUST2_END_TIME = DataTag(['I963', 'I991'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_4TH_ENABLE = DataTag(['D314'], writeable=True)
-    SCHEDULE_MIX2_4TH_START_TIME = DataTag(['I909', 'I937'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_4TH_END_TIME = DataTag(['I965', 'I993'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_4TH_ADJUST1_ENABLE = DataTag(['D315'], writeable=True)
-    SCHEDULE_MIX2_4TH_ADJUST1_VALUE = DataTag(['A305'], writeable=True)
-    SCHEDULE_MIX2_4TH_ADJUST1_START_TIME = DataTag(['I910', 'I938'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_4TH_ADJUST1_END_TIME = DataTag(['I966', 'I994'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_4TH_ADJUST2_ENABLE = DataTag(['D316'], writeable=True)
-    SCHEDULE_MIX2_4TH_ADJUST2_VALUE = DataTag(['A306'], writeable=True)
-    SCHEDULE_MIX2_4TH_ADJUST2_START_TIME = DataTag(['I911', 'I939'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_4TH_ADJUST2_END_TIME = DataTag(['I967', 'I995'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_5FR_ENABLE = DataTag(['D318'], writeable=True)
-    SCHEDULE_MIX2_5FR_START_TIME = DataTag(['I913', 'I941'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_5FR_END_TIME = DataTag(['I969', 'I997'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_5FR_ADJUST1_ENABLE = DataTag(['D319'], writeable=True)
-    SCHEDULE_MIX2_5FR_ADJUST1_VALUE = DataTag(['A309'], writeable=True)
-    SCHEDULE_MIX2_5FR_ADJUST1_START_TIME = DataTag(['I914', 'I942'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_5FR_ADJUST1_END_TIME = DataTag(['I970', 'I998'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_5FR_ADJUST2_ENABLE = DataTag(['D320'], writeable=True)
-    SCHEDULE_MIX2_5FR_ADJUST2_VALUE = DataTag(['A310'], writeable=True)
-    SCHEDULE_MIX2_5FR_ADJUST2_START_TIME = DataTag(['I915', 'I943'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_5FR_ADJUST2_END_TIME = DataTag(['I971', 'I999'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_6SA_ENABLE = DataTag(['D322'], writeable=True)
-    SCHEDULE_MIX2_6SA_START_TIME = DataTag(['I917', 'I945'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_6SA_END_TIME = DataTag(['I973', 'I1001'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_6SA_ADJUST1_ENABLE = DataTag(['D323'], writeable=True)
-    SCHEDULE_MIX2_6SA_ADJUST1_VALUE = DataTag(['A313'], writeable=True)
-    SCHEDULE_MIX2_6SA_ADJUST1_START_TIME = DataTag(['I918', 'I946'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_6SA_ADJUST1_END_TIME = DataTag(['I974', 'I1002'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_6SA_ADJUST2_ENABLE = DataTag(['D324'], writeable=True)
-    SCHEDULE_MIX2_6SA_ADJUST2_VALUE = DataTag(['A314'], writeable=True)
-    SCHEDULE_MIX2_6SA_ADJUST2_START_TIME = DataTag(['I919', 'I947'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_6SA_ADJUST2_END_TIME = DataTag(['I975', 'I1003'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_7SU_ENABLE = DataTag(['D326'], writeable=True)
-    SCHEDULE_MIX2_7SU_START_TIME = DataTag(['I921', 'I949'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_7SU_END_TIME = DataTag(['I977', 'I1005'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_7SU_ADJUST1_ENABLE = DataTag(['D327'], writeable=True)
-    SCHEDULE_MIX2_7SU_ADJUST1_VALUE = DataTag(['A317'], writeable=True)
-    SCHEDULE_MIX2_7SU_ADJUST1_START_TIME = DataTag(['I922', 'I950'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_7SU_ADJUST1_END_TIME = DataTag(['I978', 'I1006'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_7SU_ADJUST2_ENABLE = DataTag(['D328'], writeable=True)
-    SCHEDULE_MIX2_7SU_ADJUST2_VALUE = DataTag(['A318'], writeable=True)
-    SCHEDULE_MIX2_7SU_ADJUST2_START_TIME = DataTag(['I923', 'I951'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX2_7SU_ADJUST2_END_TIME = DataTag(['I979', 'I1007'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_1MO_ENABLE = DataTag(['D345'], writeable=True)
-    SCHEDULE_MIX3_1MO_START_TIME = DataTag(['I1018', 'I1046'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_1MO_END_TIME = DataTag(['I1074', 'I1102'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_1MO_ADJUST1_ENABLE = DataTag(['D346'], writeable=True)
-    SCHEDULE_MIX3_1MO_ADJUST1_VALUE = DataTag(['A339'], writeable=True)
-    SCHEDULE_MIX3_1MO_ADJUST1_START_TIME = DataTag(['I1019', 'I1047'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_1MO_ADJUST1_END_TIME = DataTag(['I1075', 'I1103'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_1MO_ADJUST2_ENABLE = DataTag(['D347'], writeable=True)
-    SCHEDULE_MIX3_1MO_ADJUST2_VALUE = DataTag(['A340'], writeable=True)
-    SCHEDULE_MIX3_1MO_ADJUST2_START_TIME = DataTag(['I1020', 'I1048'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_1MO_ADJUST2_END_TIME = DataTag(['I1076', 'I1104'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_2TU_ENABLE = DataTag(['D349'], writeable=True)
-    SCHEDULE_MIX3_2TU_START_TIME = DataTag(['I1022', 'I1050'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_2TU_END_TIME = DataTag(['I1078', 'I1106'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_2TU_ADJUST1_ENABLE = DataTag(['D350'], writeable=True)
-    SCHEDULE_MIX3_2TU_ADJUST1_VALUE = DataTag(['A343'], writeable=True)
-    SCHEDULE_MIX3_2TU_ADJUST1_START_TIME = DataTag(['I1023', 'I1051'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_2TU_ADJUST1_END_TIME = DataTag(['I1079', 'I1107'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_2TU_ADJUST2_ENABLE = DataTag(['D351'], writeable=True)
-    SCHEDULE_MIX3_2TU_ADJUST2_VALUE = DataTag(['A344'], writeable=True)
-    SCHEDULE_MIX3_2TU_ADJUST2_START_TIME = DataTag(['I1024', 'I1052'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_2TU_ADJUST2_END_TIME = DataTag(['I1080', 'I1108'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_3WE_ENABLE = DataTag(['D353'], writeable=True)
-    SCHEDULE_MIX3_3WE_START_TIME = DataTag(['I1026', 'I1054'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_3WE_END_TIME = DataTag(['I1082', 'I1110'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_3WE_ADJUST1_ENABLE = DataTag(['D354'], writeable=True)
-    SCHEDULE_MIX3_3WE_ADJUST1_VALUE = DataTag(['A347'], writeable=True)
-    SCHEDULE_MIX3_3WE_ADJUST1_START_TIME = DataTag(['I1027', 'I1055'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_3WE_ADJUST1_END_TIME = DataTag(['I1083', 'I1111'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_3WE_ADJUST2_ENABLE = DataTag(['D355'], writeable=True)
-    SCHEDULE_MIX3_3WE_ADJUST2_VALUE = DataTag(['A348'], writeable=True)
-    SCHEDULE_MIX3_3WE_ADJUST2_START_TIME = DataTag(['I1028', 'I1056'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_3WE_ADJUST2_END_TIME = DataTag(['I1084', 'I1112'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_4TH_ENABLE = DataTag(['D357'], writeable=True)
-    SCHEDULE_MIX3_4TH_START_TIME = DataTag(['I1030', 'I1058'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_4TH_END_TIME = DataTag(['I1086', 'I1114'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_4TH_ADJUST1_ENABLE = DataTag(['D358'], writeable=True)
-    SCHEDULE_MIX3_4TH_ADJUST1_VALUE = DataTag(['A351'], writeable=True)
-    SCHEDULE_MIX3_4TH_ADJUST1_START_TIME = DataTag(['I1031', 'I1059'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_4TH_ADJUST1_END_TIME = DataTag(['I1087', 'I1115'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_4TH_ADJUST2_ENABLE = DataTag(['D359'], writeable=True)
-    SCHEDULE_MIX3_4TH_ADJUST2_VALUE = DataTag(['A352'], writeable=True)
-    SCHEDULE_MIX3_4TH_ADJUST2_START_TIME = DataTag(['I1032', 'I1060'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_4TH_ADJUST2_END_TIME = DataTag(['I1088', 'I1116'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_5FR_ENABLE = DataTag(['D361'], writeable=True)
-    SCHEDULE_MIX3_5FR_START_TIME = DataTag(['I1034', 'I1062'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_5FR_END_TIME = DataTag(['I1090', 'I1118'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_5FR_ADJUST1_ENABLE = DataTag(['D362'], writeable=True)
-    SCHEDULE_MIX3_5FR_ADJUST1_VALUE = DataTag(['A355'], writeable=True)
-    SCHEDULE_MIX3_5FR_ADJUST1_START_TIME = DataTag(['I1035', 'I1063'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_5FR_ADJUST1_END_TIME = DataTag(['I1091', 'I1119'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_5FR_ADJUST2_ENABLE = DataTag(['D363'], writeable=True)
-    SCHEDULE_MIX3_5FR_ADJUST2_VALUE = DataTag(['A356'], writeable=True)
-    SCHEDULE_MIX3_5FR_ADJUST2_START_TIME = DataTag(['I1036', 'I1064'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_5FR_ADJUST2_END_TIME = DataTag(['I1092', 'I1120'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_6SA_ENABLE = DataTag(['D365'], writeable=True)
-    SCHEDULE_MIX3_6SA_START_TIME = DataTag(['I1038', 'I1066'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_6SA_END_TIME = DataTag(['I1094', 'I1122'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_6SA_ADJUST1_ENABLE = DataTag(['D366'], writeable=True)
-    SCHEDULE_MIX3_6SA_ADJUST1_VALUE = DataTag(['A359'], writeable=True)
-    SCHEDULE_MIX3_6SA_ADJUST1_START_TIME = DataTag(['I1039', 'I1067'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_6SA_ADJUST1_END_TIME = DataTag(['I1095', 'I1123'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_6SA_ADJUST2_ENABLE = DataTag(['D367'], writeable=True)
-    SCHEDULE_MIX3_6SA_ADJUST2_VALUE = DataTag(['A360'], writeable=True)
-    SCHEDULE_MIX3_6SA_ADJUST2_START_TIME = DataTag(['I1040', 'I1068'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_6SA_ADJUST2_END_TIME = DataTag(['I1096', 'I1124'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_7SU_ENABLE = DataTag(['D369'], writeable=True)
-    SCHEDULE_MIX3_7SU_START_TIME = DataTag(['I1042', 'I1070'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_7SU_END_TIME = DataTag(['I1098', 'I1126'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_7SU_ADJUST1_ENABLE = DataTag(['D370'], writeable=True)
-    SCHEDULE_MIX3_7SU_ADJUST1_VALUE = DataTag(['A363'], writeable=True)
-    SCHEDULE_MIX3_7SU_ADJUST1_START_TIME = DataTag(['I1043', 'I1071'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_7SU_ADJUST1_END_TIME = DataTag(['I1099', 'I1127'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_7SU_ADJUST2_ENABLE = DataTag(['D371'], writeable=True)
-    SCHEDULE_MIX3_7SU_ADJUST2_VALUE = DataTag(['A364'], writeable=True)
-    SCHEDULE_MIX3_7SU_ADJUST2_START_TIME = DataTag(['I1044', 'I1072'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_MIX3_7SU_ADJUST2_END_TIME = DataTag(['I1100', 'I1128'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ENABLE = DataTag(['D388'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_START_TIME = DataTag(['I1139', 'I1167'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_END_TIME = DataTag(['I1195', 'I1223'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_ENABLE = DataTag(['D389'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_VALUE = DataTag(['A385'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_START_TIME = DataTag(['I1140', 'I1168'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST1_END_TIME = DataTag(['I1196', 'I1224'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_ENABLE = DataTag(['D390'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_VALUE = DataTag(['A386'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_START_TIME = DataTag(['I1141', 'I1169'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_1MO_ADJUST2_END_TIME = DataTag(['I1197', 'I1225'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ENABLE = DataTag(['D392'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_START_TIME = DataTag(['I1143', 'I1171'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_END_TIME = DataTag(['I1199', 'I1227'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_ENABLE = DataTag(['D393'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_VALUE = DataTag(['A389'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_START_TIME = DataTag(['I1144', 'I1172'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST1_END_TIME = DataTag(['I1200', 'I1228'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_ENABLE = DataTag(['D394'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_VALUE = DataTag(['A390'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_START_TIME = DataTag(['I1145', 'I1173'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_2TU_ADJUST2_END_TIME = DataTag(['I1201', 'I1229'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ENABLE = DataTag(['D396'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_START_TIME = DataTag(['I1147', 'I1175'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_END_TIME = DataTag(['I1203', 'I1231'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_ENABLE = DataTag(['D397'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_VALUE = DataTag(['A393'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_START_TIME = DataTag(['I1148', 'I1176'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST1_END_TIME = DataTag(['I1204', 'I1232'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_ENABLE = DataTag(['D398'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_VALUE = DataTag(['A394'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_START_TIME = DataTag(['I1149', 'I1177'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_3WE_ADJUST2_END_TIME = DataTag(['I1205', 'I1233'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ENABLE = DataTag(['D400'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_START_TIME = DataTag(['I1151', 'I1179'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_END_TIME = DataTag(['I1207', 'I1235'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_ENABLE = DataTag(['D401'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_VALUE = DataTag(['A397'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_START_TIME = DataTag(['I1152', 'I1180'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST1_END_TIME = DataTag(['I1208', 'I1236'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_ENABLE = DataTag(['D402'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_VALUE = DataTag(['A398'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_START_TIME = DataTag(['I1153', 'I1181'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_4TH_ADJUST2_END_TIME = DataTag(['I1209', 'I1237'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ENABLE = DataTag(['D404'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_START_TIME = DataTag(['I1155', 'I1183'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_END_TIME = DataTag(['I1211', 'I1239'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_ENABLE = DataTag(['D405'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_VALUE = DataTag(['A401'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_START_TIME = DataTag(['I1156', 'I1184'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST1_END_TIME = DataTag(['I1212', 'I1240'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_ENABLE = DataTag(['D406'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_VALUE = DataTag(['A402'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_START_TIME = DataTag(['I1157', 'I1185'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_5FR_ADJUST2_END_TIME = DataTag(['I1213', 'I1241'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ENABLE = DataTag(['D408'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_START_TIME = DataTag(['I1159', 'I1187'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_END_TIME = DataTag(['I1215', 'I1243'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_ENABLE = DataTag(['D409'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_VALUE = DataTag(['A405'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_START_TIME = DataTag(['I1160', 'I1188'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST1_END_TIME = DataTag(['I1216', 'I1244'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_ENABLE = DataTag(['D410'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_VALUE = DataTag(['A406'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_START_TIME = DataTag(['I1161', 'I1189'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_6SA_ADJUST2_END_TIME = DataTag(['I1217', 'I1245'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ENABLE = DataTag(['D412'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_START_TIME = DataTag(['I1163', 'I1191'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_END_TIME = DataTag(['I1219', 'I1247'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_ENABLE = DataTag(['D413'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_VALUE = DataTag(['A409'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_START_TIME = DataTag(['I1164', 'I1192'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST1_END_TIME = DataTag(['I1220', 'I1248'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_ENABLE = DataTag(['D414'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_VALUE = DataTag(['A410'], writeable=True)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_START_TIME = DataTag(['I1165', 'I1193'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_BUFFER_TANK_CIRCULATION_PUMP_7SU_ADJUST2_END_TIME = DataTag(['I1221', 'I1249'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_1MO_ENABLE = DataTag(['D204'], writeable=True)
-    SCHEDULE_SOLAR_1MO_START_TIME = DataTag(['I648', 'I676'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_1MO_END_TIME = DataTag(['I704', 'I732'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_2TU_ENABLE = DataTag(['D208'], writeable=True)
-    SCHEDULE_SOLAR_2TU_START_TIME = DataTag(['I652', 'I680'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_2TU_END_TIME = DataTag(['I708', 'I736'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_3WE_ENABLE = DataTag(['D212'], writeable=True)
-    SCHEDULE_SOLAR_3WE_START_TIME = DataTag(['I656', 'I684'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_3WE_END_TIME = DataTag(['I712', 'I740'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_4TH_ENABLE = DataTag(['D216'], writeable=True)
-    SCHEDULE_SOLAR_4TH_START_TIME = DataTag(['I660', 'I688'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_4TH_END_TIME = DataTag(['I716', 'I744'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_5FR_ENABLE = DataTag(['D220'], writeable=True)
-    SCHEDULE_SOLAR_5FR_START_TIME = DataTag(['I664', 'I692'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_5FR_END_TIME = DataTag(['I720', 'I748'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_6SA_ENABLE = DataTag(['D224'], writeable=True)
-    SCHEDULE_SOLAR_6SA_START_TIME = DataTag(['I668', 'I696'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_6SA_END_TIME = DataTag(['I724', 'I752'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_7SU_ENABLE = DataTag(['D228'], writeable=True)
-    SCHEDULE_SOLAR_7SU_START_TIME = DataTag(['I672', 'I700'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_SOLAR_7SU_END_TIME = DataTag(['I728', 'I756'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_1MO_ENABLE = DataTag(['D642'], writeable=True)
-    SCHEDULE_PV_1MO_START_TIME = DataTag(['I1483', 'I1511'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_1MO_END_TIME = DataTag(['I1539', 'I1567'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_2TU_ENABLE = DataTag(['D646'], writeable=True)
-    SCHEDULE_PV_2TU_START_TIME = DataTag(['I1487', 'I1515'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_2TU_END_TIME = DataTag(['I1543', 'I1571'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_3WE_ENABLE = DataTag(['D650'], writeable=True)
-    SCHEDULE_PV_3WE_START_TIME = DataTag(['I1491', 'I1519'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_3WE_END_TIME = DataTag(['I1547', 'I1575'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_4TH_ENABLE = DataTag(['D654'], writeable=True)
-    SCHEDULE_PV_4TH_START_TIME = DataTag(['I1495', 'I1523'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_4TH_END_TIME = DataTag(['I1551', 'I1579'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_5FR_ENABLE = DataTag(['D658'], writeable=True)
-    SCHEDULE_PV_5FR_START_TIME = DataTag(['I1499', 'I1527'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_5FR_END_TIME = DataTag(['I1555', 'I1583'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_6SA_ENABLE = DataTag(['D662'], writeable=True)
-    SCHEDULE_PV_6SA_START_TIME = DataTag(['I1503', 'I1531'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_6SA_END_TIME = DataTag(['I1559', 'I1587'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_7SU_ENABLE = DataTag(['D666'], writeable=True)
-    SCHEDULE_PV_7SU_START_TIME = DataTag(['I1507', 'I1535'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-    SCHEDULE_PV_7SU_END_TIME = DataTag(['I1563', 'I1591'], writeable=True, decode_f=DataTag._decode_time_hhmm, encode_f=DataTag._encode_time_hhmm)
-
-# values = [
-#     ["SCHEDULE_HEATING", 42, 63, 151, 179, 207, 235],
-#     ["SCHEDULE_COOLING", 86, 112, 276, 304, 332, 360],
-#     ["SCHEDULE_WATER", 125, 141, 393, 421, 449, 447]
-# ]
-#
-# for a_value in values:
-#     day_addon = 0
-#     for a_day in SCHEDULE_DAY_LIST:
-#         enable_idx = a_value[1] + day_addon
-#         value_idx = a_value[2] + day_addon
-#         start_hh_idx = a_value[3] + day_addon
-#         start_mm_idx = a_value[4] + day_addon
-#         end_hh_idx = a_value[5] + day_addon
-#         end_mm_idx = a_value[6] + day_addon
-#
-#         tags_v = [
-#             [enable_idx], [start_hh_idx, start_mm_idx], [end_hh_idx, end_mm_idx],
-#             [enable_idx + 1], [value_idx], [start_hh_idx + 1, start_mm_idx + 1], [end_hh_idx + 1, end_mm_idx + 1],
-#             [enable_idx + 2], [value_idx + 1], [start_hh_idx + 2, start_mm_idx + 2], [end_hh_idx + 2, end_mm_idx + 2],
-#         ]
-#
-#         for idx in range(len(SCHEDULE_SENSOR_TYPES_LIST)):
-#             a_type = SCHEDULE_SENSOR_TYPES_LIST[idx]
-#             a_tag_base = tags_v[idx]
-#
-#             a_tag_list = []
-#             for a_int in a_tag_base:
-#                 if a_type.endswith("_ENABLE"):
-#                     a_tag_list.append(f"D{(a_int)}")
-#                 elif a_type.endswith("_VALUE"):
-#                     a_tag_list.append(f"A{(a_int)}")
-#                 else:
-#                     a_tag_list.append(f"I{(a_int)}")
-#
-#             name = f"{a_value[0]}_{a_day}{a_type}"
-#             if len(a_tag_list) == 1:
-#                 data_tag = DataTag(tags=a_tag_list, writeable=True)
-#             else:
-#                 data_tag = DataTag(
-#                     tags=a_tag_list, writeable=True, decode_f=DataTag._decode_time_hhmm,
-#                     encode_f=DataTag._encode_time_hhmm
-#                 )
-#             extend_enum(WKHPTag, name, data_tag)
-#             # print(f"{name} {data_tag.tags}")
-#
-#         day_addon = day_addon + 4
+    # the _ENABLE, _START_TIME, _END_TIME [_ADJUST1/2_ENABLE, _VALUE, _START_TIME, _END_TIME] fields of all schedule
+    # days (_1MO, _2TU, _3WE, _4TH, _5FR, _6SA, _7SU) - will be created on demand by _schedule_tag_definition()
+
+
+# reverse index: raw ecotouch tag (like 'A1', 'I52' or 'D634') -> all WKHPTags that make use of it (the
+# raw tags of the schedule tags will be added, when the schedule tags are created)
+RAW_TAG_INDEX: Final = MappingProxyType(WKHPTag._tags_by_raw_tag)
+
+# all WKHPTags that are a float value stored in two A-registers (high & low word) - the values of these
+# tags can be decoded in a batch (see decode_float_pairs()). The (lazy) schedule tags are never float pairs,
+# so only the members that already exist are checked
+FLOAT_PAIR_TAGS: Final = frozenset(
+    a_wkhp_tag for a_wkhp_tag in WKHPTag._tags_by_id if len(a_wkhp_tag.tags) == 2 and a_wkhp_tag.tags[0][0] == "A" and
+    a_wkhp_tag.decode_f in (DataTag._decode_value_default, DataTag._decode_value_analog)
+)
+
+
+def _float_pair_word(str_val: str) -> int:
+    try:
+        return int(str_val) & 0xFFFF
+    except ValueError:
+        # for whatever reason the values can look like '17714.0'
+        return int(float(str_val)) & 0xFFFF
+
+
+def decode_float_pairs(str_val_pairs: List[List[str]]) -> List[float]:
+    """decode the [high, low] word pairs of multiple FLOAT_PAIR_TAGS with a single struct pass"""
+    words = [_float_pair_word(a_str_val) for a_pair in str_val_pairs for a_str_val in a_pair]
+    buffer = struct.pack(f"!{len(words)}H", *words)
+    return [round(float(a_float), 3) for (a_float,) in struct.iter_unpack("!f", buffer)]
@@ -7,7 +7,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import WKHPDataUpdateCoordinator, WKHPBaseEntity
 from .const import DOMAIN, SELECT_SENSORS, ExtSelectEntityDescription
-from .const_gen import SELECT_SENSORS_GENERATED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,10 +18,6 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
     for description in SELECT_SENSORS:
         entity = WKHPSelect(coordinator, description)
         entities.append(entity)
-    if coordinator.add_schedule_entities:
-        for description in SELECT_SENSORS_GENERATED:
-            entity = WKHPSelect(coordinator, description)
-            entities.append(entity)
     add_entity_cb(entities)
 
 
@@ -33,7 +28,7 @@ class WKHPSelect(WKHPBaseEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         try:
-            value = self.coordinator.data[self.wkhp_tag]["value"]
+            value = self.coordinator.data[self.wkhp_tag].value
             if value is None or value == "":
                 value = 'unknown'
             elif isinstance(value, bool):
@@ -4,12 +4,26 @@ from datetime import datetime, time
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 from . import WKHPDataUpdateCoordinator, WKHPBaseEntity
-from .const import DOMAIN, SENSOR_SENSORS, ExtSensorEntityDescription
-from .const_gen import SENSOR_SENSORS_GENERATED
+from .const import (
+    DOMAIN,
+    SENSOR_SENSORS,
+    METRICS_SENSORS,
+    SCHEDULE_SENSORS,
+    POLL_TIER_INTERVALS,
+    POLL_TIER_ON_DEMAND,
+    ExtSensorEntityDescription,
+    ExtMetricsSensorEntityDescription,
+    ExtScheduleSensorEntityDescription
+)
+from .const_gen import get_generated_descriptions
+from .pywaterkotte_ha.schedule_model import WKHPSchedule
+from .pywaterkotte_ha.schedules import SCHEDULE_DAYS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,9 +36,15 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
         entity = WKHPSensor(coordinator, description)
         entities.append(entity)
     if coordinator.add_schedule_entities:
-        for description in SENSOR_SENSORS_GENERATED:
+        for description in get_generated_descriptions(Platform.SENSOR):
             entity = WKHPSensor(coordinator, description)
             entities.append(entity)
+    for description in METRICS_SENSORS:
+        entity = WKHPMetricsSensor(coordinator, description)
+        entities.append(entity)
+    for description in SCHEDULE_SENSORS:
+        entity = WKHPScheduleSensor(coordinator, description)
+        entities.append(entity)
     add_entity_cb(entities)
 
 
@@ -62,7 +82,7 @@ class WKHPSensor(WKHPBaseEntity, SensorEntity, RestoreEntity):
     def native_value(self):
         """Return the state of the sensor."""
         try:
-            value = self.coordinator.data[self.wkhp_tag]["value"]
+            value = self.coordinator.data[self.wkhp_tag].value
             if value is None or len(str(value)) == 0:
                 if self._is_bit_field:
                     value = "none"
@@ -92,3 +112,64 @@ class WKHPSensor(WKHPBaseEntity, SensorEntity, RestoreEntity):
         elif self.entity_description.entity_category is not None:
             return self.entity_description.entity_category
         return None
+
+
+class WKHPMetricsSensor(WKHPBaseEntity, SensorEntity):
+    """diagnostic sensor showing a metric of the communication with the waterkotte"""
+
+    def __init__(self, coordinator: WKHPDataUpdateCoordinator, description: ExtMetricsSensorEntityDescription):
+        super().__init__(entity_type=Platform.SENSOR, coordinator=coordinator, description=description)
+
+    @property
+    def native_value(self):
+        metric = getattr(self.coordinator.bridge.metrics, self.entity_description.metric, None)
+        if self.entity_description.statistic is None:
+            return metric
+        elif metric is not None:
+            return getattr(metric, self.entity_description.statistic)
+        return None
+
+    @property
+    def extra_state_attributes(self):
+        metric = getattr(self.coordinator.bridge.metrics, self.entity_description.metric, None)
+        if self.entity_description.statistic is not None and metric is not None:
+            return metric.as_dict()
+        return None
+
+
+class WKHPScheduleSensor(WKHPBaseEntity, SensorEntity):
+    """a complete (weekly) schedule as a single entity - the state is 'on', when the schedule is active right
+    now, the fields of all days will be provided as attributes"""
+    # the days will change very rarely - there is no need to record them with every state change
+    _unrecorded_attributes = frozenset({"days"})
+
+    def __init__(self, coordinator: WKHPDataUpdateCoordinator, description: ExtScheduleSensorEntityDescription):
+        super().__init__(entity_type=Platform.SENSOR, coordinator=coordinator, description=description)
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        # the schedule tags are not part of the active tags - so the complete schedule will be read when
+        # the entity is added & then once per day
+        self._async_request_schedule()
+        self.async_on_remove(async_track_time_interval(self.hass, self._async_request_schedule,
+                                                       POLL_TIER_INTERVALS[POLL_TIER_ON_DEMAND]))
+
+    @callback
+    def _async_request_schedule(self, now=None):
+        self.coordinator.async_request_schedule(self.entity_description.schedule_type)
+
+    @property
+    def schedule(self) -> WKHPSchedule:
+        return WKHPSchedule(self.entity_description.schedule_type, self.coordinator.data or {})
+
+    @property
+    def native_value(self):
+        now = dt_util.now()
+        active = self.schedule.is_active(SCHEDULE_DAYS[now.weekday()], now.time())
+        if active is None:
+            return None
+        return "on" if active else "off"
+
+    @property
+    def extra_state_attributes(self):
+        return self.schedule.as_dict()
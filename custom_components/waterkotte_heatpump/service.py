@@ -5,11 +5,33 @@ from typing import Tuple
 from dateutil.relativedelta import relativedelta
 from homeassistant.core import ServiceCall, ServiceResponse
 
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.error import StatusException, PartialWriteException
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.schedules import SCHEDULE_TYPES
 from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import WKHPTag
+from .const import POLL_TIER_INTERVALS, POLL_TIER_ON_DEMAND
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+def _get_value(values: dict, tag: WKHPTag, default="unknown"):
+    a_tag_value = values.get(tag)
+    if a_tag_value is None:
+        return default
+    return a_tag_value.value
+
+
+def _error_response(exc: Exception) -> dict:
+    ret = {"error": str(exc), "date": str(datetime.datetime.now().time())}
+    if isinstance(exc, PartialWriteException):
+        # the values that have been written (and verified) before the write failed
+        values = {}
+        for a_tag in exc.result:
+            a_value = _get_value(exc.result, a_tag)
+            values[a_tag.name.lower()] = a_value if isinstance(a_value, (str, int, float, bool)) else str(a_value)
+        ret["values"] = values
+    return ret
+
+
 class WaterkotteHeatpumpService():
     """waterkotte_heatpump switch class."""
 
@@ -37,12 +59,11 @@ class WaterkotteHeatpumpService():
             end = datetime.datetime.strptime(end, '%Y-%m-%d %H:%M:%S')
             _LOGGER.debug(f"set_holiday start: {start} end: {end}")
             try:
-                await self._coordinator.async_write_tag(WKHPTag.HOLIDAY_START_TIME, start)
-                await self._coordinator.async_write_tag(WKHPTag.HOLIDAY_END_TIME, end)
-                await self._coordinator.async_refresh()
-            except ValueError as exc:
+                await self._write_tags([(WKHPTag.HOLIDAY_START_TIME, start), (WKHPTag.HOLIDAY_END_TIME, end)],
+                                       dependent_tags=[WKHPTag.HOLIDAY_ENABLED])
+            except (ValueError, StatusException) as exc:
                 if call.return_response:
-                    return {"error": str(exc), "date": str(datetime.datetime.now().time())}
+                    return _error_response(exc)
 
             if call.return_response:
                 return {"success": "yes", "date": str(datetime.datetime.now().time())}
@@ -55,16 +76,15 @@ class WaterkotteHeatpumpService():
         if start_time is not None:
             _LOGGER.debug(f"set_disinfection_start_time: {start_time}")
             try:
-                await self._coordinator.async_write_tag(WKHPTag.SCHEDULE_WATER_DISINFECTION_START_TIME, start_time)
-                await self._coordinator.async_refresh()
+                await self._write_tags([(WKHPTag.SCHEDULE_WATER_DISINFECTION_START_TIME, start_time)])
                 if call.return_response:
                     return {
                         "success": "yes",
                         "date": str(datetime.datetime.now().time())
                     }
-            except ValueError as exe:
+            except (ValueError, StatusException) as exe:
                 if call.return_response:
-                    return {"error": str(exe), "date": str(datetime.datetime.now().time())}
+                    return _error_response(exe)
         else:
             if call.return_response:
                 return {"error": "no start_time provided", "date": str(datetime.datetime.now().time())}
@@ -111,31 +131,89 @@ class WaterkotteHeatpumpService():
                             kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST1_END_TIME"], adj1_end_time))
 
                         if adj2_enable is not None:
-                            kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST1_ENABLE"], adj2_enable))
+                            kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST2_ENABLE"], adj2_enable))
                         if adj2_value is not None:
                             kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST2_VALUE"], float(adj2_value)))
                         if adj2_start_time is not None:
-                            kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST2_START_TIME"], adj1_start_time))
+                            kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST2_START_TIME"], adj2_start_time))
                         if adj2_end_time is not None:
-                            kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST2_END_TIME"], adj1_end_time))
+                            kv_pairs.append((WKHPTag[f"{final_type}_{a_day.upper()}_ADJUST2_END_TIME"], adj2_end_time))
 
                 _LOGGER.debug(f"set_schedule_data for: '{type}' @{days} -> {kv_pairs}")
-                await self._coordinator.async_write_tags(kv_pairs)
-                await self._coordinator.async_refresh()
-            except ValueError as exe:
+                # only the values that differ from the current schedule will be written
+                skipped_tags = set()
+                await self._write_tags(kv_pairs, is_schedule=True, skipped_tags=skipped_tags)
+            except (ValueError, StatusException) as exe:
                 if call.return_response:
-                    return {"error": str(exe), "date": str(datetime.datetime.now().time())}
+                    return _error_response(exe)
             if call.return_response:
                 return {
                     "success": "yes",
                     "type": final_type,
                     "count": len(kv_pairs),
+                    "written": len(kv_pairs) - len(skipped_tags),
+                    "skipped": len(skipped_tags),
                     "date": str(datetime.datetime.now().time())
                 }
         else:
             if call.return_response:
                 return {"error": "no type or day provided", "date": str(datetime.datetime.now().time())}
 
+    async def _write_tags(self, kv_pairs: list, dependent_tags: list = None, is_schedule: bool = False,
+                          skipped_tags: set = None):
+        if is_schedule:
+            result = await self._coordinator.async_write_schedule(kv_pairs, skipped_tags=skipped_tags)
+        else:
+            result = await self._coordinator.async_write_tags(kv_pairs)
+        # the verified values are already in the coordinator data - so we only need to re-read the
+        # tags that could not be verified & the ones that will be changed by the waterkotte itself
+        tags = [a_tag for a_tag, a_value in kv_pairs if a_tag not in result]
+        if dependent_tags is not None:
+            tags.extend(dependent_tags)
+        if len(tags) > 0:
+            await self._coordinator.async_refresh_tags(tags)
+
+    async def refresh_tags(self, call: ServiceCall):
+        tag_names = call.data.get("tags", None)
+        if isinstance(tag_names, str):
+            tag_names = tag_names.split(",")
+        if tag_names is None or len(tag_names) == 0:
+            if call.return_response:
+                return {"error": "no tags provided", "date": str(datetime.datetime.now().time())}
+            return
+
+        tags = []
+        for a_name in tag_names:
+            a_name = a_name.strip().upper()
+            if a_name not in WKHPTag.__members__:
+                if call.return_response:
+                    return {"error": f"unknown tag: '{a_name}'", "date": str(datetime.datetime.now().time())}
+                return
+            tags.append(WKHPTag[a_name])
+
+        res = await self._coordinator.async_refresh_tags(tags)
+        if call.return_response:
+            values = {}
+            for a_tag in tags:
+                a_value = _get_value(res, a_tag)
+                if a_value is not None and not isinstance(a_value, (str, int, float, bool)):
+                    a_value = str(a_value)
+                values[a_tag.name.lower()] = a_value
+            return {"success": "yes", "values": values, "date": str(datetime.datetime.now().time())}
+
+    async def get_schedule(self, call: ServiceCall) -> ServiceResponse:
+        type = call.data.get("schedule_type", None)
+        if type is None or f"SCHEDULE_{type.upper()}" not in SCHEDULE_TYPES:
+            return {"error": f"unknown schedule_type: '{type}'", "date": str(datetime.datetime.now().time())}
+
+        # all values of the schedule will be read from the heatpump - unless they are already up to date
+        max_age = None if call.data.get("refresh", False) else POLL_TIER_INTERVALS[POLL_TIER_ON_DEMAND]
+        try:
+            schedule = await self._coordinator.async_read_schedule(f"SCHEDULE_{type.upper()}", max_age=max_age)
+        except Exception as exc:
+            return {"error": str(exc), "date": str(datetime.datetime.now().time())}
+        return schedule.as_dict()
+
     def _get_time(self, key: str, call: ServiceCall):
         a_time = call.data.get(key, None)
         if a_time is not None:
@@ -149,311 +227,27 @@ class WaterkotteHeatpumpService():
         return None
 
     async def get_energy_balance(self, call: ServiceCall) -> ServiceResponse:
+        # the energy balance will be read from the energy history (that is refreshed once per day)
         try:
-            tags = [WKHPTag.COMPRESSOR_ELECTRIC_CONSUMPTION_YEAR,
-                    WKHPTag.SOURCEPUMP_ELECTRIC_CONSUMPTION_YEAR,
-                    WKHPTag.ELECTRICAL_HEATER_ELECTRIC_CONSUMPTION_YEAR,
-                    WKHPTag.HEATING_ENERGY_PRODUCTION_YEAR,
-                    WKHPTag.HOT_WATER_ENERGY_PRODUCTION_YEAR,
-                    WKHPTag.POOL_ENERGY_PRODUCTION_YEAR,
-                    WKHPTag.COP_HEATPUMP_YEAR,
-                    WKHPTag.COP_HEATPUMP_ACTUAL_YEAR_INFO]
-            res = await self._coordinator.async_read_values(tags)
-
-        except ValueError:
+            await self._coordinator.energy_history.async_get_data()
+        except (ValueError, StatusException):
             return "unavailable"
-        ret = {
-            "year": res.get(WKHPTag.COP_HEATPUMP_ACTUAL_YEAR_INFO, {"value": "unknown"})["value"],
-            "cop": res.get(WKHPTag.COP_HEATPUMP_YEAR, {"value": "unknown"})["value"],
-            "compressor": res.get(WKHPTag.COMPRESSOR_ELECTRIC_CONSUMPTION_YEAR, {"value": "unknown"})["value"],
-            "sourcepump": res.get(WKHPTag.SOURCEPUMP_ELECTRIC_CONSUMPTION_YEAR, {"value": "unknown"})["value"],
-            "externalheater": res.get(WKHPTag.ELECTRICAL_HEATER_ELECTRIC_CONSUMPTION_YEAR, {"value": "unknown"})[
-                "value"],
-            "heating": res.get(WKHPTag.HEATING_ENERGY_PRODUCTION_YEAR, {"value": "unknown"})["value"],
-            "warmwater": res.get(WKHPTag.HOT_WATER_ENERGY_PRODUCTION_YEAR, {"value": "unknown"})["value"],
-            "pool": res.get(WKHPTag.POOL_ENERGY_PRODUCTION_YEAR, {"value": "unknown"})["value"]}
-        return ret
+        return self._coordinator.energy_history.get_year()
 
     async def get_energy_balance_monthly(self, call: ServiceCall) -> ServiceResponse:
+        energy_history = self._coordinator.energy_history
         try:
-            for x in range(2):
-                tags = [WKHPTag.ENG_CONSUMPTION_COMPRESSOR01,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR02,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR03,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR04,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR05,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR06,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR07,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR08,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR09,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR10,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR11,
-                        WKHPTag.ENG_CONSUMPTION_COMPRESSOR12]
-                resCompressor = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resCompressor:
-                    if resCompressor.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resCompressor) == 12 and not found:
-                    break
-            for x in range(2):
-                tags = [WKHPTag.ENG_CONSUMPTION_SOURCEPUMP01,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP02,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP03,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP04,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP05,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP06,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP07,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP08,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP09,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP10,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP11,
-                        WKHPTag.ENG_CONSUMPTION_SOURCEPUMP12]
-                resSourcePump = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resSourcePump:
-                    if resSourcePump.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resSourcePump) == 12 and not found:
-                    break
-            for x in range(2):
-                tags = [WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER01,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER02,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER03,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER04,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER05,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER06,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER07,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER08,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER09,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER10,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER11,
-                        WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER12]
-                resExternalHeater = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resExternalHeater:
-                    if resExternalHeater.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resExternalHeater) == 12 and not found:
-                    break
-            for x in range(2):
-                tags = [WKHPTag.ENG_PRODUCTION_HEATING01,
-                        WKHPTag.ENG_PRODUCTION_HEATING02,
-                        WKHPTag.ENG_PRODUCTION_HEATING03,
-                        WKHPTag.ENG_PRODUCTION_HEATING04,
-                        WKHPTag.ENG_PRODUCTION_HEATING05,
-                        WKHPTag.ENG_PRODUCTION_HEATING06,
-                        WKHPTag.ENG_PRODUCTION_HEATING07,
-                        WKHPTag.ENG_PRODUCTION_HEATING08,
-                        WKHPTag.ENG_PRODUCTION_HEATING09,
-                        WKHPTag.ENG_PRODUCTION_HEATING10,
-                        WKHPTag.ENG_PRODUCTION_HEATING11,
-                        WKHPTag.ENG_PRODUCTION_HEATING12]
-                resHeater = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resHeater:
-                    if resHeater.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resHeater) == 12 and not found:
-                    break
-            for x in range(2):
-                tags = [WKHPTag.ENG_PRODUCTION_WARMWATER01,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER02,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER03,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER04,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER05,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER06,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER07,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER08,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER09,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER10,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER11,
-                        WKHPTag.ENG_PRODUCTION_WARMWATER12]
-                resWarmWater = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resWarmWater:
-                    if resWarmWater.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resWarmWater) == 12 and not found:
-                    break
-            for x in range(2):
-                tags = [WKHPTag.ENG_PRODUCTION_POOL01,
-                        WKHPTag.ENG_PRODUCTION_POOL02,
-                        WKHPTag.ENG_PRODUCTION_POOL03,
-                        WKHPTag.ENG_PRODUCTION_POOL04,
-                        WKHPTag.ENG_PRODUCTION_POOL05,
-                        WKHPTag.ENG_PRODUCTION_POOL06,
-                        WKHPTag.ENG_PRODUCTION_POOL07,
-                        WKHPTag.ENG_PRODUCTION_POOL08,
-                        WKHPTag.ENG_PRODUCTION_POOL09,
-                        WKHPTag.ENG_PRODUCTION_POOL10,
-                        WKHPTag.ENG_PRODUCTION_POOL11,
-                        WKHPTag.ENG_PRODUCTION_POOL12]
-                resPool = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resPool:
-                    if resPool.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resPool) == 12 and not found:
-                    break
-            for x in range(2):
-                tags = [WKHPTag.ENG_HEATPUMP_COP_MONTH01,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH02,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH03,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH04,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH05,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH06,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH07,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH08,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH09,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH10,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH11,
-                        WKHPTag.ENG_HEATPUMP_COP_MONTH12]
-                resHeatpumpCopMonth = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resHeatpumpCopMonth:
-                    if resHeatpumpCopMonth.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resHeatpumpCopMonth) == 12 and not found:
-                    break
-            for x in range(2):
-                tags = [WKHPTag.DATE_MONTH,
-                        WKHPTag.DATE_YEAR,
-                        WKHPTag.COP_HEATPUMP_YEAR,
-                        WKHPTag.COP_HEATPUMP_ACTUAL_YEAR_INFO]
-                resDate = await self._coordinator.async_read_values(tags)
-                found = False
-                for value in resDate:
-                    if resDate.get(value, {"value": "unknown"})["value"] == "unknown":
-                        found = True
-                if len(resDate) == 4 and not found:
-                    break
-        except ValueError:
+            await energy_history.async_get_data()
+        except (ValueError, StatusException):
             return "unavailable"
+
+        year = energy_history.get_year()
         ret = {
-            "cop_year": resDate.get(WKHPTag.COP_HEATPUMP_ACTUAL_YEAR_INFO, {"value": "unknown"})["value"],
-            "cop": resDate.get(WKHPTag.COP_HEATPUMP_YEAR, {"value": "unknown"})["value"],
-            "heatpump_month": resDate.get(WKHPTag.DATE_MONTH, {"value": "unknown"})["value"],
-            "heatpump_year": resDate.get(WKHPTag.DATE_YEAR, {"value": "unknown"})["value"],
-            "month_01": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH01, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR01, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP01, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER01, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING01, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER01, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL01, {"value": "unknown"})["value"]
-            },
-            "month_02": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH02, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR02, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP02, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER02, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING02, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER02, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL02, {"value": "unknown"})["value"]
-            },
-            "month_03": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH03, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR03, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP03, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER03, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING03, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER03, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL03, {"value": "unknown"})["value"]
-            },
-            "month_04": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH04, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR04, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP04, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER04, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING04, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER04, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL04, {"value": "unknown"})["value"]
-            },
-            "month_05": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH05, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR05, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP05, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER05, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING05, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER05, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL05, {"value": "unknown"})["value"]
-            },
-            "month_06": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH06, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR06, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP06, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER06, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING06, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER06, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL06, {"value": "unknown"})["value"]
-            },
-            "month_07": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH07, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR07, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP07, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER07, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING07, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER07, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL07, {"value": "unknown"})["value"]
-            },
-            "month_08": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH08, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR08, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP08, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER08, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING08, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER08, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL08, {"value": "unknown"})["value"]
-            },
-            "month_09": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH09, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR09, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP09, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER09, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING09, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER09, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL09, {"value": "unknown"})["value"]
-            },
-            "month_10": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH10, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR10, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP10, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER10, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING10, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER10, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL10, {"value": "unknown"})["value"]
-            },
-            "month_11": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH11, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR11, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP11, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER11, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING11, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER11, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL11, {"value": "unknown"})["value"]
-            },
-            "month_12": {
-                "cop": resHeatpumpCopMonth.get(WKHPTag.ENG_HEATPUMP_COP_MONTH12, {"value": "unknown"})["value"],
-                "compressor": resCompressor.get(WKHPTag.ENG_CONSUMPTION_COMPRESSOR12, {"value": "unknown"})["value"],
-                "sourcepump": resSourcePump.get(WKHPTag.ENG_CONSUMPTION_SOURCEPUMP12, {"value": "unknown"})["value"],
-                "externalheater": resExternalHeater.get(WKHPTag.ENG_CONSUMPTION_EXTERNALHEATER12, {"value": "unknown"})[
-                    "value"],
-                "heating": resHeater.get(WKHPTag.ENG_PRODUCTION_HEATING12, {"value": "unknown"})["value"],
-                "warmwater": resWarmWater.get(WKHPTag.ENG_PRODUCTION_WARMWATER12, {"value": "unknown"})["value"],
-                "pool": resPool.get(WKHPTag.ENG_PRODUCTION_POOL12, {"value": "unknown"})["value"]
-            }
+            "cop_year": year["year"],
+            "cop": year["cop"],
+            "heatpump_month": energy_history.heatpump_month if energy_history.heatpump_month is not None else "unknown",
+            "heatpump_year": energy_history.heatpump_year if energy_history.heatpump_year is not None else "unknown",
         }
+        for a_month in range(1, 13):
+            ret[f"month_{a_month:02d}"] = energy_history.get_month(a_month)
         return ret
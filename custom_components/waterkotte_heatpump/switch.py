@@ -8,7 +8,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import WKHPDataUpdateCoordinator, WKHPBaseEntity
 from .const import DOMAIN, SWITCH_SENSORS, ExtSwitchEntityDescription
-from .const_gen import SWITCH_SENSORS_GENERATED
+from .const_gen import get_generated_descriptions
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
         entity = WKHPSwitch(coordinator, description)
         entities.append(entity)
     if coordinator.add_schedule_entities:
-        for description in SWITCH_SENSORS_GENERATED:
+        for description in get_generated_descriptions(Platform.SWITCH):
             entity = WKHPSwitch(coordinator, description)
             entities.append(entity)
     add_entity_cb(entities)
@@ -36,7 +36,7 @@ class WKHPSwitch(WKHPBaseEntity, SwitchEntity):
         """Turn on the switch."""
         try:
             await self.coordinator.async_write_tag(self.wkhp_tag, True, self)
-            return self.coordinator.data[self.wkhp_tag]["value"]
+            return self.coordinator.data[self.wkhp_tag].value
         except ValueError:
             return "unavailable"
 
@@ -44,7 +44,7 @@ class WKHPSwitch(WKHPBaseEntity, SwitchEntity):
         """Turn off the switch."""
         try:
             await self.coordinator.async_write_tag(self.wkhp_tag, False, self)
-            return self.coordinator.data[self.wkhp_tag]["value"]
+            return self.coordinator.data[self.wkhp_tag].value
         except ValueError:
             return "unavailable"
 
@@ -55,8 +55,8 @@ class WKHPSwitch(WKHPBaseEntity, SwitchEntity):
             if self.wkhp_tag in self.coordinator.data:
                 value_and_state = self.coordinator.data[self.wkhp_tag]
                 # _LOGGER.error(f"{self.entity_description.key} -> {value_and_state}")
-                if "value" in value_and_state:
-                    value = value_and_state["value"]
+                if value_and_state is not None:
+                    value = value_and_state.value
                 else:
                     _LOGGER.debug(
                         f"is_on: for {self.entity_description.key} could not read value from data: {value_and_state}")
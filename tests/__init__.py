@@ -0,0 +1 @@
+"""Tests for the waterkotte_heatpump integration."""
@@ -0,0 +1,48 @@
+"""Tests for the register windows & the xml.cgi requests of the EasyconBridge."""
+from custom_components.waterkotte_heatpump.pywaterkotte_ha import (
+    EASYCON_MAX_WINDOW_GAP,
+    EASYCON_MAX_WINDOW_SIZE,
+    EASYCON_MAX_WINDOWS_PER_REQUEST,
+    _plan_easycon_requests,
+    _plan_register_windows,
+)
+
+
+def test_register_windows_single_window():
+    assert _plan_register_windows([1, 2, 5, 10]) == [(1, 10)]
+
+
+def test_register_windows_split_on_gap():
+    indexes = [1, 1 + EASYCON_MAX_WINDOW_GAP, 2 + 2 * EASYCON_MAX_WINDOW_GAP]
+    assert _plan_register_windows(indexes) == [(1, 1 + EASYCON_MAX_WINDOW_GAP), (indexes[2], indexes[2])]
+
+
+def test_register_windows_split_on_size():
+    indexes = list(range(0, EASYCON_MAX_WINDOW_SIZE + 10, 2))
+    windows = _plan_register_windows(indexes)
+    assert len(windows) == 2
+    assert windows[0] == (0, EASYCON_MAX_WINDOW_SIZE - 2)
+    assert windows[1] == (EASYCON_MAX_WINDOW_SIZE, indexes[-1])
+    for start, end in windows:
+        assert end - start < EASYCON_MAX_WINDOW_SIZE
+
+
+def test_register_windows_empty():
+    assert _plan_register_windows([]) == []
+
+
+def test_easycon_requests_group_registers_by_type():
+    requests = _plan_easycon_requests(["A10", "D3", "A2", "I7", "D1", "3:HREG400418"])
+    assert requests == [("D|1|3|A|2|10|I|7|7", ["D1", "D3", "A2", "A10", "I7"])]
+
+
+def test_easycon_requests_split_after_max_windows():
+    # every register is a window of its own (the gap between them is too large)
+    distance = EASYCON_MAX_WINDOW_GAP + 1
+    raw_tags = [f"A{idx * distance}" for idx in range(EASYCON_MAX_WINDOWS_PER_REQUEST + 3)]
+    requests = _plan_easycon_requests(raw_tags)
+
+    assert len(requests) == 2
+    assert requests[0][0].count("|") == 3 * EASYCON_MAX_WINDOWS_PER_REQUEST - 1
+    assert requests[0][1] == raw_tags[:EASYCON_MAX_WINDOWS_PER_REQUEST]
+    assert requests[1][1] == raw_tags[EASYCON_MAX_WINDOWS_PER_REQUEST:]
@@ -0,0 +1,106 @@
+"""Tests for the decoding of the two-register float tags."""
+import asyncio
+import math
+
+import pytest
+
+from custom_components.waterkotte_heatpump.pywaterkotte_ha import EcotouchBridge
+from custom_components.waterkotte_heatpump.pywaterkotte_ha.tags import (
+    WKHPTag,
+    TagValue,
+    FLOAT_PAIR_TAGS,
+    decode_float_pairs
+)
+
+FLOAT_PAIR_TAG = WKHPTag.COMPRESSOR_ELECTRIC_CONSUMPTION_YEAR
+OTHER_FLOAT_PAIR_TAG = WKHPTag.HEATING_ENERGY_PRODUCTION_YEAR
+
+FLOAT_PAIRS = [
+    ["17714", "27838"],
+    ["17714.0", "27838.0"],
+    ["0", "0"],
+    ["-15942", "0"],
+    ["16256", "0"],
+    ["65535", "65535"],
+]
+
+
+def _assert_same_float(value, expected):
+    if math.isnan(expected):
+        assert math.isnan(value)
+    else:
+        assert value == expected
+
+
+def test_float_pair_tags():
+    assert FLOAT_PAIR_TAG in FLOAT_PAIR_TAGS
+    assert OTHER_FLOAT_PAIR_TAG in FLOAT_PAIR_TAGS
+    assert all(a_tag.decode_f == WKHPTag._decode_value_default for a_tag in FLOAT_PAIR_TAGS)
+
+
+@pytest.mark.parametrize("pair", FLOAT_PAIRS, ids=lambda a_pair: "|".join(a_pair))
+def test_decode_float_pairs_equals_single_decode(pair):
+    decoded = decode_float_pairs([pair])
+    assert len(decoded) == 1
+    _assert_same_float(decoded[0], FLOAT_PAIR_TAG.decode_f(FLOAT_PAIR_TAG, pair))
+
+
+def test_decode_float_pairs_keeps_the_order():
+    decoded = decode_float_pairs(FLOAT_PAIRS)
+    assert len(decoded) == len(FLOAT_PAIRS)
+    for a_pair, a_value in zip(FLOAT_PAIRS, decoded):
+        _assert_same_float(a_value, decode_float_pairs([a_pair])[0])
+
+
+def test_decode_float_pairs_empty():
+    assert decode_float_pairs([]) == []
+
+
+def _read(e_values: dict, e_status: dict, tags: list) -> dict:
+    bridge = EcotouchBridge(host="localhost", web_session=None)
+    # no login & no request - the raw values will be provided directly
+    bridge.auth_cookies = {}
+
+    async def _read_tags(*args, **kwargs):
+        return e_values, e_status
+
+    bridge._read_tags = _read_tags
+    return asyncio.run(bridge.read_values(tags))
+
+
+def test_decode_float_pair_values_uses_the_status_of_the_first_register():
+    bridge = EcotouchBridge(host="localhost", web_session=None)
+    pair = FLOAT_PAIRS[0]
+    e_status = {FLOAT_PAIR_TAG.tags[0]: "E_INACTIVE", FLOAT_PAIR_TAG.tags[1]: "S_OK"}
+    result = {}
+    bridge._decode_float_pair_values([FLOAT_PAIR_TAG], [pair], e_status, result)
+    assert result == {FLOAT_PAIR_TAG: bridge._decode_values(FLOAT_PAIR_TAG, pair, ["E_INACTIVE", "S_OK"])}
+    assert result[FLOAT_PAIR_TAG].status == "E_INACTIVE"
+
+
+def test_decode_float_pair_values_skips_only_invalid_values():
+    bridge = EcotouchBridge(host="localhost", web_session=None)
+    e_status = {a_raw_tag: "S_OK" for a_raw_tag in FLOAT_PAIR_TAG.tags + OTHER_FLOAT_PAIR_TAG.tags}
+    result = {}
+    bridge._decode_float_pair_values([FLOAT_PAIR_TAG, OTHER_FLOAT_PAIR_TAG], [["abc", "0"], FLOAT_PAIRS[0]],
+                                     e_status, result)
+    assert result == {
+        OTHER_FLOAT_PAIR_TAG: TagValue(OTHER_FLOAT_PAIR_TAG.decode_f(OTHER_FLOAT_PAIR_TAG, FLOAT_PAIRS[0]), "S_OK")
+    }
+
+
+def test_read_values_with_missing_register():
+    high, low = FLOAT_PAIR_TAG.tags
+    other_high, other_low = OTHER_FLOAT_PAIR_TAG.tags
+    e_values = {high: "17714", other_high: "17714", other_low: "27838"}
+    e_status = {high: "S_OK", other_high: "S_OK", other_low: "S_OK"}
+    result = _read(e_values, e_status, [FLOAT_PAIR_TAG, OTHER_FLOAT_PAIR_TAG])
+    assert FLOAT_PAIR_TAG not in result
+    assert result[OTHER_FLOAT_PAIR_TAG] == TagValue(
+        OTHER_FLOAT_PAIR_TAG.decode_f(OTHER_FLOAT_PAIR_TAG, ["17714", "27838"]), "S_OK")
+
+
+def test_read_values_with_not_found_register():
+    high, low = FLOAT_PAIR_TAG.tags
+    result = _read({high: None, low: None}, {high: "E_NOTFOUND", low: "E_NOTFOUND"}, [FLOAT_PAIR_TAG])
+    assert result == {FLOAT_PAIR_TAG: TagValue(None, "E_NOTFOUND")}
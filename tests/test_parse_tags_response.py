@@ -0,0 +1,44 @@
+"""Tests for the single pass parsing of the readTags/writeTags responses of the EcotouchBridge."""
+from custom_components.waterkotte_heatpump.pywaterkotte_ha import EcotouchBridge
+
+
+def _parse(content: str, tags: list, is_read: bool = True):
+    bridge = EcotouchBridge(host="localhost", web_session=None)
+    results = {}
+    results_status = {}
+    bridge._parse_tags_response(content=content, tags=tags, results=results, results_status=results_status,
+                                is_read=is_read)
+    return bridge, results, results_status
+
+
+def test_values_and_status():
+    content = "#A1\tS_OK\n192\t84\n#I52\tS_OK\r\n192\t-12\r\n#D3\tS_OK\n192\t1\n"
+    _, results, results_status = _parse(content, ["A1", "I52", "D3"])
+    assert results == {"A1": "84", "I52": "-12", "D3": "1"}
+    assert results_status == {"A1": "S_OK", "I52": "S_OK", "D3": "S_OK"}
+
+
+def test_records_without_value_line():
+    content = "#A1\tE_INACTIVETAG\n#A2\tS_OK\n192\t17.5\n#I3\tE_NOTFOUND\n"
+    _, results, results_status = _parse(content, ["A1", "A2", "I3", "D4"], is_read=False)
+    assert results == {"A1": None, "A2": "17.5", "I3": None, "D4": None}
+    assert results_status == {"A1": "E_INACTIVE", "A2": "S_OK", "I3": "E_NOTFOUND", "D4": "E_NOTFOUND"}
+
+
+def test_first_record_of_a_tag_wins():
+    content = "#A1\tS_OK\n192\t1\n#A1\tS_OK\n192\t2\n"
+    _, results, _ = _parse(content, ["A1"])
+    assert results == {"A1": "1"}
+
+
+def test_value_without_number():
+    _, results, results_status = _parse("#A1\tS_OK\n192\tabc\n", ["A1"])
+    assert results == {"A1": None}
+    assert results_status == {"A1": "S_OK"}
+
+
+def test_unknown_alarm_bits_register_will_not_be_requested_again():
+    bridge, results, results_status = _parse("#I52\tS_OK\n192\t0\n", ["I52", "I2614"])
+    assert results["I2614"] is None
+    assert results_status["I2614"] == "E_NOTFOUND"
+    assert "I2614" in bridge._unknown_raw_tags